@@ -65,54 +65,52 @@ async def main() -> None:
     for measure in schema_info["measures"]:
         print(f"  {measure['qualified_name']}: {measure.get('description', '')}")
 
-    # Query 1: Total sales by country
-    print("\n--- Query 1: Sales by Country ---")
-    request = {
-        "flow": "sales",
-        "dimensions": ["c.country"],
-        "measures": ["o.order_total", "o.order_count"],
-        "order": [{"column": "o.order_total", "direction": "desc"}],
-    }
-    sql = await handle.build_sql(request)
-    print(f"SQL:\n{sql}\n")
-
-    rows = await handle.execute(request)
-    print("Results:")
-    for row in rows:
-        print(f"  {row}")
-
-    # Query 2: Filter by country
-    print("\n--- Query 2: US Sales Only ---")
-    request = {
-        "flow": "sales",
-        "dimensions": ["c.country"],
-        "measures": ["o.order_total", "c.customer_count"],
-        "filters": [{"field": "c.country", "op": "==", "value": "US"}],
-    }
-    sql = await handle.build_sql(request)
-    print(f"SQL:\n{sql}\n")
-
-    rows = await handle.execute(request)
-    print("Results:")
-    for row in rows:
-        print(f"  {row}")
-
-    # Query 3: Derived measure (average order amount)
-    print("\n--- Query 3: Average Order Amount by Country ---")
-    request = {
-        "flow": "sales",
-        "dimensions": ["c.country"],
-        "measures": ["o.order_total", "o.order_count", "o.avg_order_amount"],
-        "order": [{"column": "o.avg_order_amount", "direction": "desc"}],
-    }
-    sql = await handle.build_sql(request)
-    print(f"SQL:\n{sql}\n")
-
-    rows = await handle.execute(request)
-    print("Results:")
-    for row in rows:
-        print(f"  {row}")
+    queries = [
+        (
+            "Query 1: Sales by Country",
+            {
+                "flow": "sales",
+                "dimensions": ["c.country"],
+                "measures": ["o.order_total", "o.order_count"],
+                "order": [{"column": "o.order_total", "direction": "desc"}],
+            },
+        ),
+        (
+            "Query 2: US Sales Only",
+            {
+                "flow": "sales",
+                "dimensions": ["c.country"],
+                "measures": ["o.order_total", "c.customer_count"],
+                "filters": [{"field": "c.country", "op": "==", "value": "US"}],
+            },
+        ),
+        (
+            # Derived measure (average order amount)
+            "Query 3: Average Order Amount by Country",
+            {
+                "flow": "sales",
+                "dimensions": ["c.country"],
+                "measures": ["o.order_total", "o.order_count", "o.avg_order_amount"],
+                "order": [{"column": "o.avg_order_amount", "direction": "desc"}],
+            },
+        ),
+    ]
+    # The queries are independent, so run them concurrently: each BigQuery job
+    # pays a round-trip of about a second, and gather overlaps those waits.
+    results = await asyncio.gather(
+        *(handle.execute_arrow_with_sql(request) for _, request in queries)
+    )
+    for (title, _), (sql, table) in zip(queries, results):
+        print(f"\n--- {title} ---")
+        print(f"SQL:\n{sql}\n")
+        print("Results:")
+        print(table.to_string(preview_cols=table.num_columns))
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:  # optional; not available on Windows
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -7,107 +7,115 @@ Usage:
 
 import asyncio
 import time
+from array import array
+from datetime import datetime
 from pathlib import Path
-
-import duckdb
-
-from semaflow import DataSource, FlowHandle
-
-
-def seed_duckdb(db_path: Path) -> None:
-    if db_path.exists():
-        db_path.unlink()
-    conn = duckdb.connect(str(db_path))
-    conn.execute("""
-        CREATE TABLE customers (
-            id INTEGER PRIMARY KEY,
-            name VARCHAR,
-            country VARCHAR
-        );
-        CREATE TABLE orders (
-            id INTEGER PRIMARY KEY,
-            customer_id INTEGER,
-            amount DOUBLE,
-            created_at TIMESTAMP
-        );
-        INSERT INTO customers VALUES
-            (1, 'Alice', 'US'),
-            (2, 'Bob', 'UK'),
-            (3, 'Carla', 'US'),
-            (4, 'David', 'DE');
-        INSERT INTO orders VALUES
-            (1, 1, 100.0, '2024-01-01'),
-            (2, 1, 50.0, '2024-01-02'),
-            (3, 2, 25.0, '2024-01-03'),
-            (4, 3, 200.0, '2024-01-04'),
-            (5, 3, 75.0, '2024-01-05');
-    """)
-    conn.close()
-
-
-async def run_query(handle: FlowHandle, query_id: int) -> tuple[int, float, list[dict]]:
-    """Run a single query and return (id, duration, result)."""
-    start = time.perf_counter()
-
-    requests = [
+from statistics import fmean
+
+import pyarrow as pa
+
+from semaflow import DataSource, FlowHandle, PreparedFlow
+
+
+def seed_memory_source(name: str) -> DataSource:
+    """Create an in-memory DuckDB data source seeded with the benchmark tables.
+
+    Keeping the tiny fact tables in memory keeps file and WAL I/O out of the
+    measured path.
+    """
+    ds = DataSource.duckdb(":memory:", name=name)
+    customers = pa.table({
+        "id": pa.array([1, 2, 3, 4], pa.int32()),
+        "name": ["Alice", "Bob", "Carla", "David"],
+        "country": ["US", "UK", "US", "DE"],
+    })
+    orders = pa.table({
+        "id": pa.array([1, 2, 3, 4, 5], pa.int32()),
+        "customer_id": pa.array([1, 1, 2, 3, 3], pa.int32()),
+        "amount": [100.0, 50.0, 25.0, 200.0, 75.0],
+        "created_at": pa.array([datetime(2024, 1, d) for d in range(1, 6)], pa.timestamp("us")),
+    })
+    ds.register_dataframe("customers", customers.to_reader())
+    ds.register_dataframe("orders", orders.to_reader())
+    return ds
+
+
+# (request template, filter bindings) pairs that run_query cycles through.
+_REQUEST_TEMPLATES = (
+    (
         {
             "flow": "sales",
             "dimensions": ["c.country"],
             "measures": ["o.order_total", "o.order_count", "c.customer_count"],
         },
+        None,
+    ),
+    (
         {
             "flow": "sales",
             "dimensions": ["c.country"],
             "measures": ["o.order_total"],
             "filters": [{"field": "c.country", "op": "==", "value": "US"}],
         },
+        {"c.country": "US"},
+    ),
+    (
         {
             "flow": "sales",
             "measures": ["o.order_total", "o.order_count", "o.avg_order_amount"],
         },
-    ]
+        None,
+    ),
+)
+_NREQ = len(_REQUEST_TEMPLATES)
 
-    request = requests[query_id % len(requests)]
-    rows = await handle.execute(request)
+Queries = tuple[tuple[PreparedFlow, dict | None], ...]
 
-    duration = time.perf_counter() - start
-    return query_id, duration, rows
 
+def prepare_queries(handle: FlowHandle) -> Queries:
+    """Prepare the benchmark request templates once, paired with their bindings."""
+    return tuple((handle.prepare(template), params) for template, params in _REQUEST_TEMPLATES)
 
-async def benchmark(concurrency: int, total_queries: int) -> dict:
-    """Run benchmark with specified concurrency level."""
-    example_dir = Path(__file__).parent
-    flow_dir = example_dir / "flows"
-    db_path = example_dir / "bench.duckdb"
 
-    seed_duckdb(db_path)
+async def run_query(queries: Queries, query_id: int, durations: array) -> None:
+    """Run a single query and record its latency in ``durations[query_id]``."""
+    start = time.perf_counter()
 
-    ds = DataSource.duckdb(str(db_path), name="duckdb_local")
-    handle = FlowHandle.from_dir(flow_dir, [ds])
+    prepared, params = queries[query_id % _NREQ]
+    await prepared.execute(params)
+
+    durations[query_id] = time.perf_counter() - start
 
+
+async def benchmark(queries: Queries, concurrency: int, total_queries: int) -> dict:
+    """Run benchmark with specified concurrency level."""
     # Warm up
+    warmup = array("d", [0.0]) * 3
     for i in range(3):
-        await run_query(handle, i)
+        await run_query(queries, i, warmup)
 
-    # Run concurrent queries
-    start = time.perf_counter()
+    # Run concurrent queries through a bounded pool: a finished query frees its
+    # slot immediately instead of waiting for the rest of a fixed batch.
+    sem = asyncio.Semaphore(concurrency)
+    durations = array("d", [0.0]) * total_queries
 
-    results = []
-    for batch_start in range(0, total_queries, concurrency):
-        batch_end = min(batch_start + concurrency, total_queries)
-        tasks = [run_query(handle, i) for i in range(batch_start, batch_end)]
-        batch_results = await asyncio.gather(*tasks)
-        results.extend(batch_results)
+    async def bounded(query_id: int) -> None:
+        async with sem:
+            await run_query(queries, query_id, durations)
+
+    start = time.perf_counter()
+    async with asyncio.TaskGroup() as tg:
+        for i in range(total_queries):
+            tg.create_task(bounded(i))
 
     total_time = time.perf_counter() - start
 
-    durations = [r[1] for r in results]
     return {
         "concurrency": concurrency,
         "total_queries": total_queries,
         "total_time": total_time,
         "queries_per_sec": total_queries / total_time,
-        "avg_latency_ms": (sum(durations) / len(durations)) * 1000,
+        "avg_latency_ms": fmean(durations) * 1000,
         "min_latency_ms": min(durations) * 1000,
         "max_latency_ms": max(durations) * 1000,
     }
@@ -118,6 +126,16 @@ async def main():
     print("=" * 50)
     print()
 
+    # Build the handle once so every config reuses its connections and prepared SQL.
+    example_dir = Path(__file__).parent
+    flow_dir = example_dir / "flows"
+    ds = await asyncio.to_thread(seed_memory_source, "duckdb_local")
+    handle = FlowHandle.from_dir(flow_dir, [ds])
+    queries = prepare_queries(handle)
+    # Compile every template binding up front so no config pays first-call planning.
+    for prepared, params in queries:
+        await prepared.warmup(params)
+
     configs = [
         (1, 20),
         (5, 50),
@@ -129,7 +147,7 @@ async def main():
     for concurrency, total in configs:
         print(f"Running: {total} queries @ {concurrency} concurrent...")
         try:
-            result = await benchmark(concurrency, total)
+            result = await benchmark(queries, concurrency, total)
             print(f"  Total time:     {result['total_time']:.2f}s")
             print(f"  Queries/sec:    {result['queries_per_sec']:.1f}")
             print(f"  Avg latency:    {result['avg_latency_ms']:.1f}ms")
@@ -142,4 +160,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:  # optional; not available on Windows
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
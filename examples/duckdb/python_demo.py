@@ -10,105 +10,63 @@ Steps:
 """
 
 import asyncio
+import sys
 from pathlib import Path
 
-import duckdb
-
+# Script-only import: run this file directly so its directory is on sys.path.
+from _seed import seed_duckdb
 from semaflow import DataSource, FlowHandle
 
 
-def seed_duckdb(db_path: Path) -> None:
-    if db_path.exists():
-        db_path.unlink()
-    conn = duckdb.connect(str(db_path))
-    conn.execute(
-        """
-        CREATE TABLE customers (
-            id INTEGER PRIMARY KEY,
-            name VARCHAR,
-            country VARCHAR
-        );
-        CREATE TABLE orders (
-            id INTEGER PRIMARY KEY,
-            customer_id INTEGER,
-            amount DOUBLE,
-            created_at TIMESTAMP
-        );
-        INSERT INTO customers VALUES
-            (1, 'Alice', 'US'),
-            (2, 'Bob', 'UK'),
-            (3, 'Carla', 'US');
-        INSERT INTO orders VALUES
-            (1, 1, 100.0, '2023-01-01'),
-            (2, 1, 50.0, '2023-01-02'),
-            (3, 2, 25.0, '2023-01-03');
-        """
-    )
-    conn.close()
-
-
 async def main() -> None:
     project_root = Path(__file__).resolve().parents[1]
     flow_root = project_root / "examples" / "flows"
     db_path = project_root / "examples" / "demo_python.duckdb"
 
-    seed_duckdb(db_path)
+    await asyncio.to_thread(seed_duckdb, db_path)
 
     flow = FlowHandle.from_dir(flow_root, [DataSource.duckdb(str(db_path), name="duckdb_local")])
 
-    print("Flows:")
-    for m in flow.list_flows():
-        print(f"- {m.get('name')} ({m.get('description', '')})")
-    print()
+    out = ["Flows:"]
+    out += [f"- {m.get('name')} ({m.get('description', '')})" for m in flow.list_flows()]
+    out.append("")
 
     schema = flow.get_flow("sales")
-    print("Sales flow dimensions (qualified):")
-    for d in schema["dimensions"]:
-        print(f"- {d['qualified_name']}: {d.get('description', '')}")
-    print("Sales flow measures (qualified):")
-    for m in schema["measures"]:
-        print(f"- {m['qualified_name']}: {m.get('description', '')}")
-    print(f"time_dimension: {schema.get('time_dimension')}")
-    print()
-
-    request = {
-        "flow": "sales",
-        "dimensions": ["c.country"],
-        "measures": ["o.order_total", "o.order_count", "o.us_order_total", "o.avg_order_amount", "c.customer_count"],
-        "filters": [],
-        "order": [{"column": "o.order_total", "direction": "desc"}],
-        "limit": 10,
-    }
-
-    sql = await flow.build_sql(request)
-    print("SQL:")
-    print(sql)
-    print()
-
-    rows = await flow.execute(request)
-    print("Results:")
-    for row in rows:
-        print(row)
-
-    request = {
-        "flow": "sales",
-        "dimensions": ["c.country"],
-        "measures": ["o.order_total", "c.customer_count"],
-        "filters": [{"field": "c.country", "op": "==", "value": "US"}],
-        "order": [{"column": "o.order_total", "direction": "desc"}],
-        "limit": 10,
-    }
-
-    sql = await flow.build_sql(request)
-    print("SQL:")
-    print(sql)
-    print()
-
-    rows = await flow.execute(request)
-    print("Results:")
-    for row in rows:
-        print(row)
+    out.append("Sales flow dimensions (qualified):")
+    out += [f"- {d['qualified_name']}: {d.get('description', '')}" for d in schema["dimensions"]]
+    out.append("Sales flow measures (qualified):")
+    out += [f"- {m['qualified_name']}: {m.get('description', '')}" for m in schema["measures"]]
+    out.append(f"time_dimension: {schema.get('time_dimension')}")
+    sys.stdout.write("\n".join(out) + "\n")
+
+    requests = [
+        {
+            "flow": "sales",
+            "dimensions": ["c.country"],
+            "measures": ["o.order_total", "o.order_count", "o.us_order_total", "o.avg_order_amount", "c.customer_count"],
+            "filters": [],
+            "order": [{"column": "o.order_total", "direction": "desc"}],
+            "limit": 10,
+        },
+        {
+            "flow": "sales",
+            "dimensions": ["c.country"],
+            "measures": ["o.order_total", "c.customer_count"],
+            "filters": [{"field": "c.country", "op": "==", "value": "US"}],
+            "order": [{"column": "o.order_total", "direction": "desc"}],
+            "limit": 10,
+        },
+    ]
+    results = await asyncio.gather(*(flow.execute_arrow_with_sql(request) for request in requests))
+    for sql, table in results:
+        out = ["", "SQL:", sql, "", "Results:", table.to_string(preview_cols=table.num_columns)]
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:  # optional; not available on Windows
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
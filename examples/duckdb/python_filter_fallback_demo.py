@@ -3,53 +3,28 @@ Demonstrate measure filter rendering with and without FILTER support.
 
 By default DuckDB supports FILTER (WHERE ...), but you can force the portable
 CASE-wrapped form by setting the env var SEMAFLOW_DISABLE_FILTERED_AGG=1.
+The setting is read once per process, so the fallback SQL is built in a
+child process started with the variable set.
 """
 
 import asyncio
 import os
+import sys
 from pathlib import Path
 
-import duckdb
-
+# Script-only import: run this file directly so its directory is on sys.path.
+from _seed import seed_duckdb
 from semaflow import DataSource, FlowHandle
 
-
-def seed_duckdb(db_path: Path) -> None:
-    if db_path.exists():
-        db_path.unlink()
-    conn = duckdb.connect(str(db_path))
-    conn.execute(
-        """
-        CREATE TABLE customers (
-            id INTEGER PRIMARY KEY,
-            name VARCHAR,
-            country VARCHAR
-        );
-        CREATE TABLE orders (
-            id INTEGER PRIMARY KEY,
-            customer_id INTEGER,
-            amount DOUBLE,
-            created_at TIMESTAMP
-        );
-        INSERT INTO customers VALUES
-            (1, 'Alice', 'US'),
-            (2, 'Bob', 'UK'),
-            (3, 'Carla', 'US');
-        INSERT INTO orders VALUES
-            (1, 1, 100.0, '2023-01-01'),
-            (2, 1, 50.0, '2023-01-02'),
-            (3, 2, 25.0, '2023-01-03');
-        """
-    )
-    conn.close()
+FALLBACK_FLAG = "--fallback"
 
 
-async def main() -> None:
+async def build_demo_sql() -> str:
     project_root = Path(__file__).resolve().parents[1]
     flow_root = project_root / "examples" / "flows"
     db_path = project_root / "examples" / "demo_python.duckdb"
 
-    seed_duckdb(db_path)
+    await asyncio.to_thread(seed_duckdb, db_path)
 
     flow = FlowHandle.from_dir(flow_root, [DataSource.duckdb(str(db_path), name="duckdb_local")])
 
@@ -61,19 +36,36 @@ async def main() -> None:
         "order": [],
         "limit": None,
     }
+    return await flow.build_sql(request)
 
-    sql = await flow.build_sql(request)
+
+async def main() -> None:
+    if FALLBACK_FLAG in sys.argv:
+        print(await build_demo_sql())
+        return
+
+    sql = await build_demo_sql()
     print("Default (FILTER supported):")
     print(sql)
     print()
 
-    os.environ["SEMAFLOW_DISABLE_FILTERED_AGG"] = "1"
-    sql_fallback = await flow.build_sql(request)
+    child = await asyncio.create_subprocess_exec(
+        sys.executable,
+        __file__,
+        FALLBACK_FLAG,
+        env={**os.environ, "SEMAFLOW_DISABLE_FILTERED_AGG": "1"},
+        stdout=asyncio.subprocess.PIPE,
+    )
+    sql_fallback, _ = await child.communicate()
     print("Forced fallback (CASE-wrapped aggregate):")
-    print(sql_fallback)
+    print(sql_fallback.decode().strip())
     print()
-    os.environ.pop("SEMAFLOW_DISABLE_FILTERED_AGG", None)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:  # optional; not available on Windows
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
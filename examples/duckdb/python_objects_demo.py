@@ -10,8 +10,8 @@ Steps:
 import asyncio
 from pathlib import Path
 
-import duckdb
-
+# Script-only import: run this file directly so its directory is on sys.path.
+from _seed import seed_duckdb
 from semaflow import (
     DataSource,
     Dimension,
@@ -24,40 +24,10 @@ from semaflow import (
 )
 
 
-def seed_duckdb(db_path: Path) -> None:
-    if db_path.exists():
-        db_path.unlink()
-    conn = duckdb.connect(str(db_path))
-    conn.execute(
-        """
-        CREATE TABLE customers (
-            id INTEGER PRIMARY KEY,
-            name VARCHAR,
-            country VARCHAR
-        );
-        CREATE TABLE orders (
-            id INTEGER PRIMARY KEY,
-            customer_id INTEGER,
-            amount DOUBLE,
-            created_at TIMESTAMP
-        );
-        INSERT INTO customers VALUES
-            (1, 'Alice', 'US'),
-            (2, 'Bob', 'UK'),
-            (3, 'Carla', 'US');
-        INSERT INTO orders VALUES
-            (1, 1, 100.0, '2023-01-01'),
-            (2, 1, 50.0, '2023-01-02'),
-            (3, 2, 25.0, '2023-01-03');
-        """
-    )
-    conn.close()
-
-
 async def main() -> None:
     project_root = Path(__file__).resolve().parents[1]
     db_path = project_root / "examples" / "demo_python.duckdb"
-    seed_duckdb(db_path)
+    await asyncio.to_thread(seed_duckdb, db_path)
 
     ds = DataSource.duckdb(str(db_path), name="duckdb_local")
 
@@ -143,16 +113,20 @@ async def main() -> None:
         "limit": 10,
     }
 
-    sql = await flow.build_sql(request)
+    sql, rows = await flow.execute_with_sql(request)
     print("SQL:")
     print(sql)
     print()
 
-    rows = await flow.execute(request)
     print("Results:")
     for row in rows:
         print(row)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:  # optional; not available on Windows
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -6,49 +6,20 @@ joined customers table triggers the new pre-aggregation + EXISTS plan.
 """
 
 import asyncio
+import sys
 from pathlib import Path
 
-import duckdb
-
+# Script-only import: run this file directly so its directory is on sys.path.
+from _seed import seed_duckdb
 from semaflow import DataSource, FlowHandle
 
 
-def seed_duckdb(db_path: Path) -> None:
-    if db_path.exists():
-        db_path.unlink()
-    conn = duckdb.connect(str(db_path))
-    conn.execute(
-        """
-        CREATE TABLE customers (
-            id INTEGER PRIMARY KEY,
-            name VARCHAR,
-            country VARCHAR
-        );
-        CREATE TABLE orders (
-            id INTEGER PRIMARY KEY,
-            customer_id INTEGER,
-            amount DOUBLE,
-            created_at TIMESTAMP
-        );
-        INSERT INTO customers VALUES
-            (1, 'Alice', 'US'),
-            (2, 'Bob', 'UK'),
-            (3, 'Carla', 'US');
-        INSERT INTO orders VALUES
-            (1, 1, 100.0, '2023-01-01'),
-            (2, 1, 50.0, '2023-01-02'),
-            (3, 2, 25.0, '2023-01-03');
-        """
-    )
-    conn.close()
-
-
 async def main() -> None:
     project_root = Path(__file__).resolve().parents[1]
     flow_root = project_root / "examples" / "flows"
     db_path = project_root / "examples" / "demo_python.duckdb"
 
-    seed_duckdb(db_path)
+    await asyncio.to_thread(seed_duckdb, db_path)
 
     flow = FlowHandle.from_dir(flow_root, [DataSource.duckdb(str(db_path), name="duckdb_local")])
 
@@ -70,21 +41,27 @@ async def main() -> None:
         "limit": 10,
     }
 
-    print("Flat path (no join filters):")
-    flat_sql = await flow.build_sql(flat_request)
-    print(flat_sql)
-    print()
-    flat_rows = await flow.execute(flat_request)
-    print("Rows:", flat_rows)
-    print("\n----\n")
-
-    print("Pre-aggregated path (join-dimension filter triggers EXISTS + derived table):")
-    preagg_sql = await flow.build_sql(preagg_request)
-    print(preagg_sql)
-    print()
-    preagg_rows = await flow.execute(preagg_request)
-    print("Rows:", preagg_rows)
-
+    (flat_sql, flat_rows), (preagg_sql, preagg_rows) = await asyncio.gather(
+        flow.execute_with_sql(flat_request),
+        flow.execute_with_sql(preagg_request),
+    )
+    out = [
+        "Flat path (no join filters):",
+        flat_sql,
+        "",
+        f"Rows: {flat_rows}",
+        "\n----\n",
+        "Pre-aggregated path (join-dimension filter triggers EXISTS + derived table):",
+        preagg_sql,
+        "",
+        f"Rows: {preagg_rows}",
+    ]
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:  # optional; not available on Windows
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -9,9 +9,11 @@ Usage:
 import asyncio
 import os
 import time
+from array import array
 from pathlib import Path
+from statistics import fmean
 
-from semaflow import DataSource, FlowHandle
+from semaflow import DataSource, FlowHandle, PreparedFlow
 
 
 def get_connection_string() -> str:
@@ -23,72 +25,82 @@ def get_connection_string() -> str:
     return f"postgresql://{user}:{password}@{host}:{port}/{database}"
 
 
-async def run_query(handle: FlowHandle, query_id: int) -> tuple[int, float, dict]:
-    """Run a single query and return (id, duration, result)."""
-    start = time.perf_counter()
-
-    # Vary the queries slightly
-    requests = [
+# (request template, filter bindings) pairs that run_query cycles through.
+_REQUEST_TEMPLATES = (
+    (
         {
             "flow": "sales",
             "dimensions": ["c.country"],
             "measures": ["o.order_total", "o.order_count"],
         },
+        None,
+    ),
+    (
         {
             "flow": "sales",
             "dimensions": ["c.country"],
             "measures": ["o.order_total"],
             "filters": [{"field": "c.country", "op": "==", "value": "US"}],
         },
+        {"c.country": "US"},
+    ),
+    (
         {
             "flow": "sales",
             "measures": ["o.order_total", "o.order_count", "o.avg_order_amount"],
         },
-    ]
+        None,
+    ),
+)
+_NREQ = len(_REQUEST_TEMPLATES)
 
-    request = requests[query_id % len(requests)]
-    rows = await handle.execute(request)
+Queries = tuple[tuple[PreparedFlow, dict | None], ...]
 
-    duration = time.perf_counter() - start
-    return query_id, duration, rows
 
+def prepare_queries(handle: FlowHandle) -> Queries:
+    """Prepare the benchmark request templates once, paired with their bindings."""
+    return tuple((handle.prepare(template), params) for template, params in _REQUEST_TEMPLATES)
 
-async def benchmark(concurrency: int, total_queries: int) -> dict:
-    """Run benchmark with specified concurrency level."""
-    example_dir = Path(__file__).parent
-    flow_dir = example_dir / "flows"
 
-    ds = DataSource.postgres(
-        get_connection_string(),
-        schema="public",
-        name="pg_local",
-    )
-    handle = FlowHandle.from_dir(str(flow_dir), [ds])
+async def run_query(queries: Queries, query_id: int, durations: array) -> None:
+    """Run a single query and record its latency in ``durations[query_id]``."""
+    start = time.perf_counter()
+
+    prepared, params = queries[query_id % _NREQ]
+    await prepared.execute(params)
+
+    durations[query_id] = time.perf_counter() - start
 
+
+async def benchmark(queries: Queries, concurrency: int, total_queries: int) -> dict:
+    """Run benchmark with specified concurrency level."""
     # Warm up - run a few queries first
+    warmup = array("d", [0.0]) * 3
     for i in range(3):
-        await run_query(handle, i)
+        await run_query(queries, i, warmup)
 
-    # Run concurrent queries
-    start = time.perf_counter()
+    # Run concurrent queries through a bounded pool: a finished query frees its
+    # slot immediately instead of waiting for the rest of a fixed batch.
+    sem = asyncio.Semaphore(concurrency)
+    durations = array("d", [0.0]) * total_queries
+
+    async def bounded(query_id: int) -> None:
+        async with sem:
+            await run_query(queries, query_id, durations)
 
-    # Create batches to avoid overwhelming
-    results = []
-    for batch_start in range(0, total_queries, concurrency):
-        batch_end = min(batch_start + concurrency, total_queries)
-        tasks = [run_query(handle, i) for i in range(batch_start, batch_end)]
-        batch_results = await asyncio.gather(*tasks)
-        results.extend(batch_results)
+    start = time.perf_counter()
+    async with asyncio.TaskGroup() as tg:
+        for i in range(total_queries):
+            tg.create_task(bounded(i))
 
     total_time = time.perf_counter() - start
 
-    durations = [r[1] for r in results]
     return {
         "concurrency": concurrency,
         "total_queries": total_queries,
         "total_time": total_time,
         "queries_per_sec": total_queries / total_time,
-        "avg_latency_ms": (sum(durations) / len(durations)) * 1000,
+        "avg_latency_ms": fmean(durations) * 1000,
         "min_latency_ms": min(durations) * 1000,
         "max_latency_ms": max(durations) * 1000,
     }
@@ -99,6 +111,21 @@ async def main():
     print("=" * 50)
     print()
 
+    # Build the handle once so every config reuses its connections and prepared SQL.
+    example_dir = Path(__file__).parent
+    flow_dir = example_dir / "flows"
+
+    ds = DataSource.postgres(
+        get_connection_string(),
+        schema="public",
+        name="pg_local",
+    )
+    handle = FlowHandle.from_dir(str(flow_dir), [ds])
+    queries = prepare_queries(handle)
+    # Compile every template binding up front so no config pays first-call planning.
+    for prepared, params in queries:
+        await prepared.warmup(params)
+
     # Test different concurrency levels
     configs = [
         (1, 20),    # Sequential baseline
@@ -111,7 +138,7 @@ async def main():
     for concurrency, total in configs:
         print(f"Running: {total} queries @ {concurrency} concurrent...")
         try:
-            result = await benchmark(concurrency, total)
+            result = await benchmark(queries, concurrency, total)
             print(f"  Total time:     {result['total_time']:.2f}s")
             print(f"  Queries/sec:    {result['queries_per_sec']:.1f}")
             print(f"  Avg latency:    {result['avg_latency_ms']:.1f}ms")
@@ -124,4 +151,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:  # optional; not available on Windows
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
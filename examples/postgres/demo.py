@@ -20,6 +20,7 @@ Environment Variables (optional - defaults match docker-compose.yml):
 
 import asyncio
 import os
+import sys
 from pathlib import Path
 
 from semaflow import DataSource, FlowHandle
@@ -81,68 +82,61 @@ async def main() -> None:
     handle = FlowHandle.from_dir(str(flow_dir), [ds])
 
     # List available flows
-    print("\n--- Available Flows ---")
-    for flow in handle.list_flows():
-        print(f"  {flow['name']}: {flow.get('description', 'No description')}")
+    out = ["\n--- Available Flows ---"]
+    out += [f"  {flow['name']}: {flow.get('description', 'No description')}" for flow in handle.list_flows()]
 
     # Show schema for sales flow
     schema_info = handle.get_flow("sales")
-    print("\n--- Sales Flow Schema ---")
-    print("Dimensions:")
-    for dim in schema_info["dimensions"]:
-        print(f"  {dim['qualified_name']}: {dim.get('description', '')}")
-    print("Measures:")
-    for measure in schema_info["measures"]:
-        print(f"  {measure['qualified_name']}: {measure.get('description', '')}")
-
-    # Query 1: Total sales by country
-    print("\n--- Query 1: Sales by Country ---")
-    request = {
-        "flow": "sales",
-        "dimensions": ["c.country"],
-        "measures": ["o.order_total", "o.order_count"],
-        "order": [{"column": "o.order_total", "direction": "desc"}],
-    }
-    sql = await handle.build_sql(request)
-    print(f"SQL:\n{sql}\n")
-
-    rows = await handle.execute(request)
-    print("Results:")
-    for row in rows:
-        print(f"  {row}")
-
-    # Query 2: Filter by country
-    print("\n--- Query 2: US Sales Only ---")
-    request = {
-        "flow": "sales",
-        "dimensions": ["c.country"],
-        "measures": ["o.order_total", "c.customer_count"],
-        "filters": [{"field": "c.country", "op": "==", "value": "US"}],
-    }
-    sql = await handle.build_sql(request)
-    print(f"SQL:\n{sql}\n")
-
-    rows = await handle.execute(request)
-    print("Results:")
-    for row in rows:
-        print(f"  {row}")
-
-    # Query 3: Derived measure (average order amount)
-    print("\n--- Query 3: Average Order Amount by Country ---")
-    request = {
-        "flow": "sales",
-        "dimensions": ["c.country"],
-        "measures": ["o.order_total", "o.order_count", "o.avg_order_amount"],
-        "order": [{"column": "o.avg_order_amount", "direction": "desc"}],
-    }
-    sql = await handle.build_sql(request)
-    print(f"SQL:\n{sql}\n")
-
-    rows = await handle.execute(request)
-    print("Results:")
-    for row in rows:
-        print(f"  {row}")
+    out.append("\n--- Sales Flow Schema ---")
+    out.append("Dimensions:")
+    out += [f"  {dim['qualified_name']}: {dim.get('description', '')}" for dim in schema_info["dimensions"]]
+    out.append("Measures:")
+    out += [f"  {m['qualified_name']}: {m.get('description', '')}" for m in schema_info["measures"]]
+    sys.stdout.write("\n".join(out) + "\n")
+
+    queries = [
+        (
+            "Query 1: Sales by Country",
+            {
+                "flow": "sales",
+                "dimensions": ["c.country"],
+                "measures": ["o.order_total", "o.order_count"],
+                "order": [{"column": "o.order_total", "direction": "desc"}],
+            },
+        ),
+        (
+            "Query 2: US Sales Only",
+            {
+                "flow": "sales",
+                "dimensions": ["c.country"],
+                "measures": ["o.order_total", "c.customer_count"],
+                "filters": [{"field": "c.country", "op": "==", "value": "US"}],
+            },
+        ),
+        (
+            # Derived measure (average order amount)
+            "Query 3: Average Order Amount by Country",
+            {
+                "flow": "sales",
+                "dimensions": ["c.country"],
+                "measures": ["o.order_total", "o.order_count", "o.avg_order_amount"],
+                "order": [{"column": "o.avg_order_amount", "direction": "desc"}],
+            },
+        ),
+    ]
+    # Independent queries: overlap their round-trips instead of awaiting each in turn.
+    results = await asyncio.gather(
+        *(handle.execute_arrow_with_sql(request) for _, request in queries)
+    )
+    for (title, _), (sql, table) in zip(queries, results):
+        out = [f"\n--- {title} ---", f"SQL:\n{sql}\n", "Results:", table.to_string(preview_cols=table.num_columns)]
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:  # optional; not available on Windows
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -21,6 +21,8 @@ Usage:
 
 Environment Variables:
     SEMAFLOW_BACKEND        - "duckdb" (default), "postgres", or "bigquery"
+    SEMAFLOW_WORKERS        - uvicorn worker processes (default: 1 for duckdb,
+                              CPU count for postgres/bigquery; duckdb is always 1)
 
     # PostgreSQL
     POSTGRES_HOST           - PostgreSQL host (default: localhost)
@@ -34,15 +36,32 @@ Environment Variables:
     GCP_PROJECT_ID          - GCP project ID (required for bigquery)
     BQ_DATASET              - BigQuery dataset name (required for bigquery)
     GCP_SERVICE_ACCOUNT     - Path to service account JSON (optional, uses ADC if not set)
+
+Deployment:
+    The server runs on uvloop + httptools when they are installed (both ship
+    with ``uvicorn[standard]``). Under gunicorn, use the uvicorn worker class:
+
+        gunicorn 'examples.semantic_api:build_app()' -k uvicorn.workers.UvicornWorker -w 4
+
+    The app is built by the ``build_app`` factory rather than at import time, so
+    the supervising process never seeds the database or parses flow YAML; each
+    worker builds its handle once, on a worker thread during lifespan startup so
+    the event loop stays responsive (e.g. to shutdown signals). With the uvicorn CLI:
+
+        uvicorn --factory examples.semantic_api:build_app
 """
 
+import asyncio
+import importlib.util
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 import uvicorn
+from fastapi import FastAPI
 
 from semaflow import DataSource, FlowHandle
-from semaflow.api import create_app
+from semaflow.api import create_router
 
 
 def get_backend() -> str:
@@ -51,41 +70,34 @@ def get_backend() -> str:
 
 def build_duckdb_flow() -> FlowHandle:
     """Build FlowHandle with DuckDB backend."""
-    import duckdb
+    import sys
+    from datetime import datetime
+
+    import pyarrow as pa
 
     project_root = Path(__file__).resolve().parent
     flow_root = project_root / "duckdb" / "flows"
     db_path = project_root / "duckdb" / "api_test.duckdb"
 
-    # Seed database
-    if db_path.exists():
-        db_path.unlink()
-    conn = duckdb.connect(str(db_path))
-    conn.execute("""
-        CREATE TABLE customers (
-            id INTEGER PRIMARY KEY,
-            name VARCHAR,
-            country VARCHAR
-        );
-        CREATE TABLE orders (
-            id INTEGER PRIMARY KEY,
-            customer_id INTEGER,
-            amount DOUBLE,
-            created_at TIMESTAMP
-        );
-        INSERT INTO customers VALUES
-            (1, 'Alice', 'US'),
-            (2, 'Bob', 'UK'),
-            (3, 'Carla', 'US'),
-            (4, 'David', 'DE');
-        INSERT INTO orders VALUES
-            (1, 1, 100.0, '2024-01-01'),
-            (2, 1, 50.0, '2024-01-02'),
-            (3, 2, 25.0, '2024-01-03'),
-            (4, 3, 200.0, '2024-01-04'),
-            (5, 3, 75.0, '2024-01-05');
-    """)
-    conn.close()
+    # Shared seeding helper; skips the rewrite when the data is unchanged, which
+    # keeps restarts under `uvicorn --reload` fast.
+    sys.path.insert(0, str(project_root / "duckdb"))
+    from _seed import seed_duckdb
+
+    seed_duckdb(
+        db_path,
+        customers=pa.table({
+            "id": pa.array([1, 2, 3, 4], pa.int32()),
+            "name": ["Alice", "Bob", "Carla", "David"],
+            "country": ["US", "UK", "US", "DE"],
+        }),
+        orders=pa.table({
+            "id": pa.array([1, 2, 3, 4, 5], pa.int32()),
+            "customer_id": pa.array([1, 1, 2, 3, 3], pa.int32()),
+            "amount": [100.0, 50.0, 25.0, 200.0, 75.0],
+            "created_at": pa.array([datetime(2024, 1, d) for d in range(1, 6)], pa.timestamp("us")),
+        }),
+    )
 
     return FlowHandle.from_dir(
         str(flow_root),
@@ -150,15 +162,36 @@ def build_flow() -> FlowHandle:
         return build_duckdb_flow()
 
 
-flow = build_flow()
-app = create_app(flow)
+def get_workers(backend: str) -> int:
+    """Worker processes to run; the DuckDB file is owned by a single process."""
+    if backend == "duckdb":
+        return 1
+    return int(os.environ.get("SEMAFLOW_WORKERS", os.cpu_count() or 1))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Seeding, YAML parsing and backend schema validation all block; keep them
+    # off the event loop.
+    handle = await asyncio.to_thread(build_flow)
+    app.include_router(create_router(handle))
+    yield
+
+
+def build_app() -> FastAPI:
+    """App factory; called once per server process."""
+    return FastAPI(lifespan=lifespan)
 
 
 if __name__ == "__main__":
     uvicorn.run(
-        "examples.semantic_api:app",
+        "examples.semantic_api:build_app",
+        factory=True,
         host="0.0.0.0",
         port=8080,
         reload=False,
-        log_level="info",
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        workers=get_workers(get_backend()),
+        log_level="warning",
     )
@@ -5,11 +5,16 @@ Two layers:
 - Execution: `FlowHandle` (validated registry + connections) and the `build_flow_handles` helper.
 """
 
+from typing import TYPE_CHECKING, Any
+
 from .core import DataSource, Dimension, FlowJoin, JoinKey, Measure, SemanticFlow, SemanticTable, TableHandle
-from .handle import FlowHandle, build_flow_handles
+
+if TYPE_CHECKING:
+    from .handle import FlowHandle, PreparedFlow, build_flow_handles
 
 __all__ = [
     "FlowHandle",
+    "PreparedFlow",
     "build_flow_handles",
     "DataSource",
     "Dimension",
@@ -99,14 +104,20 @@ Args:
     joins: Optional list of FlowJoin objects.
     description: Optional human-readable description."""
 
-FlowHandle.__doc__ = """Validated, long-lived handle wrapping flows/tables/connections.
+# The execution layer (and its asyncio import) loads on first access, so code
+# that only builds definitions does not pay for it (PEP 562).
+_HANDLE_EXPORTS = ("FlowHandle", "PreparedFlow", "build_flow_handles")
 
-Use build_flow_handles to build one from class-based definitions. Exposes async build_sql/execute for query paths."""
 
-build_flow_handles.__doc__ = """Build a single FlowHandle from class-based flow definitions.
+def __getattr__(name: str) -> Any:
+    if name in _HANDLE_EXPORTS:
+        from . import handle
+
+        value = getattr(handle, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-Args:
-    flows: Mapping of flow name -> SemanticFlow.
 
-Returns:
-    FlowHandle containing all provided flows, validated once with shared tables/connections."""
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
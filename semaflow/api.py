@@ -3,7 +3,9 @@
 The helpers below expose three endpoints:
 - ``GET /flows``: list registered flows and optional descriptions
 - ``GET /flows/{flow}``: return flow schema (dimensions/measures/time dimension)
-- ``POST /flows/{flow}/query``: accept a query payload and return rows
+- ``POST /flows/{flow}/query``: accept a query payload and return rows (JSON, or an
+  Arrow IPC stream with ``Accept: application/vnd.apache.arrow.stream`` or
+  ``?format=arrow``)
 
 Pass either a ready-to-use :class:`~semaflow.FlowHandle` or a ``dict`` mapping
 flow names to :class:`~semaflow.SemanticFlow` definitions. The API builds the
@@ -23,27 +25,38 @@ Example:
     # app = create_app(build_flow_handles(flows))
 """
 
-from enum import Enum
-from typing import Any, Dict, List, Optional
+import json
+from enum import StrEnum, unique
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
 
 from semaflow import FlowHandle, SemanticFlow, build_flow_handles
+from semaflow.cache import TTLCache
+from semaflow.handle import RequestKey
 
 try:
-    from fastapi import APIRouter, FastAPI, HTTPException  # type: ignore
+    from fastapi import APIRouter, FastAPI, HTTPException, Query, Request, Response  # type: ignore
     from pydantic import BaseModel
 except ImportError as e:  # pragma: no cover - handled at runtime
     raise RuntimeError("fastapi is required; install with `pip install semaflow[api]`") from e
 
-# Use ORJSONResponse if orjson is available (3-10x faster serialization)
+# Use orjson if available (3-10x faster serialization)
 try:
-    import orjson  # noqa: F401 - check if orjson is installed
+    import orjson
     from fastapi.responses import ORJSONResponse
     _DEFAULT_RESPONSE_CLASS = ORJSONResponse
+    _dumps = orjson.dumps
 except ImportError:
     _DEFAULT_RESPONSE_CLASS = None  # Use FastAPI default
 
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
 
-class FilterOp(str, Enum):
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+@unique
+class FilterOp(StrEnum):
     """Supported filter operators for the query endpoint."""
 
     Eq = "=="
@@ -58,15 +71,23 @@ class FilterOp(str, Enum):
     ILike = "ilike"
 
 
+# Concrete JSON scalar types keep filter validation on pydantic-core's typed path.
+FilterScalar = Union[str, int, float, bool, None]
+FilterValue = Union[FilterScalar, List[FilterScalar]]
+
+
 class Filter(BaseModel):
     """Row-level filter applied to a dimension field."""
 
     field: str
     op: FilterOp
-    value: Any
+    value: FilterValue
+
+    model_config = {"extra": "forbid", "frozen": True}
 
 
-class OrderDirection(str, Enum):
+@unique
+class OrderDirection(StrEnum):
     """Sort direction for query results."""
 
     Asc = "asc"
@@ -79,6 +100,8 @@ class OrderItem(BaseModel):
     column: str
     direction: OrderDirection
 
+    model_config = {"extra": "forbid", "frozen": True}
+
 
 class QueryPayload(BaseModel):
     """Request body accepted by ``POST /flows/{flow}/query``.
@@ -101,7 +124,8 @@ class QueryPayload(BaseModel):
     page_size: Optional[int] = None
     cursor: Optional[str] = None
 
-    model_config = {"arbitrary_types_allowed": True}
+    # The Rust core rejects unknown request fields, so reject them here with a 422.
+    model_config = {"extra": "forbid", "frozen": True}
 
 
 class FlowList(BaseModel):
@@ -119,7 +143,7 @@ class FlowSchemaResponse(BaseModel):
     dimensions: Dict[str, Dict[str, Optional[str]]]
     measures: Dict[str, Dict[str, Optional[str]]]
 
-    model_config = {"arbitrary_types_allowed": True}
+    model_config = {"frozen": True}
 
 
 class QueryResponse(BaseModel):
@@ -140,7 +164,25 @@ class QueryResponse(BaseModel):
     has_more: bool = False
     total_rows: Optional[int] = None
 
-    model_config = {"arbitrary_types_allowed": True}
+
+def _wants_arrow(request: Request, fmt: Optional[str]) -> bool:
+    if fmt is not None:
+        return fmt == "arrow"
+    return ARROW_STREAM_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _arrow_stream_bytes(table: Any) -> memoryview:
+    """Serialize a pyarrow Table as an Arrow IPC stream.
+
+    Returns a view of the Arrow-owned buffer rather than copying it into ``bytes``;
+    Starlette sends a memoryview body as-is.
+    """
+    import pyarrow as pa
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return memoryview(sink.getvalue())
 
 
 def _prepare_flow_handle(flows: Any) -> FlowHandle:
@@ -151,86 +193,118 @@ def _prepare_flow_handle(flows: Any) -> FlowHandle:
     raise TypeError("flows must be a FlowHandle or a dict[str, SemanticFlow]")
 
 
-def create_router(flows: Any):
-    """Build an ``APIRouter`` exposing SemaFlow flows keyed by name."""
+def _build_flow_list(handle: FlowHandle) -> FlowList:
+    summaries: Sequence[Mapping[str, Any]] = handle.list_flows()
+    flow_map: Dict[str, Optional[str]] = {}
+    for summary in summaries:
+        name = summary.get("name")
+        if not isinstance(name, str):
+            raise TypeError("flow summary missing name")
+        description = summary.get("description")
+        if description is not None and not isinstance(description, str):
+            raise TypeError(f"flow {name} description must be a string or None")
+        flow_map[name] = description
+    return FlowList(flows=flow_map)
+
+
+def _build_flow_schema(handle: FlowHandle, flow: str) -> FlowSchemaResponse:
+    schema: Mapping[str, Any] = handle.get_flow(flow)
+    name = schema.get("name")
+    if not isinstance(name, str):
+        raise HTTPException(status_code=500, detail="flow schema missing name")
+    description = schema.get("description")
+    if description is not None and not isinstance(description, str):
+        raise HTTPException(
+            status_code=500, detail=f"flow {name} description must be a string or None"
+        )
+    dims_map: Dict[str, Dict[str, Optional[str]]] = {}
+    for dim in schema.get("dimensions", []):
+        if not isinstance(dim, Mapping):
+            raise HTTPException(status_code=500, detail=f"invalid dimension in flow {name}")
+        dim_name = dim.get("qualified_name") or dim.get("name")
+        if not isinstance(dim_name, str):
+            raise HTTPException(status_code=500, detail=f"dimension name missing in flow {name}")
+        dims_map[dim_name] = {
+            "description": dim.get("description")
+            if isinstance(dim.get("description"), str)
+            else None,
+            "data_type": dim.get("data_type") if isinstance(dim.get("data_type"), str) else None,
+        }
+
+    measures_map: Dict[str, Dict[str, Optional[str]]] = {}
+    for measure in schema.get("measures", []):
+        if not isinstance(measure, Mapping):
+            raise HTTPException(status_code=500, detail=f"invalid measure in flow {name}")
+        measure_name = measure.get("qualified_name") or measure.get("name")
+        if not isinstance(measure_name, str):
+            raise HTTPException(status_code=500, detail=f"measure name missing in flow {name}")
+        measures_map[measure_name] = {
+            "description": measure.get("description")
+            if isinstance(measure.get("description"), str)
+            else None,
+            "data_type": measure.get("data_type")
+            if isinstance(measure.get("data_type"), str)
+            else None,
+        }
+    return FlowSchemaResponse(
+        name=name,
+        description=description,
+        time_dimension=schema.get("time_dimension"),
+        dimensions=dims_map,
+        measures=measures_map,
+    )
+
+
+_FROM_ENV: Any = object()
+
+
+def create_router(flows: Any, result_cache: Optional[TTLCache] = _FROM_ENV):
+    """Build an ``APIRouter`` exposing SemaFlow flows keyed by name.
+
+    Flows are fixed once the handle is built, so the flow list and every flow's
+    schema response are built and serialized to JSON here, once. Requests reuse
+    the bytes, skipping FastAPI's response_model validation pass.
+
+    Args:
+        flows: FlowHandle or dict of flow name -> SemanticFlow.
+        result_cache: Cache for query responses, keyed by the canonical request.
+            Defaults to ``TTLCache.from_env()`` (300s TTL, 1024 entries; set
+            ``SEMAFLOW_CACHE_TTL=0`` to disable). Pass None to disable.
+    """
     handle: FlowHandle = _prepare_flow_handle(flows)
+    if result_cache is _FROM_ENV:
+        result_cache = TTLCache.from_env()
     router = APIRouter()
+    flow_list = _build_flow_list(handle)
+    flow_names = frozenset(flow_list.flows)
+    flow_list_body = flow_list.model_dump_json().encode()
+    schema_bodies = {
+        name: _build_flow_schema(handle, name).model_dump_json().encode() for name in flow_names
+    }
 
     def _ensure_flow(flow_name: str):
-        names = {m.get("name") for m in handle.list_flows()}
-        if flow_name not in names:
+        if flow_name not in flow_names:
             raise HTTPException(status_code=404, detail=f"unknown flow {flow_name}")
 
+    # response_model stays for the OpenAPI schema; returning a Response bypasses it.
     @router.get("/flows", response_model=FlowList)
     async def list_flows():
-        summaries: List[Dict[str, Any]] = handle.list_flows()
-        flow_map: Dict[str, Optional[str]] = {}
-        for summary in summaries:
-            name = summary.get("name")
-            if not isinstance(name, str):
-                raise HTTPException(status_code=500, detail="flow summary missing name")
-            description = summary.get("description")
-            if description is not None and not isinstance(description, str):
-                raise HTTPException(
-                    status_code=500, detail=f"flow {name} description must be a string or None"
-                )
-            flow_map[name] = description
-        return FlowList(flows=flow_map)
+        return Response(content=flow_list_body, media_type="application/json")
 
     @router.get("/flows/{flow}", response_model=FlowSchemaResponse)
     async def describe_flow(flow: str):
-        try:
-            _ensure_flow(flow)
-            schema: Dict[str, Any] = handle.get_flow(flow)
-            name = schema.get("name")
-            if not isinstance(name, str):
-                raise HTTPException(status_code=500, detail="flow schema missing name")
-            description = schema.get("description")
-            if description is not None and not isinstance(description, str):
-                raise HTTPException(
-                    status_code=500, detail=f"flow {name} description must be a string or None"
-                )
-            dims_map: Dict[str, Dict[str, Optional[str]]] = {}
-            for dim in schema.get("dimensions", []):
-                if not isinstance(dim, dict):
-                    raise HTTPException(status_code=500, detail=f"invalid dimension in flow {name}")
-                dim_name = dim.get("qualified_name") or dim.get("name")
-                if not isinstance(dim_name, str):
-                    raise HTTPException(status_code=500, detail=f"dimension name missing in flow {name}")
-                dims_map[dim_name] = {
-                    "description": dim.get("description")
-                    if isinstance(dim.get("description"), str)
-                    else None,
-                    "data_type": dim.get("data_type") if isinstance(dim.get("data_type"), str) else None,
-                }
-
-            measures_map: Dict[str, Dict[str, Optional[str]]] = {}
-            for measure in schema.get("measures", []):
-                if not isinstance(measure, dict):
-                    raise HTTPException(status_code=500, detail=f"invalid measure in flow {name}")
-                measure_name = measure.get("qualified_name") or measure.get("name")
-                if not isinstance(measure_name, str):
-                    raise HTTPException(status_code=500, detail=f"measure name missing in flow {name}")
-                measures_map[measure_name] = {
-                    "description": measure.get("description")
-                    if isinstance(measure.get("description"), str)
-                    else None,
-                    "data_type": measure.get("data_type")
-                    if isinstance(measure.get("data_type"), str)
-                    else None,
-                }
-            return FlowSchemaResponse(
-                name=name,
-                description=description,
-                time_dimension=schema.get("time_dimension"),
-                dimensions=dims_map,
-                measures=measures_map,
-            )
-        except Exception as exc:  # pragma: no cover - simple pass-through
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        body = schema_bodies.get(flow)
+        if body is None:
+            raise HTTPException(status_code=404, detail=f"unknown flow {flow}")
+        return Response(content=body, media_type="application/json")
 
     @router.post("/flows/{flow}/query", response_model=QueryResponse)
-    async def query(flow: str, req: QueryPayload):
+    async def query(
+        flow: str,
+        req: QueryPayload,
+        request: Request,
+        fmt: Optional[str] = Query(None, alias="format"),
+    ):
         """Execute a semantic query against a flow.
 
         When ``page_size`` is set, returns paginated results with a cursor for
@@ -238,25 +312,49 @@ def create_router(flows: Any):
 
         BigQuery uses native job pagination (no re-execution for subsequent pages).
         Postgres/DuckDB use LIMIT/OFFSET pagination.
+
+        With ``Accept: application/vnd.apache.arrow.stream`` or ``?format=arrow``
+        the rows are returned as an Arrow IPC stream instead of JSON, without
+        building per-row Python objects. Pagination is not supported there.
+
+        JSON bodies are encoded directly (with orjson when installed) rather than
+        through a QueryResponse model; rows from the handle are already plain JSON
+        values, so the model pass would only copy them.
         """
         try:
             _ensure_flow(flow)
-            payload = req.model_dump(exclude_none=True)
-            payload["flow"] = flow
+            payload = {"flow": flow, **req.model_dump(exclude_none=True)}
+            wants_arrow = _wants_arrow(request, fmt)
+            key = RequestKey.from_dict(payload) if result_cache is not None else None
+            if key is not None:
+                cache_key = (key, ARROW_STREAM_MEDIA_TYPE) if wants_arrow else key
+                cached = result_cache.get(cache_key)
+                if cached is not None:
+                    media_type = ARROW_STREAM_MEDIA_TYPE if wants_arrow else "application/json"
+                    return Response(content=cached, media_type=media_type)
+            if wants_arrow:
+                body = _arrow_stream_bytes(await handle.execute_arrow(payload))
+                if key is not None:
+                    result_cache.set(cache_key, body)
+                return Response(content=body, media_type=ARROW_STREAM_MEDIA_TYPE)
             result = await handle.execute(payload)
 
             # Normalize response: handle.execute returns list or dict based on page_size
             if isinstance(result, dict):
                 # Paginated result from handle
-                return QueryResponse(
-                    rows=result.get("rows", []),
-                    cursor=result.get("cursor"),
-                    has_more=result.get("has_more", False),
-                    total_rows=result.get("total_rows"),
-                )
+                response = {
+                    "rows": result.get("rows", []),
+                    "cursor": result.get("cursor"),
+                    "has_more": result.get("has_more", False),
+                    "total_rows": result.get("total_rows"),
+                }
             else:
                 # Non-paginated result (list of rows)
-                return QueryResponse(rows=result, has_more=False)
+                response = {"rows": result, "cursor": None, "has_more": False, "total_rows": None}
+            body = _dumps(response)
+            if key is not None:
+                result_cache.set(key, body)
+            return Response(content=body, media_type="application/json")
         except Exception as exc:  # pragma: no cover - simple pass-through
             raise HTTPException(status_code=400, detail=str(exc)) from exc
 
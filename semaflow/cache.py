@@ -0,0 +1,71 @@
+"""In-process result cache for the SemaFlow API.
+
+Flows are static and agents tend to re-issue identical requests, so the query
+endpoint can answer repeats from memory instead of compiling and executing them
+again. Entries expire after a TTL so new data becomes visible.
+"""
+
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+# Defaults for the API result cache; override with SEMAFLOW_CACHE_TTL / SEMAFLOW_CACHE_MAX.
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class TTLCache:
+    """Bounded LRU mapping whose entries expire ``ttl`` seconds after insertion.
+
+    Args:
+        maxsize: Maximum number of entries; the least recently used is evicted first.
+        ttl: Lifetime of an entry in seconds.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL_SECONDS):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    @classmethod
+    def from_env(cls) -> Optional["TTLCache"]:
+        """Build a cache from ``SEMAFLOW_CACHE_TTL``/``SEMAFLOW_CACHE_MAX``.
+
+        Returns None (caching disabled) when either is set to 0.
+        """
+        ttl = float(os.environ.get("SEMAFLOW_CACHE_TTL", DEFAULT_TTL_SECONDS))
+        maxsize = int(os.environ.get("SEMAFLOW_CACHE_MAX", DEFAULT_MAX_ENTRIES))
+        if ttl <= 0 or maxsize <= 0:
+            return None
+        return cls(maxsize=maxsize, ttl=ttl)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for ``key``, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
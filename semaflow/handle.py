@@ -4,18 +4,63 @@ Build validated, connection-aware handles from class-based flow definitions.
 """
 
 import asyncio
-from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional, TypedDict, Union
-
+import contextvars
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+    Union,
+)
+
+from .cache import TTLCache
 from .core import SemanticFlow, SemanticTable
 from .semaflow import Config
 from .semaflow import SemanticFlowHandle as _SemanticFlowHandle
 
+if TYPE_CHECKING:
+    import pyarrow
+
 Tables = List[SemanticTable]
 Flows = List[SemanticFlow]
 DataSources = Dict[str, str] | List[Any]
 Request = Dict[str, Any]
 
+# Maximum number of distinct request shapes whose SQL is memoized per handle.
+_SQL_CACHE_SIZE = 128
+
+# Handles registered with `FlowHandle.from_shared`, by name.
+_shared_handles: "weakref.WeakValueDictionary[str, FlowHandle]" = weakref.WeakValueDictionary()
+_shared_lock = threading.Lock()
+# Per-name build locks, so one slow builder never blocks other names.
+_shared_building: Dict[str, threading.Lock] = {}
+
+# Largest batch `execute_batched` sends in one call, and how long the first
+# request in a batch waits for others to join it.
+_BATCH_MAX_SIZE = 32
+_BATCH_WAIT_SECONDS = 0.0002
+
+# Worker pool for Rust calls; None uses the event loop's default executor.
+_executor: Optional[ThreadPoolExecutor] = None
+if os.environ.get("SEMAFLOW_THREAD_POOL_SIZE"):
+    _executor = ThreadPoolExecutor(
+        max_workers=int(os.environ["SEMAFLOW_THREAD_POOL_SIZE"]), thread_name_prefix="semaflow"
+    )
+
 
 class PaginatedResult(TypedDict, total=False):
     """Result from a paginated query execution.
@@ -49,6 +94,9 @@ class FlowHandle:
         data_sources: Either dict[name -> duckdb_path] or list[DataSource].
         config: Optional Config for connection and query settings.
         description: Optional description for this handle.
+        result_cache: Optional cache for non-paginated `execute` results. Repeated
+            requests are answered from it until the entry's TTL expires; call
+            ``handle.result_cache.clear()`` after writing to a data source.
     """
 
     def __init__(
@@ -58,27 +106,76 @@ class FlowHandle:
         data_sources: DataSources,
         config: Optional[Config] = None,
         description: Optional[str] = None,
+        result_cache: Optional[TTLCache] = None,
     ):
         self._inner = _SemanticFlowHandle(tables, flows, data_sources, config)
         self.description = description
+        self.result_cache = result_cache
+        self._sql_cache: "OrderedDict[RequestKey, str]" = OrderedDict()
+        self._plan_cache: "OrderedDict[RequestKey, Any]" = OrderedDict()
+        self._in_flight: Dict[RequestKey, "asyncio.Task[Any]"] = {}
+        self._compiling: Dict[RequestKey, "asyncio.Task[Any]"] = {}
+        self._flow_summaries: Optional[Sequence[Mapping[str, Any]]] = None
+        self._flow_schemas: Dict[str, Mapping[str, Any]] = {}
+        self._batcher = _ExecuteBatcher(self._inner)
+
+    @staticmethod
+    def configure_executor(max_workers: int) -> None:
+        """Size the thread pool that runs Rust calls for every handle.
+
+        ``build_sql`` / ``execute`` release the GIL while the Rust core plans
+        and runs the query, so each worker is one more query in flight. The
+        event loop's default executor is capped at ``min(32, cpu_count + 4)``.
+        ``SEMAFLOW_THREAD_POOL_SIZE`` applies the same setting at import.
+        """
+        global _executor
+        previous = _executor
+        _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="semaflow")
+        if previous is not None:
+            previous.shutdown(wait=False)
 
-    def __getitem__(self, key: str) -> Dict[str, Any]:
-        """Return the flow schema for ``key`` (dict returned by the Rust handle)."""
-        return self._inner.get_flow(key)
+    @classmethod
+    def from_shared(cls, name: str, builder: Callable[[], "FlowHandle"]) -> "FlowHandle":
+        """Return the handle registered under ``name`` in this process, building it once.
+
+        Apps, routers and background jobs in one worker process that ask for
+        the same name share a single registry and connection pool instead of
+        each parsing the flows again. The entry lives as long as a caller
+        holds the handle. Build it after the server forks its workers
+        (e.g. in a lifespan hook): DuckDB connections must not cross a fork.
+        """
+        with _shared_lock:
+            handle = _shared_handles.get(name)
+            if handle is not None:
+                return handle
+            building = _shared_building.setdefault(name, threading.Lock())
+        # Build outside the registry lock: builders may take a while or call
+        # from_shared for another name.
+        with building:
+            with _shared_lock:
+                handle = _shared_handles.get(name)
+            if handle is None:
+                handle = builder()
+                with _shared_lock:
+                    handle = _shared_handles.setdefault(name, handle)
+                    _shared_building.pop(name, None)
+            return handle
+
+    def __getitem__(self, key: str) -> Mapping[str, Any]:
+        """Return the flow schema for ``key`` (same as `get_flow`)."""
+        return self.get_flow(key)
 
     @classmethod
     def from_dir(
         cls,
-        root: Path | str,
+        root: "str | os.PathLike[str]",
         data_sources: DataSources,
         config: Optional[Config] = None,
         description: Optional[str] = None,
+        result_cache: Optional[TTLCache] = None,
     ) -> "FlowHandle":
-        inner = _SemanticFlowHandle.from_dir(str(root), data_sources, config)
-        obj = cls.__new__(cls)
-        obj._inner = inner
-        obj.description = description
-        return obj
+        inner = _SemanticFlowHandle.from_dir(os.fspath(root), data_sources, config)
+        return cls._wrap(inner, description, result_cache)
 
     @classmethod
     def from_parts(
@@ -88,15 +185,107 @@ class FlowHandle:
         data_sources: List[Any] | DataSources,
         config: Optional[Config] = None,
         description: Optional[str] = None,
+        result_cache: Optional[TTLCache] = None,
     ) -> "FlowHandle":
         inner = _SemanticFlowHandle.from_parts(tables, flows, data_sources, config)
+        return cls._wrap(inner, description, result_cache)
+
+    @classmethod
+    def _wrap(
+        cls,
+        inner: _SemanticFlowHandle,
+        description: Optional[str],
+        result_cache: Optional[TTLCache] = None,
+    ) -> "FlowHandle":
         obj = cls.__new__(cls)
         obj._inner = inner
         obj.description = description
+        obj.result_cache = result_cache
+        obj._sql_cache = OrderedDict()
+        obj._plan_cache = OrderedDict()
+        obj._in_flight = {}
+        obj._compiling = {}
+        obj._flow_summaries = None
+        obj._flow_schemas = {}
+        obj._batcher = _ExecuteBatcher(inner)
         return obj
 
     async def build_sql(self, request: Request) -> str:
-        return await asyncio.to_thread(self._inner.build_sql, request)
+        """Build SQL for a request, reusing cached SQL for repeated request shapes.
+
+        Flows are immutable once the handle is validated, so identical requests
+        always compile to identical SQL; only the first call crosses into Rust.
+        """
+        key = RequestKey.from_dict(request)
+        sql = self._sql_cache.get(key)
+        if sql is not None:
+            self._sql_cache.move_to_end(key)
+            return sql
+        sql = await _to_thread(self._inner.build_sql, request)
+        self._remember_sql(key, sql)
+        return sql
+
+    async def warmup(self, requests: Iterable[Request]) -> None:
+        """Compile and cache ``requests`` without executing them.
+
+        Call before serving traffic or starting a timer so the first real
+        `execute` or `build_sql` for each request shape is a cache hit.
+        Non-paginated requests are compiled to plans (which also caches their
+        SQL); paginated ones cache SQL only. All uncached requests are compiled
+        in a single worker-thread hop.
+        """
+        pending = {}
+        for request in requests:
+            key = RequestKey.from_dict(request)
+            cached = self._sql_cache if _is_paginated(request) else self._plan_cache
+            if key not in cached:
+                pending[key] = request
+        if not pending:
+            return
+
+        def compile_all() -> List[tuple]:
+            return [
+                (key, self._inner.build_sql(request))
+                if _is_paginated(request)
+                else (key, self._inner.prepare(request))
+                for key, request in pending.items()
+            ]
+
+        for key, compiled in await _to_thread(compile_all):
+            if isinstance(compiled, str):
+                self._remember_sql(key, compiled)
+            else:
+                self._remember_plan(key, compiled)
+
+    def _remember_sql(self, key: "RequestKey", sql: str) -> None:
+        self._sql_cache[key] = sql
+        if len(self._sql_cache) > _SQL_CACHE_SIZE:
+            self._sql_cache.popitem(last=False)
+
+    async def _plan_for(self, key: "RequestKey", request: Request) -> Any:
+        """Return the compiled ``PreparedQuery`` for a request shape, building it once."""
+        plan = self._plan_cache.get(key)
+        if plan is not None:
+            self._plan_cache.move_to_end(key)
+            return plan
+        # Concurrent misses on one shape share a single compile; hits never wait.
+        plan = await _single_flight(self._compiling, key, self._inner.prepare, request)
+        self._remember_plan(key, plan)
+        return plan
+
+    def _remember_plan(self, key: "RequestKey", plan: Any) -> None:
+        self._plan_cache[key] = plan
+        if len(self._plan_cache) > _SQL_CACHE_SIZE:
+            self._plan_cache.popitem(last=False)
+        self._remember_sql(key, plan.sql)
+
+    def prepare(self, request: Request) -> "PreparedFlow":
+        """Prepare a request template for repeated execution.
+
+        Filter values in the template can be rebound per call by field name;
+        see `PreparedFlow.execute`. Pagination is not supported.
+        """
+        return PreparedFlow(self, request)
 
     async def execute(self, request: Request) -> ExecuteResult:
         """Execute a query request.
@@ -109,37 +298,360 @@ class FlowHandle:
         Returns:
             If page_size is NOT set: list of row dicts (backwards compatible).
             If page_size IS set: PaginatedResult dict with rows, cursor, has_more, total_rows.
+
+        Concurrent calls with an identical request share a single database
+        round-trip; each caller still receives its own row dicts. Non-paginated
+        requests compile once per request shape; repeats run the stored SQL, or
+        are answered from ``result_cache`` when the handle has one.
+        """
+        key = RequestKey.from_dict(request)
+        if _is_paginated(request):
+            result = await _single_flight(self._in_flight, key, self._inner.execute, request)
+            return _unsanitize_result(result)
+        cache = self.result_cache
+        result = cache.get(key) if cache is not None else None
+        if result is None:
+            plan = await self._plan_for(key, request)
+            # Ad-hoc SQL inlines filter values, so it must not pile up server-side statements.
+            result = await _single_flight(self._in_flight, key, plan.execute_once)
+            if cache is not None:
+                cache.set(key, result)
+        return _unsanitize_result(result)
+
+    async def execute_batched(self, request: Request) -> ExecuteResult:
+        """Execute a query request, sharing one Rust call with concurrent callers.
+
+        Requests submitted within a short window (up to 32 at a time) are
+        sent to the Rust core together and run
+        concurrently there, so a burst of calls costs one worker-thread hop
+        instead of one each. Results and errors are the same as `execute`.
+        """
+        return _unsanitize_result(await self._batcher.submit(request))
+
+    async def execute_many(self, requests: Sequence[Request]) -> List[ExecuteResult]:
+        """Execute several query requests with one Rust call.
+
+        Identical requests are run once and their result is shared, so
+        ``execute_many([request] * n)`` costs about one query plus a copy of
+        the rows per slot. Distinct requests run concurrently in the Rust core.
+
+        Returns:
+            One `execute` result per request, in order.
+
+        Raises:
+            ValueError: The first failing request's error, after all have run.
+        """
+        slots: Dict[RequestKey, int] = {}
+        unique: List[Request] = []
+        order = []
+        for request in requests:
+            key = RequestKey.from_dict(request)
+            if key not in slots:
+                slots[key] = len(unique)
+                unique.append(request)
+            order.append(slots[key])
+        results = await _to_thread(self._inner.execute_many, unique) if unique else []
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return [_unsanitize_result(results[i]) for i in order]
+
+    async def execute_arrow(self, request: Request) -> "pyarrow.Table":
+        """Execute a query request and return the result as a pyarrow Table.
+
+        Rows stay columnar end to end, so large results avoid building one
+        dict per row. Requires pyarrow; pagination is not supported.
+
+        Args:
+            request: Query request dict with flow, dimensions, measures, etc.
+
+        Returns:
+            pyarrow.Table with qualified column names (e.g. ``c.country``).
+        """
+        if _is_paginated(request):
+            table = await _to_thread(lambda: self._inner.execute_arrow(request).read_all())
+        else:
+            plan = await self._plan_for(RequestKey.from_dict(request), request)
+            table = await _to_thread(lambda: plan.execute_arrow().read_all())
+        return table.rename_columns([_unsanitize_name(name) for name in table.column_names])
+
+    async def execute_with_sql(self, request: Request) -> Tuple[str, List[Dict[str, Any]]]:
+        """Execute a query request and also return the SQL it ran.
+
+        The request is compiled once and the same SQL is executed, instead of
+        compiling it separately for `build_sql` and `execute`. Pagination is
+        not supported.
+
+        Returns:
+            ``(sql, rows)`` with rows as list of dicts.
+        """
+
+        def run() -> Tuple[str, List[Dict[str, Any]]]:
+            prepared = self._inner.prepare(request)
+            return prepared.sql, prepared.execute_once()
+
+        sql, rows = await _to_thread(run)
+        self._remember_sql(RequestKey.from_dict(request), sql)
+        return sql, _unsanitize_rows(rows)
+
+    async def execute_arrow_with_sql(self, request: Request) -> Tuple[str, "pyarrow.Table"]:
+        """Like `execute_with_sql`, but return the rows as a pyarrow Table."""
+
+        def run() -> Tuple[str, "pyarrow.Table"]:
+            prepared = self._inner.prepare(request)
+            return prepared.sql, prepared.execute_arrow().read_all()
+
+        sql, table = await _to_thread(run)
+        self._remember_sql(RequestKey.from_dict(request), sql)
+        return sql, table.rename_columns([_unsanitize_name(name) for name in table.column_names])
+
+    def list_flows(self) -> Sequence[Mapping[str, Any]]:
+        """Return name/description summaries for all flows in this handle.
+
+        Flows are fixed once the handle is built, so the summaries are read
+        from Rust once and returned as the same read-only object afterwards.
+        """
+        if self._flow_summaries is None:
+            self._flow_summaries = _deep_freeze(self._inner.list_flows())
+        return self._flow_summaries
+
+    def get_flow(self, name: str) -> Mapping[str, Any]:
+        """Return the read-only flow schema for the given name (cached per flow)."""
+        schema = self._flow_schemas.get(name)
+        if schema is None:
+            schema = self._flow_schemas[name] = _deep_freeze(self._inner.get_flow(name))
+        return schema
+
+
+class PreparedFlow:
+    """Request template compiled once per distinct set of filter values.
+
+    Created by `FlowHandle.prepare`. The first execution of each binding builds
+    SQL in Rust and keeps it bound to the flow's data source; later executions
+    run that SQL directly, skipping request parsing and SQL generation.
+    """
+
+    def __init__(self, handle: FlowHandle, template: Request):
+        if _is_paginated(template):
+            raise ValueError("prepared queries do not support pagination")
+        self._handle = handle
+        self._template = template
+        self._fields = {f["field"] for f in template.get("filters", [])}
+        self._compiled: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._in_flight: Dict[tuple, "asyncio.Task[Any]"] = {}
+
+    async def execute(self, params: Optional[Mapping[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Execute the template, replacing filter values by field name.
+
+        Args:
+            params: Optional mapping of filter field (e.g. ``"c.country"``) to the
+                value to bind. Fields not in the mapping keep the template value.
+
+        Returns:
+            List of row dicts.
         """
-        result = await asyncio.to_thread(self._inner.execute, request)
-        # Transform result keys from SQL-safe format (c__country) back to qualified format (c.country)
-        if isinstance(result, dict):
-            # Paginated result - transform rows within the dict
-            return {
-                "rows": [_unsanitize_keys(row) for row in result["rows"]],
-                "cursor": result.get("cursor"),
-                "has_more": result.get("has_more", False),
-                "total_rows": result.get("total_rows"),
-            }
+        key, prepared = await self._compile(params)
+        rows = await _single_flight(self._in_flight, key, prepared.execute)
+        return _unsanitize_rows(rows)
+
+    async def warmup(self, *bindings: Optional[Mapping[str, Any]]) -> None:
+        """Compile the template for each binding without executing it.
+
+        With no arguments, compiles the template's own filter values.
+        """
+        for params in bindings or (None,):
+            await self._compile(params)
+
+    async def _compile(self, params: Optional[Mapping[str, Any]]) -> tuple:
+        key = _freeze(params or {})
+        prepared = self._compiled.get(key)
+        if prepared is None:
+            request = self._bind(params or {})
+            prepared = await _to_thread(self._handle._inner.prepare, request)
+            self._compiled[key] = prepared
+            if len(self._compiled) > _SQL_CACHE_SIZE:
+                self._compiled.popitem(last=False)
         else:
-            # Non-paginated result - list of rows
-            return [_unsanitize_keys(row) for row in result]
+            self._compiled.move_to_end(key)
+        return key, prepared
+
+    def _bind(self, params: Mapping[str, Any]) -> Request:
+        unknown = set(params) - self._fields
+        if unknown:
+            raise ValueError(f"no filter on field(s) {sorted(unknown)} in prepared request")
+        if not params:
+            return self._template
+        request = dict(self._template)
+        request["filters"] = [
+            {**f, "value": params[f["field"]]} if f["field"] in params else f
+            for f in self._template.get("filters", [])
+        ]
+        return request
+
+
+class _ExecuteBatcher:
+    """Collect concurrent requests and run each batch with one ``execute_many`` call."""
+
+    def __init__(self, inner: _SemanticFlowHandle):
+        self._inner = inner
+        self._pending: List[Tuple[Request, "asyncio.Future[Any]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: set = set()
+
+    async def submit(self, request: Request) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((request, future))
+        if len(self._pending) >= _BATCH_MAX_SIZE:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(_BATCH_WAIT_SECONDS, self._dispatch)
+        return await future
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: List[Tuple[Request, "asyncio.Future[Any]"]]) -> None:
+        try:
+            results = await _to_thread(self._inner.execute_many, [request for request, _ in batch])
+        except Exception as exc:
+            results = [exc] * len(batch)
+        for (_, future), result in zip(batch, results):
+            if future.done():  # caller was cancelled
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+async def _to_thread(func, /, *args) -> Any:
+    """Run ``func(*args)`` in the default executor, like `asyncio.to_thread`.
+
+    Uses the pool set by `FlowHandle.configure_executor`, if any.
+    `asyncio.to_thread` always wraps the call in ``Context.run``; that is only
+    needed when context variables are set, so the common empty-context case
+    hands ``func`` to the executor directly.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    if not ctx:
+        return await loop.run_in_executor(_executor, func, *args)
+    return await loop.run_in_executor(_executor, ctx.run, func, *args)
 
-    def list_flows(self):
-        """Return a list of all flow names in this handle."""
-        return self._inner.list_flows()
 
-    def get_flow(self, name: str) -> Dict[str, Any]:
-        """Return the flow schema for the given name."""
-        return self._inner.get_flow(name)
+async def _single_flight(in_flight: Dict[Any, "asyncio.Task[Any]"], key: Any, func, *args) -> Any:
+    """Run ``func(*args)`` in a worker thread, sharing one run across concurrent callers.
+
+    Callers awaiting the same ``key`` while a run is in flight get its result
+    instead of starting another. The run is shielded so one caller's
+    cancellation does not cancel it for the others.
+    """
+    loop = asyncio.get_running_loop()
+    task = in_flight.get(key)
+    if task is None or task.get_loop() is not loop:
+        task = loop.create_task(_to_thread(func, *args))
+        in_flight[key] = task
 
+        def _forget(done: "asyncio.Task[Any]") -> None:
+            if in_flight.get(key) is done:
+                del in_flight[key]
 
-def _unsanitize_keys(row: Dict[str, Any]) -> Dict[str, Any]:
+        task.add_done_callback(_forget)
+    return await asyncio.shield(task)
+
+
+_REQUEST_FIELDS = ("flow", "dimensions", "measures", "filters", "order", "limit", "offset", "page_size", "cursor")
+_MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
+class RequestKey:
+    """Hashable signature of a query request, used as the key for per-handle caches.
+
+    Values are frozen with their types so that e.g. ``1`` and ``True`` filter
+    values stay distinct. Unknown request keys are recorded by name so an
+    invalid request never shares an entry with a valid one.
+    """
+
+    flow: Any
+    dimensions: Any
+    measures: Any
+    filters: Any
+    order: Any
+    limit: Any
+    offset: Any
+    page_size: Any
+    cursor: Any
+    unknown_fields: Tuple[str, ...]
+
+    @classmethod
+    def from_dict(cls, request: Request) -> "RequestKey":
+        get = request.get
+        return cls(
+            *(_freeze(get(name, _MISSING)) for name in _REQUEST_FIELDS),
+            unknown_fields=tuple(sorted(k for k in request if k not in _REQUEST_FIELDS)),
+        )
+
+
+def _freeze(value: Any) -> Any:
+    """Convert a JSON-like value into a hashable equivalent that preserves scalar types."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return (type(value), value)
+
+
+def _deep_freeze(value: Any) -> Any:
+    """Return a read-only view of nested dicts/lists (MappingProxyType/tuple)."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _deep_freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_deep_freeze(v) for v in value)
+    return value
+
+
+def _is_paginated(request: Request) -> bool:
+    return request.get("page_size") is not None or request.get("cursor") is not None
+
+
+def _unsanitize_result(result: Any) -> ExecuteResult:
+    """Restore qualified column names in an ``execute`` result (rows or a page)."""
+    if isinstance(result, dict):
+        return {
+            "rows": _unsanitize_rows(result["rows"]),
+            "cursor": result.get("cursor"),
+            "has_more": result.get("has_more", False),
+            "total_rows": result.get("total_rows"),
+        }
+    return _unsanitize_rows(result)
+
+
+def _unsanitize_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Transform column names from SQL-safe format back to qualified format.
 
     Converts 'c__country' back to 'c.country' so users receive the same
-    keys they used in the request.
+    keys they used in the request. All rows of a result carry the same
+    columns in the same order, so the names are converted once and zipped
+    onto each row's values.
     """
-    return {k.replace("__", "."): v for k, v in row.items()}
+    if not rows:
+        return []
+    keys = tuple(_unsanitize_name(name) for name in rows[0])
+    return [dict(zip(keys, row.values())) for row in rows]
+
+
+def _unsanitize_name(name: str) -> str:
+    """Convert one SQL-safe column name ('c__country') to 'c.country'."""
+    return name.replace("__", ".")
 
 
 def build_flow_handles(
@@ -160,14 +672,17 @@ def build_flow_handles(
     flow_list: List[SemanticFlow] = []
     data_sources: Dict[str, Any] = {}
 
-    for name, flow in flows.items():
-        if not isinstance(flow, SemanticFlow):
+    for flow in flows.values():
+        # SemanticFlow is a final pyclass, so an exact type check is sufficient.
+        if type(flow) is not SemanticFlow:
             raise TypeError("flows values must be SemanticFlow objects")
         flow_list.append(flow)
         for table in flow.referenced_tables():
-            unique_tables.setdefault(table.name, table)
-            ds_attr = getattr(table, "data_source", None)
-            ds = ds_attr() if callable(ds_attr) else ds_attr
+            # Tables shared across flows were already registered with their data source.
+            if table.name in unique_tables:
+                continue
+            unique_tables[table.name] = table
+            ds = table.data_source
             if ds is None:
                 raise ValueError(
                     "tables must be constructed with a DataSource instance; pass DataSource(...) into SemanticTable"
@@ -34,11 +34,13 @@ class DataSource:
         name: Unique identifier for this data source within a flow.
         uri: Backend-specific connection string or path.
         max_concurrency: Optional connection pool size limit.
+        threads: Optional DuckDB worker threads per query.
     """
 
     name: str
     uri: str
     max_concurrency: Optional[int]
+    threads: Optional[int]
 
     def __init__(self, name: str, uri: str, max_concurrency: Optional[int] = None) -> None:
         """Create a generic data source (defaults to DuckDB backend).
@@ -52,6 +54,7 @@ class DataSource:
         path: str,
         name: Optional[str] = None,
         max_concurrency: Optional[int] = None,
+        threads: Optional[int] = None,
     ) -> "DataSource":
         """Create a DuckDB data source.
 
@@ -60,6 +63,9 @@ class DataSource:
                   Use ":memory:" for an in-memory database.
             name: Optional name for this data source. Defaults to "duckdb".
             max_concurrency: Optional max concurrent connections.
+            threads: Optional DuckDB worker threads per query. Queries already
+                run off the event loop with the GIL released, so this bounds
+                how many cores each one may use.
 
         Returns:
             Configured DataSource for DuckDB.
@@ -635,12 +641,20 @@ class Config:
         """
         ...
 
-    def set_duckdb_config(self, datasource_name: str, max_concurrency: Optional[int] = None) -> None:
+    def set_duckdb_config(
+        self,
+        datasource_name: str,
+        max_concurrency: Optional[int] = None,
+        threads: Optional[int] = None,
+        memory_limit: Optional[str] = None,
+    ) -> None:
         """Configure DuckDB settings for a specific datasource.
 
         Args:
             datasource_name: Name of the datasource.
             max_concurrency: Maximum concurrent queries.
+            threads: DuckDB worker threads per query.
+            memory_limit: DuckDB memory limit (e.g. ``"4GB"``).
         """
         ...
 
@@ -659,6 +673,36 @@ class Config:
         """
         ...
 
+class PreparedQuery:
+    """A query request compiled to SQL and bound to its data source.
+
+    Created by `SemanticFlowHandle.prepare`. Executing it runs the stored SQL
+    directly without re-parsing the request or regenerating SQL.
+
+    Attributes:
+        flow: Name of the flow the request targets.
+        sql: The compiled SQL string.
+    """
+
+    flow: str
+    sql: str
+
+    def execute(self) -> List[Dict[str, Any]]:
+        """Execute the compiled SQL and return result rows as dictionaries.
+
+        On PostgreSQL the statement is prepared once per pooled connection and
+        kept, so use this for SQL that runs repeatedly.
+        """
+        ...
+
+    def execute_once(self) -> List[Dict[str, Any]]:
+        """Like `execute`, without caching a server-side prepared statement."""
+        ...
+
+    def execute_arrow(self) -> Any:
+        """Execute the compiled SQL and return a pyarrow.RecordBatchReader."""
+        ...
+
 class SemanticFlowHandle:
     """Validated, connection-aware handle for executing semantic queries.
 
@@ -666,6 +710,9 @@ class SemanticFlowHandle:
     validated semantic definitions and active database connections, enabling
     efficient repeated queries.
 
+    Methods taking a request also accept it as JSON-encoded ``bytes`` (e.g. a
+    request body passed through unchanged), which Rust parses in place.
+
     Attributes:
         description: Optional description of this handle's purpose.
     """
@@ -733,7 +780,7 @@ class SemanticFlowHandle:
         """
         ...
 
-    def build_sql(self, request: Dict[str, Any]) -> str:
+    def build_sql(self, request: Union[Dict[str, Any], bytes]) -> str:
         """Generate SQL for a query request without executing.
 
         Useful for debugging, logging, or executing manually.
@@ -760,7 +807,24 @@ class SemanticFlowHandle:
         """
         ...
 
-    def execute(self, request: Dict[str, Any]) -> Union[List[Dict[str, Any]], PaginatedResult]:
+    def prepare(self, request: Union[Dict[str, Any], bytes]) -> PreparedQuery:
+        """Compile a query request to SQL once for repeated execution.
+
+        Args:
+            request: Query request dict (same keys as `build_sql`). Pagination
+                     keys (page_size, cursor) are not supported.
+
+        Returns:
+            PreparedQuery bound to the data source serving the flow.
+
+        Raises:
+            ValueError: If the request is invalid or requests pagination.
+        """
+        ...
+
+    def execute(
+        self, request: Union[Dict[str, Any], bytes]
+    ) -> Union[List[Dict[str, Any]], PaginatedResult]:
         """Execute a query and return results.
 
         Args:
@@ -809,6 +873,46 @@ class SemanticFlowHandle:
         """
         ...
 
+    def execute_many(
+        self, requests: List[Union[Dict[str, Any], bytes]]
+    ) -> List[Union[List[Dict[str, Any]], PaginatedResult, ValueError]]:
+        """Execute several queries in one call, running them concurrently.
+
+        Args:
+            requests: Query request dicts, in the same format as `execute`.
+
+        Returns:
+            One entry per request, in order: the `execute` result, or a
+            ValueError instance for a request that failed.
+        """
+        ...
+
+    def execute_arrow(self, request: Union[Dict[str, Any], bytes]) -> Any:
+        """Execute a query and return results as Arrow record batches.
+
+        DuckDB hands its native Arrow batches over the C data interface; other
+        backends convert their rows to Arrow first. Column names use the SQL-safe
+        form (``c__country``); ``FlowHandle.execute_arrow`` restores qualified names.
+
+        Args:
+            request: Query request dict (same shape as ``execute``). Pagination
+                keys (``page_size``, ``cursor``) are not supported.
+
+        Returns:
+            pyarrow.RecordBatchReader over the result.
+
+        Raises:
+            ValueError: If the request is invalid or requests pagination.
+
+        Example:
+            >>> table = handle.execute_arrow({
+            ...     "flow": "sales_analytics",
+            ...     "dimensions": ["c.country"],
+            ...     "measures": ["o.revenue"],
+            ... }).read_all()
+        """
+        ...
+
     def list_flows(self) -> List[Dict[str, Any]]:
         """List all available flows with their names and descriptions.
 
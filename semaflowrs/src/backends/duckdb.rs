@@ -1,32 +1,72 @@
 //! DuckDB backend implementation.
 
 use std::path::{Path, PathBuf};
-use std::sync::Arc;
-use std::time::Instant;
+use std::sync::{Arc, Mutex, MutexGuard, PoisonError};
+use std::time::{Duration, Instant};
 
 use arrow::array::RecordBatch;
 use arrow::datatypes::{DataType, Schema};
 use async_trait::async_trait;
-use tokio::sync::{Mutex, Semaphore, SemaphorePermit};
+use tokio::sync::{Semaphore, SemaphorePermit};
 
 use crate::config::DuckDbConfig;
 use crate::dialect::DuckDbDialect;
 use crate::error::{Result, SemaflowError};
-use crate::executor::{ColumnMeta, PaginatedResult, QueryResult};
+use crate::executor::{ArrowResult, ColumnMeta, PaginatedResult, QueryResult};
 use crate::pagination::Cursor;
 use crate::schema_cache::{ForeignKey, TableSchema};
 
 use super::BackendConnection;
 
+/// Pages fetched per cursor-bearing DuckDB page query; the rows past the requested
+/// page are kept so the following pages are served without running the query again.
+/// First pages fetch only one page, since most callers never ask for a second.
+const READ_AHEAD_PAGES: u64 = 4;
+
+/// Most read-ahead buffers kept per database; the oldest is dropped first.
+const READ_AHEAD_BUFFERS: usize = 32;
+
+/// Most rows buffered across all read-ahead buffers of a database. Pages too large
+/// to read ahead within this budget are fetched one at a time.
+const READ_AHEAD_MAX_ROWS: usize = 10_000;
+
+/// How long buffered rows may answer later pages. Buffered pages are a snapshot of
+/// the result at fetch time, so this bounds how stale a served page can be.
+const READ_AHEAD_TTL: Duration = Duration::from_secs(30);
+
+/// Rows fetched past a served page, keyed by query hash and the offset of the
+/// first buffered row.
+struct ReadAhead {
+    query_hash: u64,
+    offset: u64,
+    columns: Vec<ColumnMeta>,
+    rows: Vec<serde_json::Map<String, serde_json::Value>>,
+    /// The fetch reached the end of the result, so no rows exist past `rows`.
+    complete: bool,
+    fetched_at: Instant,
+}
+
 /// DuckDB connection implementing the unified backend trait.
 #[derive(Clone)]
 pub struct DuckDbConnection {
     database_path: PathBuf,
     dialect: DuckDbDialect,
     limiter: Arc<Semaphore>,
+    /// Idle connections. Every query checks one out for its whole run, so concurrent
+    /// queries never share a connection; the lock only covers a push or pop and is
+    /// never held across an await.
     pool: Arc<Mutex<Vec<duckdb::Connection>>>,
+    /// First connection opened for this database. Further connections are cloned
+    /// from it so they share one database instance (catalog, buffer pool, loaded
+    /// extensions) instead of reopening the file.
+    root: Arc<Mutex<Option<duckdb::Connection>>>,
+    /// Database-wide settings applied when the database is first opened.
+    threads: Option<usize>,
+    memory_limit: Option<String>,
     /// Whether this is an in-memory database (connections cannot be recreated)
     is_memory: bool,
+    /// Rows already fetched for the next pages of recent paginated queries.
+    read_ahead: Arc<Mutex<Vec<ReadAhead>>>,
 }
 
 impl DuckDbConnection {
@@ -41,6 +81,8 @@ impl DuckDbConnection {
         tracing::info!(
             path = %path.display(),
             max_concurrency = config.max_concurrency,
+            threads = ?config.threads,
+            memory_limit = ?config.memory_limit,
             is_memory = is_memory,
             "creating DuckDB connection"
         );
@@ -49,7 +91,11 @@ impl DuckDbConnection {
             dialect: DuckDbDialect,
             limiter: Arc::new(Semaphore::new(config.max_concurrency)),
             pool: Arc::new(Mutex::new(Vec::new())),
+            root: Arc::new(Mutex::new(None)),
+            threads: config.threads,
+            memory_limit: config.memory_limit,
             is_memory,
+            read_ahead: Arc::new(Mutex::new(Vec::new())),
         }
     }
 
@@ -68,10 +114,8 @@ impl DuckDbConnection {
     /// For in-memory databases, this MUST be called before any queries,
     /// as new connections cannot be created (they would be empty databases).
     pub async fn initialize_pool(&self) -> Result<()> {
-        let conn = duckdb::Connection::open(self.database_path.clone())
-            .map_err(|e| SemaflowError::Execution(format!("open duckdb: {e}")))?;
-        let mut guard = self.pool.lock().await;
-        guard.push(conn);
+        let conn = self.open_connection()?;
+        self.idle().push(conn);
         tracing::debug!(
             path = %self.database_path.display(),
             "initialized DuckDB connection pool"
@@ -79,6 +123,90 @@ impl DuckDbConnection {
         Ok(())
     }
 
+    /// Open a connection to the shared database instance.
+    ///
+    /// The first call opens the database; later calls clone the root connection,
+    /// which is cheap and, for in-memory databases, sees the same data.
+    fn open_connection(&self) -> Result<duckdb::Connection> {
+        let mut root = self
+            .root
+            .lock()
+            .map_err(|_| SemaflowError::Execution("duckdb root connection poisoned".to_string()))?;
+        if let Some(conn) = root.as_ref() {
+            return conn
+                .try_clone()
+                .map_err(|e| SemaflowError::Execution(format!("clone duckdb connection: {e}")));
+        }
+        let conn =
+            duckdb::Connection::open_with_flags(self.database_path.clone(), self.open_config()?)
+                .map_err(|e| SemaflowError::Execution(format!("open duckdb: {e}")))?;
+        let clone = conn
+            .try_clone()
+            .map_err(|e| SemaflowError::Execution(format!("clone duckdb connection: {e}")))?;
+        *root = Some(conn);
+        Ok(clone)
+    }
+
+    /// Build the DuckDB open settings from the configured threads/memory limit.
+    fn open_config(&self) -> Result<duckdb::Config> {
+        let mut config = duckdb::Config::default();
+        if let Some(threads) = self.threads {
+            config = config
+                .threads(threads as i64)
+                .map_err(|e| SemaflowError::Execution(format!("duckdb threads: {e}")))?;
+        }
+        if let Some(limit) = &self.memory_limit {
+            config = config
+                .max_memory(limit)
+                .map_err(|e| SemaflowError::Execution(format!("duckdb memory_limit: {e}")))?;
+        }
+        Ok(config)
+    }
+
+    /// Lock the idle-connection list. Only pushes and pops happen under the lock,
+    /// so a poisoned lock still holds a consistent list.
+    fn idle(&self) -> MutexGuard<'_, Vec<duckdb::Connection>> {
+        self.pool.lock().unwrap_or_else(PoisonError::into_inner)
+    }
+
+    /// Take the buffered rows starting at `offset` for this query, if any.
+    fn take_read_ahead(&self, query_hash: u64, offset: u64) -> Option<ReadAhead> {
+        let mut buffers = self
+            .read_ahead
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner);
+        buffers.retain(|b| b.fetched_at.elapsed() < READ_AHEAD_TTL);
+        let pos = buffers
+            .iter()
+            .position(|b| b.query_hash == query_hash && b.offset == offset)?;
+        Some(buffers.remove(pos))
+    }
+
+    /// Buffer rows for a later page, evicting expired and then the oldest buffers
+    /// to stay within `READ_AHEAD_BUFFERS` and `READ_AHEAD_MAX_ROWS`.
+    fn store_read_ahead(&self, buffer: ReadAhead) {
+        if buffer.rows.len() > READ_AHEAD_MAX_ROWS {
+            return;
+        }
+        let mut buffers = self
+            .read_ahead
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner);
+        buffers.retain(|b| b.fetched_at.elapsed() < READ_AHEAD_TTL);
+        let mut buffered: usize = buffers.iter().map(|b| b.rows.len()).sum();
+        while !buffers.is_empty()
+            && (buffers.len() >= READ_AHEAD_BUFFERS
+                || buffered + buffer.rows.len() > READ_AHEAD_MAX_ROWS)
+        {
+            buffered -= buffers.remove(0).rows.len();
+        }
+        buffers.push(buffer);
+    }
+
+    fn has_root(&self) -> bool {
+        self.root.lock().map(|root| root.is_some()).unwrap_or(false)
+    }
+
     async fn acquire_slot(&self) -> Result<SemaphorePermit<'_>> {
         let available = self.limiter.available_permits();
         if available == 0 {
@@ -93,7 +221,7 @@ impl DuckDbConnection {
     async fn checkout_connection(&self) -> Result<duckdb::Connection> {
         // Try to get a connection from the pool first
         {
-            let mut guard = self.pool.lock().await;
+            let mut guard = self.idle();
             if let Some(conn) = guard.pop() {
                 let pool_size = guard.len();
                 drop(guard);
@@ -105,26 +233,16 @@ impl DuckDbConnection {
             }
         }
 
-        // Pool is empty - for in-memory databases, we need to wait for one
-        // since opening a new :memory: connection creates a separate empty database.
-        if self.is_memory {
-            // This should only happen during concurrent access after pool was initialized.
-            // If we get here before initialization, we have a bug.
-            tracing::debug!("waiting for in-memory DuckDB connection to be returned to pool");
-            loop {
-                tokio::time::sleep(tokio::time::Duration::from_millis(1)).await;
-                let mut guard = self.pool.lock().await;
-                if let Some(conn) = guard.pop() {
-                    tracing::trace!("got in-memory DuckDB connection from pool");
-                    return Ok(conn);
-                }
-            }
+        // Pool is empty - an in-memory database must already be open, since opening
+        // a fresh :memory: database would see none of the registered tables.
+        if self.is_memory && !self.has_root() {
+            return Err(SemaflowError::Execution(
+                "in-memory DuckDB queried before initialize_pool".to_string(),
+            ));
         }
 
-        // For file-based databases, open a new connection
         tracing::debug!(path = %self.database_path.display(), "opening new DuckDB connection");
-        duckdb::Connection::open(self.database_path.clone())
-            .map_err(|e| SemaflowError::Execution(format!("open duckdb: {e}")))
+        self.open_connection()
     }
 
     /// Get a connection from pool, or create one if pool is empty.
@@ -133,17 +251,33 @@ impl DuckDbConnection {
     /// which is correct for initial setup (like register_arrow_table) but NOT for
     /// queries on in-memory databases (where we must reuse the existing connection).
     async fn get_or_create_connection(&self) -> Result<duckdb::Connection> {
-        {
-            let mut guard = self.pool.lock().await;
-            if let Some(conn) = guard.pop() {
-                tracing::trace!("reusing pooled DuckDB connection for registration");
-                return Ok(conn);
-            }
+        if let Some(conn) = self.idle().pop() {
+            tracing::trace!("reusing pooled DuckDB connection for registration");
+            return Ok(conn);
         }
         // Create new connection - this is OK for initial setup
         tracing::debug!(path = %self.database_path.display(), "creating initial DuckDB connection");
-        duckdb::Connection::open(self.database_path.clone())
-            .map_err(|e| SemaflowError::Execution(format!("open duckdb: {e}")))
+        self.open_connection()
+    }
+
+    /// Run `f` on a pooled connection on the blocking thread pool.
+    ///
+    /// The connection is returned to the pool whether or not `f` succeeds, so a
+    /// failed query does not cost the next caller a fresh connection.
+    async fn with_connection<T, F>(&self, f: F) -> Result<T>
+    where
+        T: Send + 'static,
+        F: FnOnce(&duckdb::Connection) -> Result<T> + Send + 'static,
+    {
+        let conn = self.checkout_connection().await?;
+        let (result, conn) = tokio::task::spawn_blocking(move || {
+            let result = f(&conn);
+            (result, conn)
+        })
+        .await
+        .map_err(|e| SemaflowError::Execution(format!("task join error: {e}")))?;
+        self.idle().push(conn);
+        result
     }
 
     /// Register an Arrow table in DuckDB by creating a table from schema and appending batches.
@@ -159,7 +293,6 @@ impl DuckDbConnection {
         let schema = schema.clone();
         // Use get_or_create since this might be the first call (pool empty)
         let conn = self.get_or_create_connection().await?;
-        let pool = self.pool.clone();
 
         let result = tokio::task::spawn_blocking(move || -> Result<duckdb::Connection> {
             let start = Instant::now();
@@ -195,11 +328,7 @@ impl DuckDbConnection {
         .await
         .map_err(|e| SemaflowError::Execution(format!("task join error: {e}")))?;
 
-        let conn = result?;
-        {
-            let mut guard = pool.lock().await;
-            guard.push(conn);
-        }
+        self.idle().push(result?);
         Ok(())
     }
 }
@@ -253,129 +382,124 @@ impl BackendConnection for DuckDbConnection {
 
     async fn fetch_schema(&self, table: &str) -> Result<TableSchema> {
         let table = table.to_string();
-        let conn = self.checkout_connection().await?;
-        let pool = self.pool.clone();
-        let result =
-            tokio::task::spawn_blocking(move || -> Result<(TableSchema, duckdb::Connection)> {
-                let start = Instant::now();
-                let conn = conn;
-
-                let pragma_sql = format!("PRAGMA table_info('{table}')");
-                let mut stmt = conn.prepare(&pragma_sql)?;
-                let mut rows = stmt.query([])?;
-                let mut columns = Vec::new();
-                let mut primary_keys = Vec::new();
-                while let Some(row) = rows.next()? {
-                    let name: String = row.get("name")?;
-                    let data_type: String = row.get("type")?;
-                    let not_null: bool = row.get("notnull")?;
-                    let pk_flag: bool = row.get("pk")?;
-                    if pk_flag {
-                        primary_keys.push(name.clone());
-                    }
-                    columns.push(crate::schema_cache::ColumnSchema {
-                        name,
-                        data_type,
-                        nullable: !not_null,
-                    });
+        self.with_connection(move |conn| {
+            let start = Instant::now();
+
+            let pragma_sql = format!("PRAGMA table_info('{table}')");
+            let mut stmt = conn.prepare(&pragma_sql)?;
+            let mut rows = stmt.query([])?;
+            let mut columns = Vec::new();
+            let mut primary_keys = Vec::new();
+            while let Some(row) = rows.next()? {
+                let name: String = row.get("name")?;
+                let data_type: String = row.get("type")?;
+                let not_null: bool = row.get("notnull")?;
+                let pk_flag: bool = row.get("pk")?;
+                if pk_flag {
+                    primary_keys.push(name.clone());
                 }
+                columns.push(crate::schema_cache::ColumnSchema {
+                    name,
+                    data_type,
+                    nullable: !not_null,
+                });
+            }
 
-                let mut foreign_keys = Vec::new();
-                let fk_sql = format!("PRAGMA foreign_key_list('{table}')");
-                if let Ok(mut fk_stmt) = conn.prepare(&fk_sql) {
-                    let mut fk_rows = fk_stmt.query([])?;
-                    while let Some(row) = fk_rows.next()? {
-                        let from_column: String = row.get("from")?;
-                        let to_table: String = row.get("table")?;
-                        let to_column: String = row.get("to")?;
-                        foreign_keys.push(ForeignKey {
-                            from_column,
-                            to_table,
-                            to_column,
-                        });
-                    }
+            let mut foreign_keys = Vec::new();
+            let fk_sql = format!("PRAGMA foreign_key_list('{table}')");
+            if let Ok(mut fk_stmt) = conn.prepare(&fk_sql) {
+                let mut fk_rows = fk_stmt.query([])?;
+                while let Some(row) = fk_rows.next()? {
+                    let from_column: String = row.get("from")?;
+                    let to_table: String = row.get("table")?;
+                    let to_column: String = row.get("to")?;
+                    foreign_keys.push(ForeignKey {
+                        from_column,
+                        to_table,
+                        to_column,
+                    });
                 }
+            }
 
-                let elapsed = start.elapsed();
-                tracing::debug!(
-                    table = table.as_str(),
-                    ms = elapsed.as_millis(),
-                    "duckdb fetch_schema"
-                );
-                Ok((
-                    TableSchema {
-                        columns,
-                        primary_keys,
-                        foreign_keys,
-                    },
-                    conn,
-                ))
+            let elapsed = start.elapsed();
+            tracing::debug!(
+                table = table.as_str(),
+                ms = elapsed.as_millis(),
+                "duckdb fetch_schema"
+            );
+            Ok(TableSchema {
+                columns,
+                primary_keys,
+                foreign_keys,
             })
-            .await
-            .map_err(|e| SemaflowError::Execution(format!("task join error: {e}")))?;
-
-        let (schema, conn) = result?;
-        {
-            let mut guard = pool.lock().await;
-            guard.push(conn);
-        }
-        Ok(schema)
+        })
+        .await
     }
 
     async fn execute_sql(&self, sql: &str) -> Result<QueryResult> {
         let sql = sql.to_string();
         let _permit = self.acquire_slot().await?;
-        let conn = self.checkout_connection().await?;
-        let pool = self.pool.clone();
-        let result =
-            tokio::task::spawn_blocking(move || -> Result<(QueryResult, duckdb::Connection)> {
-                let start = Instant::now();
-                let conn = conn;
-                let mut stmt = conn.prepare(&sql)?;
-                let mut rows_iter = stmt.query([])?;
-                let stmt_ref = rows_iter
-                    .as_ref()
-                    .ok_or_else(|| SemaflowError::Execution("statement missing".to_string()))?;
-                let mut column_names = Vec::new();
-                for idx in 0..stmt_ref.column_count() {
-                    let name = stmt_ref
-                        .column_name(idx)
-                        .map_err(|e| SemaflowError::Execution(e.to_string()))?;
-                    column_names.push(name.to_string());
-                }
-                let mut rows = Vec::new();
-                while let Some(row) = rows_iter.next()? {
-                    let mut map = serde_json::Map::new();
-                    for (idx, name) in column_names.iter().enumerate() {
-                        let value =
-                            crate::executor::duck_value_to_json(row.get_ref(idx)?.to_owned());
-                        map.insert(name.clone(), value);
-                    }
-                    rows.push(map);
+        self.with_connection(move |conn| {
+            let start = Instant::now();
+            let mut stmt = conn.prepare(&sql)?;
+            let mut rows_iter = stmt.query([])?;
+            let stmt_ref = rows_iter
+                .as_ref()
+                .ok_or_else(|| SemaflowError::Execution("statement missing".to_string()))?;
+            let mut column_names = Vec::new();
+            for idx in 0..stmt_ref.column_count() {
+                let name = stmt_ref
+                    .column_name(idx)
+                    .map_err(|e| SemaflowError::Execution(e.to_string()))?;
+                column_names.push(name.to_string());
+            }
+            let mut rows = Vec::new();
+            while let Some(row) = rows_iter.next()? {
+                let mut map = serde_json::Map::new();
+                for (idx, name) in column_names.iter().enumerate() {
+                    let value = crate::executor::duck_value_to_json(row.get_ref(idx)?.to_owned());
+                    map.insert(name.clone(), value);
                 }
+                rows.push(map);
+            }
 
-                let columns: Vec<_> = column_names
-                    .into_iter()
-                    .map(|name| ColumnMeta { name })
-                    .collect();
-                let elapsed = start.elapsed();
-                tracing::debug!(
-                    rows = rows.len(),
-                    columns = columns.len(),
-                    ms = elapsed.as_millis(),
-                    "duckdb execute_sql"
-                );
-                Ok((QueryResult { columns, rows }, conn))
-            })
-            .await
-            .map_err(|e| SemaflowError::Execution(format!("task join error: {e}")))?;
+            let columns: Vec<_> = column_names
+                .into_iter()
+                .map(|name| ColumnMeta { name })
+                .collect();
+            let elapsed = start.elapsed();
+            tracing::debug!(
+                rows = rows.len(),
+                columns = columns.len(),
+                ms = elapsed.as_millis(),
+                "duckdb execute_sql"
+            );
+            Ok(QueryResult { columns, rows })
+        })
+        .await
+    }
 
-        let (result, conn) = result?;
-        {
-            let mut guard = pool.lock().await;
-            guard.push(conn);
-        }
-        Ok(result)
+    async fn execute_sql_arrow(&self, sql: &str) -> Result<ArrowResult> {
+        let sql = sql.to_string();
+        let _permit = self.acquire_slot().await?;
+        self.with_connection(move |conn| {
+            let start = Instant::now();
+            let mut stmt = conn.prepare(&sql)?;
+            let arrow = stmt.query_arrow([])?;
+            let schema = arrow.get_schema();
+            let result = ArrowResult {
+                schema,
+                batches: arrow.collect(),
+            };
+            tracing::debug!(
+                rows = result.num_rows(),
+                batches = result.batches.len(),
+                ms = start.elapsed().as_millis(),
+                "duckdb execute_sql_arrow"
+            );
+            Ok(result)
+        })
+        .await
     }
 
     async fn execute_sql_paginated(
@@ -394,30 +518,71 @@ impl BackendConnection for DuckDbConnection {
             None => 0,
         };
 
-        // Fetch page_size + 1 to detect if more rows exist
-        let fetch_limit = page_size as u64 + 1;
-        let paginated_sql = format!("{sql} LIMIT {fetch_limit} OFFSET {offset}");
+        // Serve from rows an earlier page already fetched when they are enough to
+        // fill this page and say whether another follows.
+        let page = page_size as usize;
+        let buffered = self
+            .take_read_ahead(query_hash, offset)
+            .filter(|b| b.complete || b.rows.len() > page);
+        let (columns, mut rows, complete, fetched_at) = match buffered {
+            Some(buffer) => {
+                tracing::debug!(
+                    page_size = page_size,
+                    offset = offset,
+                    "serving DuckDB page from read-ahead"
+                );
+                (
+                    buffer.columns,
+                    buffer.rows,
+                    buffer.complete,
+                    buffer.fetched_at,
+                )
+            }
+            None => {
+                // Callers already walking the result (they sent a cursor) get several
+                // pages fetched at once, within the buffer budget; the extra row
+                // shows whether more exist.
+                let read_ahead = cursor.is_some()
+                    && page_size as u64 * READ_AHEAD_PAGES <= READ_AHEAD_MAX_ROWS as u64;
+                let pages = if read_ahead { READ_AHEAD_PAGES } else { 1 };
+                let fetch_limit = page_size as u64 * pages + 1;
+                let paginated_sql = format!("{sql} LIMIT {fetch_limit} OFFSET {offset}");
 
-        tracing::debug!(
-            page_size = page_size,
-            offset = offset,
-            "executing paginated DuckDB query"
-        );
+                tracing::debug!(
+                    page_size = page_size,
+                    offset = offset,
+                    "executing paginated DuckDB query"
+                );
 
-        // Execute the paginated query
-        let result = self.execute_sql(&paginated_sql).await?;
+                let fetched_at = Instant::now();
+                let result = self.execute_sql(&paginated_sql).await?;
+                let complete = (result.rows.len() as u64) < fetch_limit;
+                (result.columns, result.rows, complete, fetched_at)
+            }
+        };
 
-        // Determine if there are more rows
-        let has_more = result.rows.len() > page_size as usize;
-        let rows = if has_more {
-            result.rows.into_iter().take(page_size as usize).collect()
+        // Keep the rows past this page for the next request
+        let rest = if rows.len() > page {
+            rows.split_off(page)
         } else {
-            result.rows
+            Vec::new()
         };
+        let has_more = !rest.is_empty();
 
         // Build next cursor if there are more rows
         let next_cursor = if has_more {
             let next_offset = offset + page_size as u64;
+            // A lone look-ahead row cannot fill the next page, so keep only useful buffers
+            if complete || rest.len() > page {
+                self.store_read_ahead(ReadAhead {
+                    query_hash,
+                    offset: next_offset,
+                    columns: columns.clone(),
+                    rows: rest,
+                    complete,
+                    fetched_at,
+                });
+            }
             let cursor = Cursor::sql(next_offset, query_hash);
             Some(cursor.encode()?)
         } else {
@@ -425,7 +590,7 @@ impl BackendConnection for DuckDbConnection {
         };
 
         Ok(PaginatedResult {
-            columns: result.columns,
+            columns,
             rows,
             cursor: next_cursor,
             has_more,
@@ -10,6 +10,8 @@ use async_trait::async_trait;
 use crate::config::{ResolvedDatasourceConfig, SemaflowConfig};
 use crate::dialect::Dialect;
 use crate::error::Result;
+#[cfg(feature = "duckdb")]
+use crate::executor::ArrowResult;
 use crate::executor::{PaginatedResult, QueryResult};
 use crate::pagination::Cursor;
 use crate::schema_cache::TableSchema;
@@ -21,6 +23,24 @@ pub trait BackendConnection: Send + Sync {
     async fn fetch_schema(&self, table: &str) -> Result<TableSchema>;
     async fn execute_sql(&self, sql: &str) -> Result<QueryResult>;
 
+    /// Execute SQL that the caller will run repeatedly (e.g. a `PreparedQuery`).
+    ///
+    /// The default defers to `execute_sql`; backends with server-side statement
+    /// caching (PostgreSQL) override this so only genuinely reused SQL is cached.
+    async fn execute_prepared_sql(&self, sql: &str) -> Result<QueryResult> {
+        self.execute_sql(sql).await
+    }
+
+    /// Execute SQL and return columnar Arrow batches.
+    ///
+    /// The default converts the row-oriented `execute_sql` result; backends that
+    /// produce Arrow natively (DuckDB) override this to skip the row round-trip.
+    #[cfg(feature = "duckdb")]
+    async fn execute_sql_arrow(&self, sql: &str) -> Result<ArrowResult> {
+        let result = self.execute_sql(sql).await?;
+        crate::executor::rows_to_arrow(&result)
+    }
+
     /// Execute SQL with pagination support.
     ///
     /// # Arguments
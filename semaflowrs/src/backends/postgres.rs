@@ -107,6 +107,82 @@ impl PostgresConnection {
     pub fn schema(&self) -> &str {
         &self.schema
     }
+
+    /// Run a query on a pooled connection.
+    ///
+    /// With `cache_statement`, the statement is prepared once per connection via
+    /// deadpool's statement cache so repeated SQL skips the server-side parse and
+    /// plan round-trip. The cache is unbounded, so only SQL that is known to be
+    /// reused (prepared queries) should opt in; ad-hoc SQL with inlined filter
+    /// literals goes through a plain unnamed query.
+    async fn query_rows(&self, sql: &str, cache_statement: bool) -> Result<QueryResult> {
+        let start = Instant::now();
+        let pool_status = self.pool.status();
+        tracing::debug!(
+            available = pool_status.available,
+            size = pool_status.size,
+            max_size = pool_status.max_size,
+            sql_len = sql.len(),
+            "acquiring PostgreSQL connection for query"
+        );
+        tracing::trace!(sql = %sql, "executing PostgreSQL query");
+
+        let client = self.pool.get().await.map_err(|e| {
+            tracing::error!(error = %e, "failed to get PostgreSQL connection");
+            SemaflowError::Execution(format!("get postgres connection: {e}"))
+        })?;
+
+        let rows = if cache_statement {
+            let stmt = client.prepare_cached(sql).await.map_err(|e| {
+                tracing::error!(error = %e, "PostgreSQL statement preparation failed");
+                SemaflowError::Execution(format!("prepare query: {e}"))
+            })?;
+            client.query(&stmt, &[]).await
+        } else {
+            client.query(sql, &[]).await
+        }
+        .map_err(|e| {
+            tracing::error!(error = %e, "PostgreSQL query execution failed");
+            SemaflowError::Execution(format!("execute query: {e}"))
+        })?;
+
+        // Convert rows to JSON
+        let mut result_rows = Vec::new();
+        let mut columns: Vec<ColumnMeta> = Vec::new();
+
+        if let Some(first_row) = rows.first() {
+            // Get column metadata from first row
+            columns = first_row
+                .columns()
+                .iter()
+                .map(|col| ColumnMeta {
+                    name: col.name().to_string(),
+                })
+                .collect();
+        }
+
+        for row in &rows {
+            let mut map = serde_json::Map::new();
+            for (idx, col) in row.columns().iter().enumerate() {
+                let value = pg_value_to_json(row, idx, col);
+                map.insert(col.name().to_string(), value);
+            }
+            result_rows.push(map);
+        }
+
+        let elapsed = start.elapsed();
+        tracing::debug!(
+            rows = result_rows.len(),
+            columns = columns.len(),
+            ms = elapsed.as_millis(),
+            "postgres execute_sql"
+        );
+
+        Ok(QueryResult {
+            columns,
+            rows: result_rows,
+        })
+    }
 }
 
 #[async_trait]
@@ -217,63 +293,11 @@ impl BackendConnection for PostgresConnection {
     }
 
     async fn execute_sql(&self, sql: &str) -> Result<QueryResult> {
-        let start = Instant::now();
-        let pool_status = self.pool.status();
-        tracing::debug!(
-            available = pool_status.available,
-            size = pool_status.size,
-            max_size = pool_status.max_size,
-            sql_len = sql.len(),
-            "acquiring PostgreSQL connection for query"
-        );
-        tracing::trace!(sql = %sql, "executing PostgreSQL query");
-
-        let client = self.pool.get().await.map_err(|e| {
-            tracing::error!(error = %e, "failed to get PostgreSQL connection");
-            SemaflowError::Execution(format!("get postgres connection: {e}"))
-        })?;
-
-        let rows = client.query(sql, &[]).await.map_err(|e| {
-            tracing::error!(error = %e, "PostgreSQL query execution failed");
-            SemaflowError::Execution(format!("execute query: {e}"))
-        })?;
-
-        // Convert rows to JSON
-        let mut result_rows = Vec::new();
-        let mut columns: Vec<ColumnMeta> = Vec::new();
-
-        if let Some(first_row) = rows.first() {
-            // Get column metadata from first row
-            columns = first_row
-                .columns()
-                .iter()
-                .map(|col| ColumnMeta {
-                    name: col.name().to_string(),
-                })
-                .collect();
-        }
-
-        for row in &rows {
-            let mut map = serde_json::Map::new();
-            for (idx, col) in row.columns().iter().enumerate() {
-                let value = pg_value_to_json(row, idx, col);
-                map.insert(col.name().to_string(), value);
-            }
-            result_rows.push(map);
-        }
-
-        let elapsed = start.elapsed();
-        tracing::debug!(
-            rows = result_rows.len(),
-            columns = columns.len(),
-            ms = elapsed.as_millis(),
-            "postgres execute_sql"
-        );
+        self.query_rows(sql, false).await
+    }
 
-        Ok(QueryResult {
-            columns,
-            rows: result_rows,
-        })
+    async fn execute_prepared_sql(&self, sql: &str) -> Result<QueryResult> {
+        self.query_rows(sql, true).await
     }
 
     async fn execute_sql_paginated(
@@ -303,7 +327,7 @@ impl BackendConnection for PostgresConnection {
         );
 
         // Execute the paginated query
-        let result = self.execute_sql(&paginated_sql).await?;
+        let result = self.query_rows(&paginated_sql, false).await?;
 
         // Determine if there are more rows
         let has_more = result.rows.len() > page_size as usize;
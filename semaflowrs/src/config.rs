@@ -116,6 +116,10 @@ pub struct BigQueryConfig {
 pub struct DuckDbConfig {
     /// Maximum concurrent queries (default: 16).
     pub max_concurrency: usize,
+    /// DuckDB worker threads per query (default: DuckDB's own choice, all cores).
+    pub threads: Option<usize>,
+    /// DuckDB memory limit, e.g. "4GB" (default: DuckDB's own choice, 80% of RAM).
+    pub memory_limit: Option<String>,
 }
 
 /// PostgreSQL-specific configuration.
@@ -174,6 +178,8 @@ impl Default for DuckDbConfig {
     fn default() -> Self {
         Self {
             max_concurrency: 16,
+            threads: None,
+            memory_limit: None,
         }
     }
 }
@@ -314,6 +320,21 @@ maximum_bytes_billed = 1073741824
         assert_eq!(resolved.bigquery.maximum_bytes_billed, 1073741824);
     }
 
+    #[test]
+    fn test_parse_duckdb_settings() {
+        let toml = r#"
+[datasources.local.duckdb]
+threads = 4
+memory_limit = "4GB"
+"#;
+        let cfg = SemaflowConfig::from_toml(toml).unwrap();
+        let resolved = cfg.for_datasource("local");
+        assert_eq!(resolved.duckdb.max_concurrency, 16);
+        assert_eq!(resolved.duckdb.threads, Some(4));
+        assert_eq!(resolved.duckdb.memory_limit.as_deref(), Some("4GB"));
+        assert_eq!(cfg.for_datasource("other").duckdb.threads, None);
+    }
+
     #[test]
     fn test_datasource_override() {
         let toml = r#"
@@ -30,6 +30,65 @@ pub struct PaginatedResult {
     pub total_rows: Option<u64>,
 }
 
+/// Columnar query result: Arrow record batches plus their shared schema.
+#[cfg(feature = "duckdb")]
+#[derive(Debug, Clone)]
+pub struct ArrowResult {
+    pub schema: arrow::datatypes::SchemaRef,
+    pub batches: Vec<arrow::array::RecordBatch>,
+}
+
+#[cfg(feature = "duckdb")]
+impl ArrowResult {
+    pub fn num_rows(&self) -> usize {
+        self.batches.iter().map(|b| b.num_rows()).sum()
+    }
+}
+
+/// Rows decoded per record batch when converting row-oriented results.
+#[cfg(feature = "duckdb")]
+const ARROW_BATCH_SIZE: usize = 8192;
+
+/// Convert a row-oriented result into Arrow, inferring column types from the values.
+///
+/// Used by backends without a native Arrow path. Columns keep the order reported by
+/// the backend; a column with no non-null values becomes a null-typed column.
+#[cfg(feature = "duckdb")]
+pub fn rows_to_arrow(result: &QueryResult) -> crate::error::Result<ArrowResult> {
+    use arrow::datatypes::{DataType, Field, Schema};
+    use arrow::json::reader::{infer_json_schema_from_iterator, ReaderBuilder};
+    use std::sync::Arc;
+
+    let arrow_err =
+        |e: arrow::error::ArrowError| crate::error::SemaflowError::Execution(e.to_string());
+    let inferred = infer_json_schema_from_iterator(
+        result.rows.iter().map(|row| Ok(Value::Object(row.clone()))),
+    )
+    .map_err(arrow_err)?;
+    let fields: Vec<Field> = result
+        .columns
+        .iter()
+        .map(|col| match inferred.field_with_name(&col.name) {
+            Ok(field) => field.clone().with_nullable(true),
+            Err(_) => Field::new(&col.name, DataType::Null, true),
+        })
+        .collect();
+    let schema = Arc::new(Schema::new(fields));
+
+    let mut decoder = ReaderBuilder::new(schema.clone())
+        .with_batch_size(ARROW_BATCH_SIZE)
+        .build_decoder()
+        .map_err(arrow_err)?;
+    let mut batches = Vec::new();
+    for chunk in result.rows.chunks(ARROW_BATCH_SIZE) {
+        decoder.serialize(chunk).map_err(arrow_err)?;
+        if let Some(batch) = decoder.flush().map_err(arrow_err)? {
+            batches.push(batch);
+        }
+    }
+    Ok(ArrowResult { schema, batches })
+}
+
 #[cfg(feature = "duckdb")]
 pub(crate) fn duck_value_to_json(value: DuckValue) -> Value {
     match value {
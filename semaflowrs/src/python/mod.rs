@@ -3,7 +3,7 @@
 #[cfg(feature = "duckdb")]
 use crate::backends::DuckDbConnection;
 use crate::{
-    backends::ConnectionManager,
+    backends::{BackendConnection, ConnectionManager},
     config::{BigQueryConfig, DatasourceConfig, DuckDbConfig, PostgresConfig, SemaflowConfig},
     flows::{
         Aggregation, Dimension, Expr, FlowJoin, FlowTableRef, SemanticFlow as CoreSemanticFlow,
@@ -11,16 +11,20 @@ use crate::{
     },
     query_builder::SqlBuilder,
     registry::FlowRegistry,
-    runtime::{run_query, run_query_paginated},
+    runtime::{connection_for_flow, run_query, run_query_paginated},
     validation::Validator,
     QueryRequest, SemaflowError,
 };
 #[cfg(feature = "duckdb")]
-use arrow::array::RecordBatchReader;
+use crate::{executor::ArrowResult, runtime::run_query_arrow};
+#[cfg(feature = "duckdb")]
+use arrow::array::{RecordBatchIterator, RecordBatchReader};
+#[cfg(feature = "duckdb")]
+use arrow::pyarrow::PyArrowType;
 use once_cell::sync::OnceCell;
 use pyo3::exceptions::{PyRuntimeError, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::{PyAny, PyDict, PyList};
+use pyo3::types::{PyAny, PyBytes, PyDict, PyList};
 use std::collections::BTreeMap;
 use std::sync::Arc;
 use std::time::Instant;
@@ -126,6 +130,9 @@ pub struct PyDataSource {
     pub backend_type: String,
     #[pyo3(get)]
     pub schema: Option<String>,
+    /// DuckDB worker threads per query (`None` keeps the config/DuckDB default).
+    #[pyo3(get)]
+    pub threads: Option<usize>,
 
     /// Pre-created DuckDB connection (used when register_dataframe is called).
     /// This allows the connection to be reused in build_data_sources().
@@ -144,6 +151,7 @@ impl PyDataSource {
             max_concurrency,
             backend_type: "duckdb".to_string(),
             schema: None,
+            threads: None,
             #[cfg(feature = "duckdb")]
             duckdb_conn: None,
         }
@@ -158,15 +166,23 @@ impl PyDataSource {
     ///           to pre-populate data with Python duckdb before querying via SemaFlow.
     ///     name: Optional data source name (defaults to "duckdb")
     ///     max_concurrency: Optional max concurrent queries
+    ///     threads: Optional DuckDB worker threads per query; queries already run
+    ///              off the event loop, so this bounds how many cores each one uses
     #[staticmethod]
-    #[pyo3(signature = (path, name=None, max_concurrency=None))]
-    fn duckdb(path: String, name: Option<String>, max_concurrency: Option<usize>) -> Self {
+    #[pyo3(signature = (path, name=None, max_concurrency=None, threads=None))]
+    fn duckdb(
+        path: String,
+        name: Option<String>,
+        max_concurrency: Option<usize>,
+        threads: Option<usize>,
+    ) -> Self {
         Self {
             name: name.unwrap_or_else(|| "duckdb".to_string()),
             uri: path,
             max_concurrency,
             backend_type: "duckdb".to_string(),
             schema: None,
+            threads,
             #[cfg(feature = "duckdb")]
             duckdb_conn: None,
         }
@@ -193,6 +209,7 @@ impl PyDataSource {
             max_concurrency,
             backend_type: "postgres".to_string(),
             schema: Some(schema),
+            threads: None,
             #[cfg(feature = "duckdb")]
             duckdb_conn: None,
         }
@@ -225,6 +242,7 @@ impl PyDataSource {
             max_concurrency: None,
             backend_type: "bigquery".to_string(),
             schema: Some(dataset),
+            threads: None,
             #[cfg(feature = "duckdb")]
             duckdb_conn: None,
         }
@@ -275,6 +293,8 @@ impl PyDataSource {
             None => {
                 let config = DuckDbConfig {
                     max_concurrency: self.max_concurrency.unwrap_or(4),
+                    threads: self.threads,
+                    ..DuckDbConfig::default()
                 };
                 let new_conn = Arc::new(DuckDbConnection::with_config(&self.uri, config));
                 self.duckdb_conn = Some(new_conn.clone());
@@ -624,9 +644,18 @@ fn parse_flows(obj: &Bound<'_, PyAny>) -> PyResult<Vec<CoreSemanticFlow>> {
     ))
 }
 
-fn parse_request(py: Python<'_>, obj: &Bound<'_, PyAny>) -> PyResult<QueryRequest> {
-    let s = dumps(py, obj)?;
-    serde_json::from_str(&s).map_err(py_err)
+// Requests are parsed on every call, so deserialize straight from the Python
+// objects instead of round-tripping through `json.dumps`. A pre-encoded JSON
+// `bytes` body is read in place without walking any Python objects.
+fn decode_request(obj: &Bound<'_, PyAny>) -> Result<QueryRequest, String> {
+    if let Ok(body) = obj.downcast::<PyBytes>() {
+        return serde_json::from_slice(body.as_bytes()).map_err(|err| err.to_string());
+    }
+    pythonize::depythonize(obj).map_err(|err| err.to_string())
+}
+
+fn parse_request(obj: &Bound<'_, PyAny>) -> PyResult<QueryRequest> {
+    decode_request(obj).map_err(py_err)
 }
 
 fn build_registry(tables: Vec<SemanticTable>, flows: Vec<CoreSemanticFlow>) -> FlowRegistry {
@@ -663,6 +692,8 @@ fn build_data_sources(
                             max_concurrency: item
                                 .max_concurrency
                                 .unwrap_or(resolved.duckdb.max_concurrency),
+                            threads: item.threads.or(resolved.duckdb.threads),
+                            ..resolved.duckdb.clone()
                         };
                         let conn = DuckDbConnection::with_config(item.uri.clone(), duck_config);
                         // Initialize pool so checkout_connection works
@@ -755,9 +786,7 @@ fn build_data_sources(
         let mut ds = ConnectionManager::with_config(auto_config);
         for (name, path) in dict {
             let resolved = ds.config_for(&name);
-            let duck_config = crate::config::DuckDbConfig {
-                max_concurrency: resolved.duckdb.max_concurrency,
-            };
+            let duck_config = resolved.duckdb.clone();
             ds.insert(
                 name,
                 Arc::new(DuckDbConnection::with_config(path, duck_config)),
@@ -809,7 +838,7 @@ fn build_sql(
     let start = Instant::now();
     let tables = parse_tables(py, tables)?;
     let flows = parse_flows(flows)?;
-    let request = parse_request(py, request)?;
+    let request = parse_request(request)?;
     let registry = build_registry(tables, flows);
     let ds = build_data_sources(data_sources, None)?;
     let builder = SqlBuilder::default();
@@ -836,7 +865,7 @@ fn run(
     let start = Instant::now();
     let tables = parse_tables(py, tables)?;
     let flows = parse_flows(flows)?;
-    let request = parse_request(py, request)?;
+    let request = parse_request(request)?;
     let mut registry = build_registry(tables, flows);
     let ds = build_data_sources(data_sources, None)?;
     let validator = Validator::new(ds.clone(), false);
@@ -878,6 +907,7 @@ fn semaflow(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(run, m)?)?;
 
     m.add_class::<SemanticFlowHandle>()?;
+    m.add_class::<PyPreparedQuery>()?;
     m.add_class::<PyConfig>()?;
     Ok(())
 }
@@ -1011,8 +1041,16 @@ impl PyConfig {
     /// Args:
     ///     datasource_name: Name of the datasource
     ///     max_concurrency: Maximum concurrent queries
-    #[pyo3(signature = (datasource_name, max_concurrency=None))]
-    fn set_duckdb_config(&mut self, datasource_name: &str, max_concurrency: Option<usize>) {
+    ///     threads: DuckDB worker threads per query
+    ///     memory_limit: DuckDB memory limit (e.g. "4GB")
+    #[pyo3(signature = (datasource_name, max_concurrency=None, threads=None, memory_limit=None))]
+    fn set_duckdb_config(
+        &mut self,
+        datasource_name: &str,
+        max_concurrency: Option<usize>,
+        threads: Option<usize>,
+        memory_limit: Option<String>,
+    ) {
         let ds_config = self
             .inner
             .datasources
@@ -1023,6 +1061,12 @@ impl PyConfig {
         if let Some(max) = max_concurrency {
             duck.max_concurrency = max;
         }
+        if threads.is_some() {
+            duck.threads = threads;
+        }
+        if memory_limit.is_some() {
+            duck.memory_limit = memory_limit;
+        }
     }
 
     /// Configure PostgreSQL settings for a specific datasource.
@@ -1056,6 +1100,93 @@ impl PyConfig {
     }
 }
 
+/// A request compiled to SQL and bound to the data source that serves its flow.
+#[pyclass(name = "PreparedQuery", module = "semaflow.semaflow")]
+#[derive(Clone)]
+pub struct PyPreparedQuery {
+    #[pyo3(get)]
+    flow: String,
+    #[pyo3(get)]
+    sql: String,
+    connection: Arc<dyn BackendConnection>,
+}
+
+impl PyPreparedQuery {
+    /// Run the compiled SQL and return rows (list[dict]).
+    ///
+    /// With `cache_statement`, backends that support it (PostgreSQL) keep a
+    /// server-side prepared statement for the SQL on the pooled connection.
+    fn run_rows(&self, py: Python<'_>, cache_statement: bool) -> PyResult<PyObject> {
+        let start = Instant::now();
+        let rows_json: String = py
+            .allow_threads(|| {
+                runtime().block_on(async {
+                    let result = if cache_statement {
+                        self.connection.execute_prepared_sql(&self.sql).await?
+                    } else {
+                        self.connection.execute_sql(&self.sql).await?
+                    };
+                    serde_json::to_string(&result.rows).map_err(SemaflowError::from)
+                })
+            })
+            .map_err(to_validation_err)?;
+        let json = py.import("json")?;
+        let py_obj = json.call_method1("loads", (rows_json,))?;
+        tracing::debug!(
+            flow = %self.flow,
+            ms = start.elapsed().as_millis(),
+            "prepared execute complete"
+        );
+        Ok(py_obj.unbind())
+    }
+}
+
+#[pymethods]
+impl PyPreparedQuery {
+    /// Execute the compiled SQL and return rows (list[dict]).
+    ///
+    /// Use for SQL that runs repeatedly: on PostgreSQL the statement is
+    /// prepared once per pooled connection and kept for the connection's life.
+    #[pyo3(text_signature = "(self)")]
+    fn execute(&self, py: Python<'_>) -> PyResult<PyObject> {
+        self.run_rows(py, true)
+    }
+
+    /// Execute the compiled SQL like `execute`, without caching a server-side
+    /// statement. Use for ad-hoc requests whose SQL may never repeat.
+    #[pyo3(text_signature = "(self)")]
+    fn execute_once(&self, py: Python<'_>) -> PyResult<PyObject> {
+        self.run_rows(py, false)
+    }
+
+    /// Execute the compiled SQL and return a pyarrow RecordBatchReader.
+    #[cfg(feature = "duckdb")]
+    #[pyo3(text_signature = "(self)")]
+    fn execute_arrow(
+        &self,
+        py: Python<'_>,
+    ) -> PyResult<PyArrowType<Box<dyn RecordBatchReader + Send>>> {
+        let start = Instant::now();
+        let result = py
+            .allow_threads(|| runtime().block_on(self.connection.execute_sql_arrow(&self.sql)))
+            .map_err(to_validation_err)?;
+        tracing::debug!(
+            flow = %self.flow,
+            ms = start.elapsed().as_millis(),
+            rows = result.num_rows(),
+            "prepared execute_arrow complete"
+        );
+        Ok(arrow_reader(result))
+    }
+}
+
+/// Wrap an Arrow result as a reader pyarrow can import over the C stream interface.
+#[cfg(feature = "duckdb")]
+fn arrow_reader(result: ArrowResult) -> PyArrowType<Box<dyn RecordBatchReader + Send>> {
+    let reader = RecordBatchIterator::new(result.batches.into_iter().map(Ok), result.schema);
+    PyArrowType(Box::new(reader))
+}
+
 #[pyclass(name = "SemanticFlowHandle", module = "semaflow.semaflow")]
 #[derive(Clone)]
 pub struct SemanticFlowHandle {
@@ -1098,7 +1229,8 @@ impl SemanticFlowHandle {
         data_sources: &Bound<'_, PyAny>,
         config: Option<PyConfig>,
     ) -> PyResult<Self> {
-        let mut registry = FlowRegistry::load_from_dir(flow_dir).map_err(to_validation_err)?;
+        let mut registry =
+            FlowRegistry::load_from_dir_cached(flow_dir).map_err(to_validation_err)?;
         let cfg = config.as_ref().map(|c| &c.inner);
         let connections = build_data_sources(data_sources, cfg)?;
         let validator = Validator::new(connections.clone(), false);
@@ -1141,7 +1273,7 @@ impl SemanticFlowHandle {
     #[pyo3(text_signature = "(self, request)")]
     fn build_sql(&self, py: Python<'_>, request: &Bound<'_, PyAny>) -> PyResult<String> {
         let start = Instant::now();
-        let request = parse_request(py, request)?;
+        let request = parse_request(request)?;
         let builder = SqlBuilder::default();
         let registry = self.registry.clone();
         let sql = py
@@ -1151,6 +1283,36 @@ impl SemanticFlowHandle {
         Ok(sql)
     }
 
+    /// Compile a request dict to SQL once and bind it to the flow's data source.
+    ///
+    /// The returned `PreparedQuery` executes the stored SQL directly, skipping
+    /// request parsing and SQL generation on every call.
+    #[pyo3(text_signature = "(self, request)")]
+    fn prepare(&self, py: Python<'_>, request: &Bound<'_, PyAny>) -> PyResult<PyPreparedQuery> {
+        let start = Instant::now();
+        let request = parse_request(request)?;
+        if request.page_size.is_some() || request.cursor.is_some() {
+            return Err(PyValueError::new_err(
+                "prepared queries do not support pagination",
+            ));
+        }
+        let builder = SqlBuilder::default();
+        let sql = py
+            .allow_threads(|| {
+                builder.build_for_request(&self.registry, &self.connections, &request)
+            })
+            .map_err(to_validation_err)?;
+        let connection = connection_for_flow(&self.registry, &self.connections, &request.flow)
+            .map_err(to_validation_err)?
+            .clone();
+        tracing::debug!(ms = start.elapsed().as_millis(), "prepare complete");
+        Ok(PyPreparedQuery {
+            flow: request.flow,
+            sql,
+            connection,
+        })
+    }
+
     /// Execute a request dict and return results.
     ///
     /// If `page_size` is set in the request, returns a dict with pagination metadata:
@@ -1163,7 +1325,7 @@ impl SemanticFlowHandle {
     #[pyo3(text_signature = "(self, request)")]
     fn execute(&self, py: Python<'_>, request: &Bound<'_, PyAny>) -> PyResult<PyObject> {
         let start = Instant::now();
-        let request = parse_request(py, request)?;
+        let request = parse_request(request)?;
         let registry = self.registry.clone();
         let connections = self.connections.clone();
 
@@ -1218,6 +1380,92 @@ impl SemanticFlowHandle {
         }
     }
 
+    /// Execute several request dicts in one call and return one result per request.
+    ///
+    /// All queries run concurrently on the runtime inside a single GIL release.
+    /// Each element has the same shape `execute` returns; a request that fails
+    /// yields a `ValueError` instance in its slot instead of failing the batch.
+    #[pyo3(text_signature = "(self, requests)")]
+    fn execute_many(
+        &self,
+        py: Python<'_>,
+        requests: Vec<Bound<'_, PyAny>>,
+    ) -> PyResult<Vec<PyObject>> {
+        let start = Instant::now();
+        let parsed: Vec<Result<QueryRequest, String>> =
+            requests.iter().map(decode_request).collect();
+        let registry = &self.registry;
+        let connections = &self.connections;
+        let queries = parsed.iter().map(|request| async move {
+            let request = request.as_ref().map_err(Clone::clone)?;
+            let body = if request.page_size.is_some() {
+                let result = run_query_paginated(registry, connections, request)
+                    .await
+                    .map_err(|err| err.to_string())?;
+                serde_json::to_string(&serde_json::json!({
+                    "rows": result.rows,
+                    "cursor": result.cursor,
+                    "has_more": result.has_more,
+                    "total_rows": result.total_rows,
+                }))
+            } else {
+                let result = run_query(registry, connections, request)
+                    .await
+                    .map_err(|err| err.to_string())?;
+                serde_json::to_string(&result.rows)
+            };
+            body.map_err(|err| err.to_string())
+        });
+        let outcomes: Vec<Result<String, String>> =
+            py.allow_threads(|| runtime().block_on(futures::future::join_all(queries)));
+        let loads = py.import("json")?.getattr("loads")?;
+        let mut results = Vec::with_capacity(outcomes.len());
+        for outcome in outcomes {
+            results.push(match outcome {
+                Ok(body) => loads.call1((body,))?.unbind(),
+                Err(msg) => PyValueError::new_err(msg).into_value(py).into_any(),
+            });
+        }
+        tracing::debug!(
+            ms = start.elapsed().as_millis(),
+            requests = results.len(),
+            "execute_many complete"
+        );
+        Ok(results)
+    }
+
+    /// Execute a request dict and return results as a pyarrow RecordBatchReader.
+    ///
+    /// DuckDB hands its Arrow batches over the C data interface without building
+    /// per-row Python objects; other backends convert their rows to Arrow first.
+    /// Pagination is not supported on this path.
+    #[cfg(feature = "duckdb")]
+    #[pyo3(text_signature = "(self, request)")]
+    fn execute_arrow(
+        &self,
+        py: Python<'_>,
+        request: &Bound<'_, PyAny>,
+    ) -> PyResult<PyArrowType<Box<dyn RecordBatchReader + Send>>> {
+        let start = Instant::now();
+        let request = parse_request(request)?;
+        if request.page_size.is_some() || request.cursor.is_some() {
+            return Err(PyValueError::new_err(
+                "execute_arrow does not support pagination",
+            ));
+        }
+        let result = py
+            .allow_threads(|| {
+                runtime().block_on(run_query_arrow(&self.registry, &self.connections, &request))
+            })
+            .map_err(to_validation_err)?;
+        tracing::debug!(
+            ms = start.elapsed().as_millis(),
+            rows = result.num_rows(),
+            "execute_arrow complete"
+        );
+        Ok(arrow_reader(result))
+    }
+
     /// List flows with names/descriptions.
     #[pyo3(text_signature = "(self)")]
     fn list_flows(&self, py: Python<'_>) -> PyResult<PyObject> {
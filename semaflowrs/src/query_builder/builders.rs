@@ -13,6 +13,7 @@ use crate::sql_ast::{
 
 use super::components::{QueryComponents, ResolvedDimension, ResolvedMeasure};
 use super::measures::resolve_measure_with_posts;
+use super::resolve::unqualified_name;
 
 /// Convert a semantic JoinType to SQL JoinType.
 impl From<JoinType> for SqlJoinType {
@@ -46,9 +47,9 @@ pub fn build_measure_selects(
         measure_lookup.insert(m.name.clone(), (m.alias.as_str(), &m.measure));
 
         // Extract and insert unqualified name for post_expr references
-        let unqualified = extract_unqualified_name(&m.name);
+        let unqualified = unqualified_name(&m.name);
         measure_lookup
-            .entry(unqualified.clone())
+            .entry(unqualified.to_string())
             .or_insert((m.alias.as_str(), &m.measure));
 
         // Also insert fully qualified version if not already present
@@ -84,7 +85,7 @@ pub fn build_measure_selects(
 /// Build a JOIN clause from a FlowJoin.
 pub fn build_join(
     join: &FlowJoin,
-    alias_to_table: &HashMap<String, SemanticTable>,
+    alias_to_table: &HashMap<String, &SemanticTable>,
 ) -> Result<Join> {
     let join_table = alias_to_table.get(&join.alias).ok_or_else(|| {
         SemaflowError::Validation(format!(
@@ -131,10 +132,10 @@ pub fn build_preagg_measure_selects(
     for m in measures {
         if m.measure.post_expr.is_none() {
             // The CTE column uses unqualified name
-            let unqualified = extract_unqualified_name(&m.name);
+            let unqualified = unqualified_name(&m.name);
             let col = SqlExpr::Column {
                 table: Some(preagg_alias.to_string()),
-                name: unqualified.clone(),
+                name: unqualified.to_string(),
             };
 
             // Insert user-supplied name
@@ -142,7 +143,7 @@ pub fn build_preagg_measure_selects(
 
             // Insert unqualified name for post_expr references
             outer_base_exprs
-                .entry(unqualified.clone())
+                .entry(unqualified.to_string())
                 .or_insert_with(|| col.clone());
 
             // Insert fully qualified version
@@ -193,12 +194,3 @@ fn extract_order_column_name(expr: &SqlExpr) -> String {
         _ => "unknown".to_string(),
     }
 }
-
-/// Extract the unqualified name from a potentially qualified name like "alias.column".
-fn extract_unqualified_name(name: &str) -> String {
-    if let Some(pos) = name.find('.') {
-        name[pos + 1..].to_string()
-    } else {
-        name.to_string()
-    }
-}
@@ -87,7 +87,8 @@ use super::measures::{
 };
 use super::render::expr_to_sql;
 use super::resolve::{
-    build_alias_map, resolve_dimension, resolve_field_expression, resolve_measure, FieldKind,
+    build_alias_map, resolve_dimension, resolve_field_expression, resolve_measure,
+    unqualified_name, FieldKind,
 };
 use crate::expr_parser::parse_formula;
 
@@ -120,11 +121,14 @@ pub struct ResolvedFilter {
 }
 
 /// All resolved components needed to build a query.
+///
+/// Semantic tables are borrowed from the registry rather than cloned, so
+/// resolving a request does not copy every table's dimension/measure maps.
 #[derive(Clone, Debug)]
-pub struct QueryComponents {
+pub struct QueryComponents<'a> {
     pub base_alias: String,
     pub base_table: TableRef,
-    pub base_semantic_table: SemanticTable,
+    pub base_semantic_table: &'a SemanticTable,
     pub dimensions: Vec<ResolvedDimension>,
     pub measures: Vec<ResolvedMeasure>,
     pub base_measure_exprs: HashMap<String, SqlExpr>,
@@ -132,31 +136,26 @@ pub struct QueryComponents {
     pub order: Vec<OrderItem>,
     pub limit: Option<u64>,
     pub offset: Option<u64>,
-    pub alias_to_table: HashMap<String, SemanticTable>,
+    pub alias_to_table: HashMap<String, &'a SemanticTable>,
     pub join_lookup: HashMap<String, FlowJoin>,
 }
 
 /// Resolve all components from a query request.
-pub fn resolve_components(
-    flow: &SemanticFlow,
-    registry: &FlowRegistry,
+pub fn resolve_components<'a>(
+    flow: &'a SemanticFlow,
+    registry: &'a FlowRegistry,
     request: &QueryRequest,
     supports_filtered_aggregates: bool,
-) -> Result<QueryComponents> {
-    let alias_to_table_refs = build_alias_map(flow, registry)?;
+) -> Result<QueryComponents<'a>> {
+    let alias_to_table = build_alias_map(flow, registry)?;
     let base_alias = flow.base_table.alias.clone();
-    let base_semantic_table = alias_to_table_refs.get(&base_alias).ok_or_else(|| {
-        SemaflowError::Validation(format!(
-            "missing base table alias {}",
-            flow.base_table.alias
-        ))
-    })?;
-
-    // Build owned copies for the components struct
-    let alias_to_table: HashMap<String, SemanticTable> = alias_to_table_refs
-        .iter()
-        .map(|(k, v)| (k.clone(), (*v).clone()))
-        .collect();
+    let base_semantic_table: &'a SemanticTable =
+        alias_to_table.get(&base_alias).copied().ok_or_else(|| {
+            SemaflowError::Validation(format!(
+                "missing base table alias {}",
+                flow.base_table.alias
+            ))
+        })?;
 
     let join_lookup: HashMap<String, FlowJoin> = flow
         .joins
@@ -165,23 +164,22 @@ pub fn resolve_components(
         .collect();
 
     // Resolve dimensions
-    let dimensions =
-        resolve_dimensions_from_request(request, flow, registry, &alias_to_table_refs)?;
+    let dimensions = resolve_dimensions_from_request(request, flow, registry, &alias_to_table)?;
 
     // Resolve measures
     let (measures, base_measure_exprs) = resolve_measures_from_request(
         request,
         flow,
         registry,
-        &alias_to_table_refs,
+        &alias_to_table,
         supports_filtered_aggregates,
     )?;
 
     // Resolve filters
-    let filters = resolve_filters_from_request(request, flow, registry, &alias_to_table_refs)?;
+    let filters = resolve_filters_from_request(request, flow, registry, &alias_to_table)?;
 
     // Resolve order items
-    let order = resolve_order_from_request(request, flow, registry, &alias_to_table_refs)?;
+    let order = resolve_order_from_request(request, flow, registry, &alias_to_table)?;
 
     let base_table = TableRef {
         name: base_semantic_table.table.clone(),
@@ -192,7 +190,7 @@ pub fn resolve_components(
     Ok(QueryComponents {
         base_alias,
         base_table,
-        base_semantic_table: (*base_semantic_table).clone(),
+        base_semantic_table,
         dimensions,
         measures,
         base_measure_exprs,
@@ -304,9 +302,9 @@ fn resolve_measures_from_request(
             base_measure_exprs.insert(m.name.clone(), agg_expr.clone());
 
             // Extract and insert unqualified name for post_expr references
-            let unqualified = extract_unqualified_name(&m.name);
+            let unqualified = unqualified_name(&m.name);
             base_measure_exprs
-                .entry(unqualified.clone())
+                .entry(unqualified.to_string())
                 .or_insert_with(|| agg_expr.clone());
 
             // Insert fully qualified version
@@ -348,10 +346,10 @@ fn resolve_measures_from_request(
             m.base_expr = Some(formula_expr.clone());
 
             // Insert into base_measure_exprs
-            let unqualified = extract_unqualified_name(&m.name);
+            let unqualified = unqualified_name(&m.name);
             base_measure_exprs.insert(m.name.clone(), formula_expr.clone());
             base_measure_exprs
-                .entry(unqualified.clone())
+                .entry(unqualified.to_string())
                 .or_insert_with(|| formula_expr.clone());
             let qualified = format!("{}.{}", m.alias, unqualified);
             base_measure_exprs.entry(qualified).or_insert(formula_expr);
@@ -403,7 +401,7 @@ fn resolve_order_from_request(
     Ok(order_items)
 }
 
-impl QueryComponents {
+impl QueryComponents<'_> {
     /// Get aliases of all dimensions not on the base table.
     pub fn joined_dimension_aliases(&self) -> std::collections::HashSet<String> {
         self.dimensions
@@ -456,12 +454,3 @@ impl QueryComponents {
         !self.join_lookup.is_empty()
     }
 }
-
-/// Extract the unqualified name from a potentially qualified name like "alias.column".
-fn extract_unqualified_name(name: &str) -> String {
-    if let Some(pos) = name.find('.') {
-        name[pos + 1..].to_string()
-    } else {
-        name.to_string()
-    }
-}
@@ -1,3 +1,5 @@
+use std::sync::OnceLock;
+
 use crate::backends::ConnectionManager;
 use crate::error::{Result, SemaflowError};
 use crate::flows::QueryRequest;
@@ -16,6 +18,20 @@ mod planner;
 mod render;
 mod resolve;
 
+/// Whether `SEMAFLOW_DISABLE_FILTERED_AGG=1` forces the CASE-wrapped fallback.
+///
+/// Read once per process rather than on every build; set it before the first
+/// query is compiled.
+fn filtered_aggregates_disabled() -> bool {
+    static DISABLED: OnceLock<bool> = OnceLock::new();
+    *DISABLED.get_or_init(|| {
+        std::env::var("SEMAFLOW_DISABLE_FILTERED_AGG")
+            .ok()
+            .as_deref()
+            == Some("1")
+    })
+}
+
 pub struct SqlBuilder;
 
 impl Default for SqlBuilder {
@@ -36,15 +52,8 @@ impl SqlBuilder {
             .get_flow(&request.flow)
             .ok_or_else(|| SemaflowError::Validation(format!("unknown flow {}", request.flow)))?;
 
-        let supports_filtered_aggregates = if std::env::var("SEMAFLOW_DISABLE_FILTERED_AGG")
-            .ok()
-            .as_deref()
-            == Some("1")
-        {
-            false
-        } else {
-            dialect.supports_filtered_aggregates()
-        };
+        let supports_filtered_aggregates =
+            !filtered_aggregates_disabled() && dialect.supports_filtered_aggregates();
 
         let query = planner::build_query(flow, registry, request, supports_filtered_aggregates)?;
         let renderer = SqlRenderer::new(dialect);
@@ -8,7 +8,7 @@ use std::collections::HashSet;
 use crate::error::{Result, SemaflowError};
 use crate::flows::{Aggregation, QueryRequest, SemanticFlow};
 use crate::registry::FlowRegistry;
-use crate::sql_ast::{SelectItem, SelectQuery, SqlExpr, SqlJoinType, TableRef};
+use crate::sql_ast::{SelectItem, SelectQuery, SqlBinaryOperator, SqlExpr, SqlJoinType, TableRef};
 
 use super::analysis::{analyze_multi_grain, MultiGrainAnalysis};
 use super::builders::{
@@ -20,6 +20,7 @@ use super::filters::render_filter_expr;
 use super::joins::select_required_joins;
 use super::plan::{CteJoin, FinalQueryPlan, FlatPlan, GrainedAggPlan, MultiGrainPlan, QueryPlan};
 use super::render::expr_to_sql;
+use super::resolve::unqualified_name;
 
 /// Build a query from a flow and request.
 ///
@@ -44,9 +45,9 @@ pub fn build_query(
     // Step 3: Build appropriate plan
     let plan = if mg_analysis.needs_multi_grain {
         // Use new multi-grain path for both multi-table and single-table preagg
-        build_multi_grain_plan(&components, &mg_analysis, flow, registry)?
+        build_multi_grain_plan(&components, &mg_analysis, flow)?
     } else {
-        build_flat_plan(&components, flow, registry)?
+        build_flat_plan(&components, flow)?
     };
 
     // Step 4: Convert to SelectQuery
@@ -54,11 +55,7 @@ pub fn build_query(
 }
 
 /// Build a flat query plan (standard SELECT with JOINs).
-fn build_flat_plan(
-    components: &QueryComponents,
-    flow: &SemanticFlow,
-    registry: &FlowRegistry,
-) -> Result<QueryPlan> {
+fn build_flat_plan(components: &QueryComponents, flow: &SemanticFlow) -> Result<QueryPlan> {
     let mut plan = FlatPlan::new(components.base_table.clone());
 
     // Collect required aliases for join pruning
@@ -93,9 +90,8 @@ fn build_flat_plan(
     plan.offset = components.offset;
 
     // Build required joins with pruning
-    let alias_to_table_refs: std::collections::HashMap<String, &crate::flows::SemanticTable> =
-        super::resolve::build_alias_map(flow, registry)?;
-    let required_joins = select_required_joins(flow, &required_aliases, &alias_to_table_refs)?;
+    let required_joins =
+        select_required_joins(flow, &required_aliases, &components.alias_to_table)?;
     for join in required_joins {
         plan.joins
             .push(build_join(join, &components.alias_to_table)?);
@@ -126,7 +122,6 @@ fn build_multi_grain_plan(
     components: &QueryComponents,
     analysis: &MultiGrainAnalysis,
     flow: &SemanticFlow,
-    registry: &FlowRegistry,
 ) -> Result<QueryPlan> {
     let base_alias = &components.base_alias;
 
@@ -214,7 +209,7 @@ fn build_multi_grain_plan(
                     continue; // Post-expr measures handled differently
                 }
 
-                let measure_col_name = extract_unqualified_name(&m.name);
+                let measure_col_name = unqualified_name(&m.name);
 
                 match &m.strategy {
                     MeasureStrategy::NonDecomposable => {
@@ -260,7 +255,7 @@ fn build_multi_grain_plan(
                         if let Some(base_expr) = &m.base_expr {
                             cte.select.push(SelectItem {
                                 expr: base_expr.clone(),
-                                alias: Some(measure_col_name),
+                                alias: Some(measure_col_name.to_string()),
                             });
                         }
                     }
@@ -290,6 +285,13 @@ fn build_multi_grain_plan(
             // LEFT join filters are handled later in the outer query
         }
 
+        // Dimension-only filters still run on the outer query, but a semi-join here
+        // lets the CTE drop non-matching rows before they are aggregated.
+        if alias == base_alias {
+            cte.filters
+                .extend(dimension_filter_semi_joins(alias, components, analysis));
+        }
+
         cte_aliases.push(cte.alias.clone());
         ctes.push(cte);
     }
@@ -347,9 +349,8 @@ fn build_multi_grain_plan(
 
     // Add dimension table joins (tables without measures)
     if !dimension_join_aliases.is_empty() {
-        let alias_to_table_refs = super::resolve::build_alias_map(flow, registry)?;
         let required_joins =
-            select_required_joins(flow, &dimension_join_aliases, &alias_to_table_refs)?;
+            select_required_joins(flow, &dimension_join_aliases, &components.alias_to_table)?;
         for join in required_joins {
             // Remap join to reference CTE instead of base table
             let remapped_join = remap_join_to_cte(join, &base_cte_alias, base_alias, components)?;
@@ -392,7 +393,7 @@ fn build_multi_grain_plan(
         }
 
         let cte_alias = format!("{}_agg", m.alias);
-        let col_name = extract_unqualified_name(&m.name);
+        let col_name = unqualified_name(&m.name);
 
         // Handle post_expr measures separately (they have their own logic)
         if m.measure.post_expr.is_some() {
@@ -424,7 +425,7 @@ fn build_multi_grain_plan(
                     agg: Aggregation::Sum,
                     expr: Box::new(SqlExpr::Column {
                         table: Some(cte_alias),
-                        name: col_name.clone(),
+                        name: col_name.to_string(),
                     }),
                 }
             }
@@ -439,7 +440,7 @@ fn build_multi_grain_plan(
                     agg: agg.clone(),
                     expr: Box::new(SqlExpr::Column {
                         table: Some(cte_alias),
-                        name: col_name.clone(),
+                        name: col_name.to_string(),
                     }),
                 }
             }
@@ -500,6 +501,75 @@ fn build_multi_grain_plan(
     Ok(QueryPlan::MultiGrain(MultiGrainPlan { ctes, final_query }))
 }
 
+/// Build `EXISTS` semi-joins that push dimension-only table filters into a CTE.
+///
+/// Only tables joined directly to `cte_alias` are considered. Every filter operator
+/// rejects NULLs, so rows dropped here would have been removed by the outer filter
+/// anyway; the outer filter is kept so the join fanout is still filtered.
+fn dimension_filter_semi_joins(
+    cte_alias: &str,
+    components: &QueryComponents,
+    analysis: &MultiGrainAnalysis,
+) -> Vec<SqlExpr> {
+    let mut semi_joins = Vec::new();
+    for f in &components.filters {
+        let Some(filter_alias) = f.alias.as_deref() else {
+            continue;
+        };
+        if analysis.table_grains.contains_key(filter_alias) {
+            continue;
+        }
+        let Some(join) = components
+            .join_lookup
+            .get(filter_alias)
+            .filter(|j| j.to_table == cte_alias && !j.join_keys.is_empty())
+        else {
+            continue;
+        };
+        let Some(table) = components.alias_to_table.get(filter_alias) else {
+            continue;
+        };
+
+        let mut filters: Vec<SqlExpr> = join
+            .join_keys
+            .iter()
+            .map(|key| SqlExpr::BinaryOp {
+                op: SqlBinaryOperator::Eq,
+                left: Box::new(SqlExpr::Column {
+                    table: Some(filter_alias.to_string()),
+                    name: key.right.clone(),
+                }),
+                right: Box::new(SqlExpr::Column {
+                    table: Some(cte_alias.to_string()),
+                    name: key.left.clone(),
+                }),
+            })
+            .collect();
+        filters.push(render_filter_expr(f.expr.clone(), &f.filter));
+
+        semi_joins.push(SqlExpr::Exists {
+            subquery: Box::new(SelectQuery {
+                select: vec![SelectItem {
+                    expr: SqlExpr::Literal(serde_json::Value::from(1)),
+                    alias: None,
+                }],
+                from: TableRef {
+                    name: table.table.clone(),
+                    alias: Some(filter_alias.to_string()),
+                    subquery: None,
+                },
+                joins: Vec::new(),
+                filters,
+                group_by: Vec::new(),
+                order_by: Vec::new(),
+                limit: None,
+                offset: None,
+            }),
+        });
+    }
+    semi_joins
+}
+
 /// Remap a join to reference a CTE instead of the base table.
 fn remap_join_to_cte(
     join: &crate::flows::FlowJoin,
@@ -555,15 +625,6 @@ fn extract_column_name(expr: &SqlExpr) -> String {
     }
 }
 
-/// Extract the unqualified name from a potentially qualified name like "alias.column".
-fn extract_unqualified_name(name: &str) -> String {
-    if let Some(pos) = name.find('.') {
-        name[pos + 1..].to_string()
-    } else {
-        name.to_string()
-    }
-}
-
 /// Remap a SQL expression to reference a CTE alias instead of the original table alias.
 /// For example: `customers.country` -> `customers_agg.country`
 fn remap_expr_to_cte(expr: &SqlExpr, original_alias: &str) -> SqlExpr {
@@ -183,6 +183,11 @@ pub(crate) fn resolve_field_expression(
     )))
 }
 
+/// Borrow the field part of a possibly qualified name (`"o.order_total"` -> `"order_total"`).
+pub(crate) fn unqualified_name(name: &str) -> &str {
+    name.split_once('.').map_or(name, |(_, field)| field)
+}
+
 pub(crate) fn parse_qualified(name: &str) -> Option<(&str, &str)> {
     let (alias, field) = name.split_once('.')?;
 
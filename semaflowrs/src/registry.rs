@@ -1,13 +1,88 @@
 use std::collections::HashMap;
 use std::fs;
 use std::path::{Path, PathBuf};
+use std::sync::Mutex;
+use std::time::SystemTime;
 
 use glob::glob;
+use once_cell::sync::Lazy;
+use serde::de::DeserializeOwned;
 use serde::Serialize;
 
 use crate::error::{Result, SemaflowError};
 use crate::flows::{Aggregation, Expr, FlowTableRef, SemanticFlow, SemanticTable};
 
+/// Upper bound on threads used to parse a directory of YAML definitions.
+const MAX_LOAD_THREADS: usize = 16;
+/// Below this many files per thread, spawning costs more than parsing saves.
+const MIN_FILES_PER_THREAD: usize = 4;
+
+/// Read and parse every `*.yml` then `*.yaml` file in `dir`, in glob order.
+///
+/// Large directories are split across scoped threads; results keep path order so
+/// a later file still overrides an earlier one with the same name, and the first
+/// failing file (in path order) is the one reported.
+fn parse_yaml_dir<T>(dir: &Path, kind: &str) -> Result<Vec<T>>
+where
+    T: DeserializeOwned + Send,
+{
+    let mut paths = Vec::new();
+    for ext in ["yml", "yaml"] {
+        paths.extend(
+            glob(&format!("{}/*.{ext}", dir.display()))
+                .map_err(|e| SemaflowError::Other(e.into()))?
+                .flatten(),
+        );
+    }
+    let parse = |path: &PathBuf| -> Result<T> {
+        let contents = fs::read_to_string(path)?;
+        serde_yaml::from_str(&contents).map_err(|e| {
+            SemaflowError::Validation(format!("failed to parse {kind} {}: {e}", path.display()))
+        })
+    };
+
+    let workers = std::thread::available_parallelism()
+        .map_or(1, |n| n.get())
+        .min(MAX_LOAD_THREADS)
+        .min(paths.len() / MIN_FILES_PER_THREAD);
+    if workers <= 1 {
+        return paths.iter().map(parse).collect();
+    }
+    let parse = &parse;
+    std::thread::scope(|scope| {
+        let handles: Vec<_> = paths
+            .chunks(paths.len().div_ceil(workers))
+            .map(|chunk| scope.spawn(move || chunk.iter().map(parse).collect::<Vec<_>>()))
+            .collect();
+        handles
+            .into_iter()
+            .flat_map(|handle| handle.join().expect("YAML loader thread panicked"))
+            .collect()
+    })
+}
+
+/// Sorted (path, mtime) pairs for every YAML file `load_from_dir` may read under `root`.
+fn yaml_fingerprint(root: &Path) -> Result<Vec<(PathBuf, SystemTime)>> {
+    let mut files = Vec::new();
+    for dir in [root.to_path_buf(), root.join("tables"), root.join("flows")] {
+        if !dir.is_dir() {
+            continue;
+        }
+        for entry in fs::read_dir(&dir)? {
+            let path = entry?.path();
+            if matches!(
+                path.extension().and_then(|ext| ext.to_str()),
+                Some("yml" | "yaml")
+            ) {
+                let modified = fs::metadata(&path)?.modified()?;
+                files.push((path, modified));
+            }
+        }
+    }
+    files.sort();
+    Ok(files)
+}
+
 #[derive(Debug, Default, Clone)]
 pub struct FlowRegistry {
     pub tables: HashMap<String, SemanticTable>,
@@ -55,6 +130,34 @@ impl FlowRegistry {
         Ok(registry)
     }
 
+    /// Like [`FlowRegistry::load_from_dir`], but reuses a process-wide parse of
+    /// `root` for as long as none of its YAML files are added, removed or modified.
+    ///
+    /// The returned registry is an unvalidated clone, so callers validate it
+    /// against their own connections exactly as with a fresh load.
+    pub fn load_from_dir_cached<P: AsRef<Path>>(root: P) -> Result<Self> {
+        static CACHE: Lazy<Mutex<HashMap<PathBuf, (Vec<(PathBuf, SystemTime)>, FlowRegistry)>>> =
+            Lazy::new(Default::default);
+
+        let root = root.as_ref();
+        let (Ok(key), Ok(fingerprint)) = (fs::canonicalize(root), yaml_fingerprint(root)) else {
+            // Let the uncached loader report missing directories and I/O errors.
+            return Self::load_from_dir(root);
+        };
+        if let Some((cached_fingerprint, registry)) = CACHE.lock().unwrap().get(&key) {
+            if *cached_fingerprint == fingerprint {
+                tracing::debug!(root = %key.display(), "reusing cached flow definitions");
+                return Ok(registry.clone());
+            }
+        }
+        let registry = Self::load_from_dir(root)?;
+        CACHE
+            .lock()
+            .unwrap()
+            .insert(key, (fingerprint, registry.clone()));
+        Ok(registry)
+    }
+
     fn load_tables(&mut self, dir: PathBuf) -> Result<()> {
         if !dir.exists() {
             return Err(SemaflowError::Validation(format!(
@@ -62,40 +165,17 @@ impl FlowRegistry {
                 dir.display()
             )));
         }
-        let mut loaded = false;
-        for entry in glob(&format!("{}/*.yml", dir.display()))
-            .map_err(|e| SemaflowError::Other(e.into()))?
-            .flatten()
-        {
-            loaded |= self.load_table_file(&entry)?;
-        }
-        for entry in glob(&format!("{}/*.yaml", dir.display()))
-            .map_err(|e| SemaflowError::Other(e.into()))?
-            .flatten()
-        {
-            loaded |= self.load_table_file(&entry)?;
-        }
-        if !loaded {
+        let tables: Vec<SemanticTable> = parse_yaml_dir(&dir, "table")?;
+        if tables.is_empty() {
             return Err(SemaflowError::Validation(format!(
                 "no semantic tables found in {}",
                 dir.display()
             )));
         }
-        Ok(())
-    }
-
-    fn load_table_file(&mut self, path: &Path) -> Result<bool> {
-        let contents = fs::read_to_string(path)?;
-        match serde_yaml::from_str::<SemanticTable>(&contents) {
-            Ok(table) => {
-                self.tables.insert(table.name.clone(), table);
-                Ok(true)
-            }
-            Err(e) => Err(SemaflowError::Validation(format!(
-                "failed to parse table {}: {e}",
-                path.display()
-            ))),
+        for table in tables {
+            self.tables.insert(table.name.clone(), table);
         }
+        Ok(())
     }
 
     fn load_flows(&mut self, dir: PathBuf) -> Result<()> {
@@ -105,40 +185,17 @@ impl FlowRegistry {
                 dir.display()
             )));
         }
-        let mut loaded = false;
-        for entry in glob(&format!("{}/*.yml", dir.display()))
-            .map_err(|e| SemaflowError::Other(e.into()))?
-            .flatten()
-        {
-            loaded |= self.load_flow_file(&entry)?;
-        }
-        for entry in glob(&format!("{}/*.yaml", dir.display()))
-            .map_err(|e| SemaflowError::Other(e.into()))?
-            .flatten()
-        {
-            loaded |= self.load_flow_file(&entry)?;
-        }
-        if !loaded {
+        let flows: Vec<SemanticFlow> = parse_yaml_dir(&dir, "flow")?;
+        if flows.is_empty() {
             return Err(SemaflowError::Validation(format!(
                 "no semantic flows found in {}",
                 dir.display()
             )));
         }
-        Ok(())
-    }
-
-    fn load_flow_file(&mut self, path: &Path) -> Result<bool> {
-        let contents = fs::read_to_string(path)?;
-        match serde_yaml::from_str::<SemanticFlow>(&contents) {
-            Ok(flow) => {
-                self.flows.insert(flow.name.clone(), flow);
-                Ok(true)
-            }
-            Err(e) => Err(SemaflowError::Validation(format!(
-                "failed to parse flow {}: {e}",
-                path.display()
-            ))),
+        for flow in flows {
+            self.flows.insert(flow.name.clone(), flow);
         }
+        Ok(())
     }
 
     pub fn get_table(&self, name: &str) -> Option<&SemanticTable> {
@@ -1,10 +1,42 @@
-use crate::backends::ConnectionManager;
+use std::sync::Arc;
+
+use crate::backends::{BackendConnection, ConnectionManager};
 use crate::error::Result;
 use crate::executor::PaginatedResult;
 use crate::pagination::{compute_query_hash, Cursor};
 use crate::query_builder::SqlBuilder;
 use crate::registry::FlowRegistry;
 
+/// Resolve the backend connection that serves a flow's base table.
+pub fn connection_for_flow<'a>(
+    registry: &FlowRegistry,
+    connections: &'a ConnectionManager,
+    flow_name: &str,
+) -> Result<&'a Arc<dyn BackendConnection>> {
+    let flow = registry.get_flow(flow_name).ok_or_else(|| {
+        tracing::warn!(flow = %flow_name, "unknown flow requested");
+        crate::SemaflowError::Validation(format!("unknown flow {}", flow_name))
+    })?;
+    let base_table = registry
+        .get_table(&flow.base_table.semantic_table)
+        .ok_or_else(|| {
+            tracing::warn!(table = %flow.base_table.semantic_table, "base table not found");
+            crate::SemaflowError::Validation(format!(
+                "flow base table {} not found",
+                flow.base_table.semantic_table
+            ))
+        })?;
+    let ds = connections.get(&base_table.data_source).ok_or_else(|| {
+        tracing::warn!(data_source = %base_table.data_source, "data source not registered");
+        crate::SemaflowError::Validation(format!(
+            "data source {} not registered",
+            base_table.data_source
+        ))
+    })?;
+    tracing::trace!(data_source = %base_table.data_source, "resolved data source");
+    Ok(ds)
+}
+
 #[tracing::instrument(
     skip(registry, connections),
     fields(
@@ -26,28 +58,9 @@ pub async fn run_query(
     tracing::debug!(sql_len = sql.len(), "SQL generated");
     tracing::trace!(sql = %sql, "generated SQL");
 
-    let flow = registry.get_flow(&request.flow).ok_or_else(|| {
-        tracing::warn!(flow = %request.flow, "unknown flow requested");
-        crate::SemaflowError::Validation(format!("unknown flow {}", request.flow))
-    })?;
-    let base_table = registry
-        .get_table(&flow.base_table.semantic_table)
-        .ok_or_else(|| {
-            tracing::warn!(table = %flow.base_table.semantic_table, "base table not found");
-            crate::SemaflowError::Validation(format!(
-                "flow base table {} not found",
-                flow.base_table.semantic_table
-            ))
-        })?;
-    let ds = connections.get(&base_table.data_source).ok_or_else(|| {
-        tracing::warn!(data_source = %base_table.data_source, "data source not registered");
-        crate::SemaflowError::Validation(format!(
-            "data source {} not registered",
-            base_table.data_source
-        ))
-    })?;
+    let ds = connection_for_flow(registry, connections, &request.flow)?;
 
-    tracing::debug!(data_source = %base_table.data_source, "executing SQL");
+    tracing::debug!("executing SQL");
     let result = ds.execute_sql(&sql).await;
 
     let elapsed = start.elapsed();
@@ -69,6 +82,40 @@ pub async fn run_query(
     result
 }
 
+/// Execute a query against a semantic flow and return Arrow record batches.
+///
+/// Same SQL as [`run_query`], but rows stay columnar instead of being
+/// materialized as JSON maps.
+#[cfg(feature = "duckdb")]
+pub async fn run_query_arrow(
+    registry: &FlowRegistry,
+    connections: &ConnectionManager,
+    request: &crate::flows::QueryRequest,
+) -> Result<crate::executor::ArrowResult> {
+    let start = std::time::Instant::now();
+    let builder = SqlBuilder;
+    let sql = builder.build_for_request(registry, connections, request)?;
+    tracing::trace!(sql = %sql, "generated SQL");
+
+    let ds = connection_for_flow(registry, connections, &request.flow)?;
+    let result = ds.execute_sql_arrow(&sql).await;
+    match &result {
+        Ok(r) => tracing::info!(
+            flow = %request.flow,
+            rows = r.num_rows(),
+            ms = start.elapsed().as_millis(),
+            "arrow query completed successfully"
+        ),
+        Err(e) => tracing::error!(
+            flow = %request.flow,
+            error = %e,
+            ms = start.elapsed().as_millis(),
+            "arrow query failed"
+        ),
+    }
+    result
+}
+
 /// Execute a paginated query against a semantic flow.
 ///
 /// This function handles cursor-based pagination by:
@@ -133,32 +180,9 @@ pub async fn run_query_paginated(
     };
 
     // Get the backend connection
-    let flow = registry.get_flow(&request.flow).ok_or_else(|| {
-        tracing::warn!(flow = %request.flow, "unknown flow requested");
-        crate::SemaflowError::Validation(format!("unknown flow {}", request.flow))
-    })?;
-    let base_table = registry
-        .get_table(&flow.base_table.semantic_table)
-        .ok_or_else(|| {
-            tracing::warn!(table = %flow.base_table.semantic_table, "base table not found");
-            crate::SemaflowError::Validation(format!(
-                "flow base table {} not found",
-                flow.base_table.semantic_table
-            ))
-        })?;
-    let ds = connections.get(&base_table.data_source).ok_or_else(|| {
-        tracing::warn!(data_source = %base_table.data_source, "data source not registered");
-        crate::SemaflowError::Validation(format!(
-            "data source {} not registered",
-            base_table.data_source
-        ))
-    })?;
+    let ds = connection_for_flow(registry, connections, &request.flow)?;
 
-    tracing::debug!(
-        data_source = %base_table.data_source,
-        page_size = page_size,
-        "executing paginated SQL"
-    );
+    tracing::debug!(page_size = page_size, "executing paginated SQL");
 
     // Execute paginated query
     let result = ds
@@ -251,7 +251,15 @@ impl<'d> SqlRenderer<'d> {
                         self.render_expr(then)
                     ));
                 }
-                parts.push(format!(" ELSE {} END", self.render_expr(else_expr)));
+                // ELSE NULL is the SQL default; leaving it out keeps filtered
+                // aggregate fallbacks (`SUM(CASE WHEN .. THEN x END)`) minimal.
+                if !matches!(
+                    else_expr.as_ref(),
+                    SqlExpr::Literal(serde_json::Value::Null)
+                ) {
+                    parts.push(format!(" ELSE {}", self.render_expr(else_expr)));
+                }
+                parts.push(" END".to_string());
                 parts.join("")
             }
             SqlExpr::BinaryOp { op, left, right } => {
@@ -241,6 +241,25 @@ async fn duckdb_runtime_run_query() -> anyhow::Result<()> {
     Ok(())
 }
 
+#[tokio::test]
+async fn duckdb_concurrent_connections_share_in_memory_database() -> anyhow::Result<()> {
+    let conn = DuckDbConnection::new(":memory:").with_max_concurrency(4);
+    conn.initialize_pool().await?;
+    conn.execute_sql("CREATE TABLE t AS SELECT 1 AS x").await?;
+
+    // Concurrent queries drain the pool, so extra connections are cloned from
+    // the root and must still see the in-memory table.
+    let (a, b, c) = tokio::join!(
+        conn.execute_sql("SELECT x FROM t"),
+        conn.execute_sql("SELECT x FROM t"),
+        conn.execute_sql("SELECT x FROM t"),
+    );
+    for result in [a?, b?, c?] {
+        assert_eq!(result.rows.len(), 1);
+    }
+    Ok(())
+}
+
 #[tokio::test]
 async fn duckdb_paginated_query() -> anyhow::Result<()> {
     let dir = tempfile::tempdir()?;
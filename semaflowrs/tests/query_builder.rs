@@ -975,6 +975,101 @@ fn preaggregates_when_join_cardinality_unknown() {
     );
 }
 
+#[test]
+fn pushes_dimension_filter_into_preaggregation_as_semi_join() {
+    let mut registry = fixtures::simple_orders_registry();
+    let customers = SemanticTable {
+        data_source: "ds1".to_string(),
+        name: "customers".to_string(),
+        table: "customers".to_string(),
+        primary_keys: vec!["id".to_string()],
+        time_dimension: None,
+        smallest_time_grain: None,
+        dimensions: [(
+            "customer_country".to_string(),
+            semaflow::flows::Dimension {
+                expr: Expr::Column {
+                    column: "country".to_string(),
+                },
+                data_type: None,
+                description: None,
+            },
+        )]
+        .into_iter()
+        .collect(),
+        measures: Default::default(),
+        description: None,
+    };
+
+    let flow = SemanticFlow {
+        name: "sales".to_string(),
+        base_table: FlowTableRef {
+            semantic_table: "orders".to_string(),
+            alias: "o".to_string(),
+        },
+        joins: [(
+            "customers".to_string(),
+            FlowJoin {
+                semantic_table: "customers".to_string(),
+                alias: "c".to_string(),
+                to_table: "o".to_string(),
+                join_type: JoinType::Left,
+                join_keys: vec![JoinKey {
+                    left: "customer_id".to_string(),
+                    right: "external_id".to_string(), // NOT the PK - unknown cardinality
+                }],
+                cardinality: None,
+                description: None,
+            },
+        )]
+        .into_iter()
+        .collect(),
+        description: None,
+    };
+
+    registry.tables.insert(customers.name.clone(), customers);
+    registry.flows.insert(flow.name.clone(), flow);
+
+    let request = QueryRequest {
+        flow: "sales".to_string(),
+        dimensions: vec!["customer_country".to_string()],
+        measures: vec!["order_total".to_string()],
+        filters: vec![semaflow::flows::Filter {
+            field: "customer_country".to_string(),
+            op: semaflow::flows::FilterOp::Eq,
+            value: serde_json::json!("US"),
+        }],
+        order: vec![],
+        limit: None,
+        offset: None,
+        ..Default::default()
+    };
+
+    let sql = SqlBuilder::default()
+        .build_with_dialect(&registry, &request, &DuckDbDialect)
+        .unwrap();
+
+    let exists_at = sql
+        .find("EXISTS (SELECT 1 FROM \"customers\" \"c\"")
+        .unwrap_or_else(|| {
+            panic!("filter should be pushed into the CTE as a semi-join; sql={sql}")
+        });
+    let group_by_at = sql.find("GROUP BY").expect("pre-aggregation GROUP BY");
+    assert!(
+        exists_at < group_by_at,
+        "semi-join should filter rows before the inner aggregation; sql={sql}"
+    );
+    assert!(
+        sql.contains("\"c\".\"external_id\" = \"o\".\"customer_id\""),
+        "semi-join should correlate on the join keys; sql={sql}"
+    );
+    assert_eq!(
+        sql.matches("\"c\".\"country\" = 'US'").count(),
+        2,
+        "filter should still apply to the outer query; sql={sql}"
+    );
+}
+
 // ============================================================================
 // Measure expression tests
 // ============================================================================
@@ -1058,7 +1153,7 @@ fn falls_back_to_case_when_filter_not_supported() {
         .build_with_dialect(&registry, &request, &NoFilterDialect)
         .unwrap();
     assert!(
-        sql.contains("SUM(CASE WHEN (`o`.`country` = 'US') THEN `o`.`amount` ELSE NULL END)"),
+        sql.contains("SUM(CASE WHEN (`o`.`country` = 'US') THEN `o`.`amount` END)"),
         "filtered measure should render with CASE when dialect lacks FILTER support; sql={sql}"
     );
 }
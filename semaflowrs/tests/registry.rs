@@ -121,3 +121,69 @@ fn flow_schema_includes_dimensions_measures_and_joins() {
     let measure_names: Vec<_> = schema.measures.iter().map(|m| m.name.as_str()).collect();
     assert!(measure_names.contains(&"order_total"));
 }
+
+#[test]
+fn load_from_dir_cached_picks_up_new_files() -> anyhow::Result<()> {
+    let dir = tempfile::tempdir()?;
+    let tables_dir = dir.path().join("tables");
+    let flows_dir = dir.path().join("flows");
+    std::fs::create_dir_all(&tables_dir)?;
+    std::fs::create_dir_all(&flows_dir)?;
+    std::fs::write(
+        tables_dir.join("orders.yaml"),
+        r#"
+name: orders
+data_source: ds1
+table: orders
+primary_key: id
+dimensions:
+  id:
+    expr:
+      type: column
+      column: id
+"#,
+    )?;
+    let flow =
+        |name: &str| format!("name: {name}\nbase_table:\n  semantic_table: orders\n  alias: o\n");
+    std::fs::write(flows_dir.join("a.yaml"), flow("a"))?;
+
+    let first = FlowRegistry::load_from_dir_cached(dir.path())?;
+    let second = FlowRegistry::load_from_dir_cached(dir.path())?;
+    assert_eq!(first.flows.len(), 1);
+    assert_eq!(second.flows.len(), 1);
+
+    std::fs::write(flows_dir.join("b.yaml"), flow("b"))?;
+    let reloaded = FlowRegistry::load_from_dir_cached(dir.path())?;
+    assert_eq!(reloaded.flows.len(), 2);
+    Ok(())
+}
+
+#[test]
+fn load_from_dir_parses_many_files_in_path_order() -> anyhow::Result<()> {
+    let dir = tempfile::tempdir()?;
+    let tables_dir = dir.path().join("tables");
+    let flows_dir = dir.path().join("flows");
+    std::fs::create_dir_all(&tables_dir)?;
+    std::fs::create_dir_all(&flows_dir)?;
+    std::fs::write(
+        tables_dir.join("orders.yaml"),
+        "name: orders\ndata_source: ds1\ntable: orders\nprimary_key: id\n",
+    )?;
+    // Enough files to be split across loader threads.
+    for i in 0..64 {
+        std::fs::write(
+            flows_dir.join(format!("flow_{i:02}.yaml")),
+            format!("name: flow_{i:02}\nbase_table:\n  semantic_table: orders\n  alias: o\n"),
+        )?;
+    }
+    // Same name as a .yaml flow: .yml files load first, so the .yaml one wins.
+    std::fs::write(
+        flows_dir.join("dup.yml"),
+        "name: flow_00\ndescription: overridden\nbase_table:\n  semantic_table: orders\n  alias: o\n",
+    )?;
+
+    let registry = FlowRegistry::load_from_dir(dir.path())?;
+    assert_eq!(registry.flows.len(), 64);
+    assert_eq!(registry.get_flow("flow_00").unwrap().description, None);
+    Ok(())
+}
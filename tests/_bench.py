@@ -0,0 +1,42 @@
+"""
+Timing helpers shared by the benchmark scripts in this directory.
+
+Import as ``from _bench import bench, summarize``; the scripts are run as
+files (``python tests/simple_benchmark.py``), so this directory is on
+``sys.path``.
+"""
+
+import asyncio
+import statistics
+import time
+from array import array
+from typing import Any, Awaitable, Callable, Tuple
+
+
+async def bench(run: Callable[[], Awaitable[Any]], iterations: int, concurrency: int) -> array:
+    """Return per-call latencies in integer nanoseconds, one slot per call."""
+    latencies = array("q", bytes(8 * iterations * concurrency))
+
+    async def worker(worker_id: int) -> None:
+        clock = time.perf_counter_ns  # local lookup keeps harness overhead out of the samples
+        base = worker_id * iterations
+        for slot in range(base, base + iterations):
+            start = clock()
+            await run()
+            latencies[slot] = clock() - start
+
+    if concurrency == 1:
+        await worker(0)
+    else:
+        async with asyncio.TaskGroup() as tg:
+            for worker_id in range(concurrency):
+                tg.create_task(worker(worker_id))
+    return latencies
+
+
+def summarize(latencies: array) -> Tuple[float, float, float, float]:
+    """Return p50, p95, min and max latency in milliseconds."""
+    # Percentiles over the raw ints; only the reported figures are scaled to ms.
+    # One sort for every percentile; "inclusive" interpolates between neighbouring samples.
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return tuple(ns / 1e6 for ns in (cuts[49], cuts[94], min(latencies), max(latencies)))
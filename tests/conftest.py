@@ -2,9 +2,9 @@
 Shared pytest fixtures for SemaFlow tests.
 """
 
+from datetime import datetime
 from pathlib import Path
 
-import pandas as pd
 import pyarrow as pa
 import pytest
 
@@ -25,25 +25,22 @@ def seeded_datasource() -> DataSource:
     """Create an in-memory DuckDB datasource with test data."""
     ds = DataSource.duckdb(":memory:", name="test_db")
 
-    # Create customers DataFrame
-    customers_df = pd.DataFrame({
+    # Build the Arrow tables directly; going through pandas only adds a copy.
+    customers = pa.table({
         "id": [1, 2, 3, 4],
         "name": ["Alice", "Bob", "Carla", "David"],
         "country": ["US", "UK", "US", "DE"],
     })
-    ds.register_dataframe("customers", pa.Table.from_pandas(customers_df).to_reader())
+    ds.register_dataframe("customers", customers.to_reader())
 
-    # Create orders DataFrame
-    orders_df = pd.DataFrame({
+    orders = pa.table({
         "id": [1, 2, 3, 4, 5],
         "customer_id": [1, 1, 2, 3, 3],
         "amount": [100.0, 50.0, 25.0, 200.0, 75.0],
         "status": ["complete", "complete", "pending", "complete", "pending"],
-        "created_at": pd.to_datetime([
-            "2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"
-        ]),
+        "created_at": pa.array([datetime(2024, 1, d) for d in range(1, 6)], pa.timestamp("ns")),
     })
-    ds.register_dataframe("orders", pa.Table.from_pandas(orders_df).to_reader())
+    ds.register_dataframe("orders", orders.to_reader())
 
     return ds
 
@@ -8,50 +8,60 @@ Rust extension.
 
 import argparse
 import asyncio
+import importlib.util
+import json
+import os
 import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List
-
-import pandas as pd
-import pyarrow as pa
+from typing import Any, Callable, Dict
 
+from _bench import bench, summarize
 from semaflow import DataSource, FlowHandle
 
 
 def create_seeded_datasource() -> DataSource:
     """Create in-memory DuckDB with test data matching the shared flows schema."""
+    import pyarrow as pa  # deferred so `--help` does not pay for the import
+
     ds = DataSource.duckdb(":memory:", name="warehouse")
 
+    # Arrow tables are built directly; a pandas DataFrame would only add a copy.
     # Dimension: customers
-    customers_df = pd.DataFrame({
+    customers = pa.table({
         "customer_id": [1, 2, 3],
         "country": ["US", "UK", "US"],
         "email": ["alice@example.com", "bob@example.com", "carla@example.com"],
-        "signup_date": pd.to_datetime(["2023-01-01", "2023-02-15", "2023-03-10"]),
+        "signup_date": pa.array(
+            [datetime(2023, 1, 1), datetime(2023, 2, 15), datetime(2023, 3, 10)], pa.timestamp("us")
+        ),
     })
-    ds.register_dataframe("dim_customers", pa.Table.from_pandas(customers_df).to_reader())
+    ds.register_dataframe("dim_customers", customers.to_reader())
 
     # Dimension: products
-    products_df = pd.DataFrame({
+    products = pa.table({
         "product_id": [1, 2, 3],
         "product_name": ["Widget", "Gadget", "Gizmo"],
         "category": ["Electronics", "Electronics", "Home"],
         "price": [29.99, 49.99, 19.99],
     })
-    ds.register_dataframe("dim_products", pa.Table.from_pandas(products_df).to_reader())
+    ds.register_dataframe("dim_products", products.to_reader())
 
     # Fact: orders
-    orders_df = pd.DataFrame({
+    orders = pa.table({
         "order_id": [1, 2, 3, 4, 5],
         "customer_id": [1, 1, 2, 2, 3],
         "product_id": [1, 2, 1, 3, 2],
-        "order_date": pd.to_datetime(["2023-06-01", "2023-06-02", "2023-06-03", "2023-06-04", "2023-06-05"]),
+        "order_date": pa.array([datetime(2023, 6, d) for d in range(1, 6)], pa.timestamp("us")),
         "status": ["completed", "completed", "completed", "pending", "completed"],
         "quantity": [2, 1, 3, 1, 2],
         "total_amount": [59.98, 49.99, 89.97, 19.99, 99.98],
         "unit_price": [29.99, 49.99, 29.99, 19.99, 49.99],
     })
-    ds.register_dataframe("fct_orders", pa.Table.from_pandas(orders_df).to_reader())
+    ds.register_dataframe("fct_orders", orders.to_reader())
 
     return ds
 
@@ -66,35 +76,80 @@ REQUEST: Dict[str, Any] = {
 }
 
 
-def percentile(values: List[float], pct: float) -> float:
-    ordered = sorted(values)
-    k = (len(ordered) - 1) * pct
-    f = int(k)
-    c = min(f + 1, len(ordered) - 1)
-    if f == c:
-        return ordered[f]
-    return ordered[f] + (ordered[c] - ordered[f]) * (k - f)
-
+async def sync_bench(call: Callable[[], Any], iterations: int, concurrency: int) -> array:
+    """Like `bench`, but each worker is a plain loop calling the Rust handle directly.
+
+    No event-loop scheduling happens between iterations; concurrency comes
+    from one OS thread per worker, which the Rust calls allow by releasing
+    the GIL.
+    """
+    latencies = array("q", bytes(8 * iterations * concurrency))
+
+    def worker(worker_id: int) -> None:
+        clock = time.perf_counter_ns  # local lookup keeps harness overhead out of the samples
+        base = worker_id * iterations
+        for slot in range(base, base + iterations):
+            start = clock()
+            call()
+            latencies[slot] = clock() - start
+
+    if concurrency == 1:
+        worker(0)
+    else:
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="bench") as pool:
+            await asyncio.gather(*(loop.run_in_executor(pool, worker, i) for i in range(concurrency)))
+    return latencies
 
-async def bench(flow: FlowHandle, payload: Dict[str, Any], iterations: int, concurrency: int):
-    latencies: List[float] = []
 
-    async def worker():
-        for _ in range(iterations):
-            start = time.perf_counter()
-            await flow.execute(payload)
-            latencies.append((time.perf_counter() - start) * 1000)
+def pin_cpus(count: int) -> None:
+    """Restrict the process to ``count`` of its allowed CPUs.
 
-    await asyncio.gather(*(worker() for _ in range(concurrency)))
-    return latencies
+    Called before DuckDB or any worker thread starts, so every thread inherits
+    the mask and the scheduler cannot migrate them onto other cores mid-run.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        print("--pin is only supported on Linux; running unpinned")
+        return
+    cpus = sorted(os.sched_getaffinity(0))[:count]
+    os.sched_setaffinity(0, cpus)
+    print(f"Pinned to CPUs: {cpus}")
 
 
-async def main():
+def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="In-process FlowHandle.execute benchmark (no HTTP)")
     parser.add_argument("--iterations", type=int, default=100, help="Number of execute calls per worker")
     parser.add_argument("--concurrency", type=int, default=4, help="Number of concurrent workers")
-    args = parser.parse_args()
-
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="Untimed calls made before measuring (default: 1)"
+    )
+    parser.add_argument(
+        "--prepared",
+        action="store_true",
+        help="Prepare the request once and time PreparedFlow.execute instead of FlowHandle.execute",
+    )
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Call the Rust handle directly from worker threads instead of awaiting FlowHandle",
+    )
+    parser.add_argument(
+        "--pin",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Pin the process to N CPUs (Linux) for steadier, reproducible percentiles",
+    )
+    parser.add_argument(
+        "--loop",
+        choices=["asyncio", "uvloop"],
+        default="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        help="Event loop to run on (default: uvloop when installed)",
+    )
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace):
     project_root = Path(__file__).resolve().parents[1]
     flow_root = project_root / "examples" / "flows"
 
@@ -106,15 +161,37 @@ async def main():
 
     total_requests = args.iterations * args.concurrency
     print(f"Running {total_requests} execute calls (concurrency={args.concurrency})...")
-    start = time.perf_counter()
-    latencies = await bench(flow, REQUEST, args.iterations, args.concurrency)
+    # First calls pay one-time planning and connection setup; keep them out of the percentiles.
+    if args.sync:
+        inner = flow._inner
+        # Encode once: the Rust handle parses JSON bytes without building a dict per call.
+        body = json.dumps(REQUEST).encode()
+        call = inner.prepare(body).execute if args.prepared else partial(inner.execute, body)
+        for _ in range(args.warmup):
+            call()
+        start = time.perf_counter()
+        latencies = await sync_bench(call, args.iterations, args.concurrency)
+    else:
+        run = flow.prepare(REQUEST).execute if args.prepared else partial(flow.execute, REQUEST)
+        for _ in range(args.warmup):
+            await run()
+        start = time.perf_counter()
+        latencies = await bench(run, args.iterations, args.concurrency)
     elapsed = time.perf_counter() - start
 
-    p50 = percentile(latencies, 0.5)
-    p95 = percentile(latencies, 0.95)
+    p50, p95, lo, hi = summarize(latencies)
     print(f"Total time: {elapsed:.3f}s; avg rps: {total_requests / elapsed:.1f}")
-    print(f"Latency ms: p50={p50:.2f} p95={p95:.2f} min={min(latencies):.2f} max={max(latencies):.2f}")
+    print(f"Latency ms: p50={p50:.2f} p95={p95:.2f} min={lo:.2f} max={hi:.2f}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    args = parse_args()
+    if args.pin:
+        pin_cpus(args.pin)
+    print(f"Event loop: {args.loop}")
+    if args.loop == "uvloop":
+        import uvloop
+
+        uvloop.run(main(args))
+    else:
+        asyncio.run(main(args))
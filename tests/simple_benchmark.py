@@ -7,34 +7,38 @@ pure overhead without multi-grain query complexity.
 
 import argparse
 import asyncio
+import statistics
 import time
-from typing import Any, Dict, List
-
-import pandas as pd
-import pyarrow as pa
+from array import array
+from datetime import datetime
+from functools import partial
+from typing import Any, Dict, List, Tuple
 
+from _bench import bench, summarize
 from semaflow import DataSource, FlowHandle
 
 
 def create_seeded_datasource() -> DataSource:
     """Create in-memory DuckDB with test data."""
+    import pyarrow as pa  # deferred so `--help` does not pay for the import
+
     ds = DataSource.duckdb(":memory:", name="bench_db")
 
-    customers_df = pd.DataFrame({
+    customers = pa.table({
         "id": [1, 2, 3],
         "name": ["Alice", "Bob", "Carla"],
         "country": ["US", "UK", "US"],
     })
-    ds.register_dataframe("customers", pa.Table.from_pandas(customers_df).to_reader())
+    ds.register_dataframe("customers", customers.to_reader())
 
-    orders_df = pd.DataFrame({
+    orders = pa.table({
         "id": [1, 2, 3],
         "customer_id": [1, 1, 2],
         "amount": [100.0, 50.0, 25.0],
         "status": ["completed", "completed", "pending"],
-        "created_at": pd.to_datetime(["2023-01-01", "2023-01-02", "2023-01-03"]),
+        "created_at": pa.array([datetime(2023, 1, d) for d in range(1, 4)], pa.timestamp("us")),
     })
-    ds.register_dataframe("orders", pa.Table.from_pandas(orders_df).to_reader())
+    ds.register_dataframe("orders", orders.to_reader())
 
     return ds
 
@@ -83,49 +87,127 @@ REQUEST: Dict[str, Any] = {
 }
 
 
-def percentile(values: List[float], pct: float) -> float:
-    ordered = sorted(values)
-    k = (len(ordered) - 1) * pct
-    f = int(k)
-    c = min(f + 1, len(ordered) - 1)
-    if f == c:
-        return ordered[f]
-    return ordered[f] + (ordered[c] - ordered[f]) * (k - f)
+def many_batches(iterations: int, concurrency: int) -> List[List[Dict[str, Any]]]:
+    """Return one batch of ``iterations`` distinct requests per worker.
+
+    Each request gets its own ``limit``, so `FlowHandle.execute_many` cannot
+    collapse a batch into a single query.
+    """
+    return [
+        [{**REQUEST, "limit": worker_id * iterations + i + 1} for i in range(iterations)]
+        for worker_id in range(concurrency)
+    ]
 
 
-async def bench(flow: FlowHandle, payload: Dict[str, Any], iterations: int, concurrency: int):
-    latencies: List[float] = []
+async def bench_many(flow: FlowHandle, batches: List[List[Dict[str, Any]]]) -> array:
+    """Send each worker's batch as one `execute_many` call; return batch latencies in ns.
 
-    async def worker():
-        for _ in range(iterations):
-            start = time.perf_counter()
-            await flow.execute(payload)
-            latencies.append((time.perf_counter() - start) * 1000)
+    Requests in a batch all complete together, so only batch-level timings
+    exist: one slot per worker, not per request.
+    """
+    latencies = array("q", bytes(8 * len(batches)))
 
-    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    async def worker(worker_id: int) -> None:
+        start = time.perf_counter_ns()
+        await flow.execute_many(batches[worker_id])
+        latencies[worker_id] = time.perf_counter_ns() - start
+
+    await asyncio.gather(*(worker(worker_id) for worker_id in range(len(batches))))
     return latencies
 
 
+SWEEP_LEVELS = (1, 2, 4, 8, 16)
+
+
+async def run_level(flow: FlowHandle, args: argparse.Namespace, concurrency: int) -> Tuple[float, array]:
+    """Run one benchmark pass; return wall time in seconds and latencies in ns.
+
+    Latencies are per call, or per worker batch with ``--many``. Each pass first
+    makes ``args.warmup`` untimed rounds of ``concurrency`` overlapping calls (or
+    batches), so plan compilation, worker-thread startup and interpreter
+    specialization stay out of the measured samples.
+    """
+    if args.many:
+        batches = many_batches(args.iterations, concurrency)
+        for _ in range(args.warmup):
+            await asyncio.gather(*(flow.execute_many(batch) for batch in batches))
+        start = time.perf_counter()
+        latencies = await bench_many(flow, batches)
+        return time.perf_counter() - start, latencies
+
+    run = flow.prepare(REQUEST).execute if args.prepared else partial(flow.execute, REQUEST)
+    for _ in range(args.warmup):
+        await asyncio.gather(*(run() for _ in range(concurrency)))
+    start = time.perf_counter()
+    latencies = await bench(run, args.iterations, concurrency)
+    return time.perf_counter() - start, latencies
+
+
 async def main():
     parser = argparse.ArgumentParser(description="Simple FlowHandle.execute benchmark (baseline)")
     parser.add_argument("--iterations", type=int, default=100, help="Number of execute calls per worker")
     parser.add_argument("--concurrency", type=int, default=4, help="Number of concurrent workers")
+    parser.add_argument(
+        "--warmup", type=int, default=10, help="Untimed rounds of calls per worker before measuring (default: 10)"
+    )
+    parser.add_argument(
+        "--many",
+        action="store_true",
+        help="Send each worker's iterations as one execute_many call of distinct requests",
+    )
+    parser.add_argument(
+        "--prepared",
+        action="store_true",
+        help="Prepare the request once and time PreparedFlow.execute instead of FlowHandle.execute",
+    )
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        help=f"Ignore --concurrency and run once per level in {SWEEP_LEVELS}, printing a table",
+    )
     args = parser.parse_args()
+    if args.many and args.prepared:
+        parser.error("--prepared cannot be combined with --many")
 
     ds = create_seeded_datasource()
     flow = create_flow_handle(ds)
+    print("Query: single-table flat query (no joins, no multi-grain)")
+
+    if args.sweep:
+        # More workers only help until the engine saturates; past that knee, latency
+        # grows while throughput stays flat or drops.
+        if args.many:
+            print(f"{'workers':>7} {'rps':>9} {'batch ms':>9}")
+        else:
+            print(f"{'workers':>7} {'rps':>9} {'p50 ms':>8} {'p95 ms':>8}")
+        best = (0.0, 0)
+        for concurrency in SWEEP_LEVELS:
+            elapsed, latencies = await run_level(flow, args, concurrency)
+            rps = args.iterations * concurrency / elapsed
+            if args.many:
+                print(f"{concurrency:>7} {rps:>9.1f} {statistics.fmean(latencies) / 1e6:>9.2f}")
+            else:
+                p50, p95, _, _ = summarize(latencies)
+                print(f"{concurrency:>7} {rps:>9.1f} {p50:>8.2f} {p95:>8.2f}")
+            best = max(best, (rps, concurrency))
+        print(f"Peak throughput at {best[1]} workers ({best[0]:.1f} rps)")
+        return
 
     total_requests = args.iterations * args.concurrency
     print(f"Running {total_requests} execute calls (concurrency={args.concurrency})...")
-    print("Query: single-table flat query (no joins, no multi-grain)")
-    start = time.perf_counter()
-    latencies = await bench(flow, REQUEST, args.iterations, args.concurrency)
-    elapsed = time.perf_counter() - start
-
-    p50 = percentile(latencies, 0.5)
-    p95 = percentile(latencies, 0.95)
+    elapsed, latencies = await run_level(flow, args, args.concurrency)
     print(f"Total time: {elapsed:.3f}s; avg rps: {total_requests / elapsed:.1f}")
-    print(f"Latency ms: p50={p50:.2f} p95={p95:.2f} min={min(latencies):.2f} max={max(latencies):.2f}")
+    if args.many:
+        # No per-call samples exist in a batch; report whole batches and their amortized cost.
+        mean = statistics.fmean(latencies) / 1e6
+        print(
+            f"Batch ms ({args.iterations} requests each): mean={mean:.2f} "
+            f"min={min(latencies) / 1e6:.2f} max={max(latencies) / 1e6:.2f}; "
+            f"per request={mean / args.iterations:.3f}"
+        )
+        return
+    p50, p95, lo, hi = summarize(latencies)
+    print(f"Latency ms: p50={p50:.2f} p95={p95:.2f} min={lo:.2f} max={hi:.2f}")
 
 
 if __name__ == "__main__":
@@ -2,11 +2,15 @@
 Tests for FastAPI integration.
 """
 
+import json as jsonlib
+from typing import Any, Dict, List, Tuple
+
 import pytest
 from httpx import ASGITransport, AsyncClient
 
 from semaflow import FlowHandle
 from semaflow.api import create_app, create_router
+from semaflow.cache import TTLCache
 
 
 @pytest.fixture
@@ -37,6 +41,67 @@ async def joined_client(joined_app):
         yield ac
 
 
+class _DirectResponse:
+    """The parts of an httpx response the query tests read."""
+
+    def __init__(self, status_code: int, headers: List[Tuple[bytes, bytes]], content: bytes):
+        self.status_code = status_code
+        self.headers = {k.decode(): v.decode() for k, v in headers}
+        self.content = content
+
+    def json(self) -> Any:
+        return jsonlib.loads(self.content)
+
+
+class _DirectClient:
+    """Post JSON straight to an ASGI app, without httpx's transport and HTTP framing."""
+
+    def __init__(self, app):
+        self._app = app
+
+    async def post(self, path: str, json: Dict[str, Any]) -> _DirectResponse:
+        body = jsonlib.dumps(json).encode()
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "POST",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [
+                (b"host", b"test"),
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+            "client": ("test", 0),
+            "server": ("test", 80),
+        }
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+        start: Dict[str, Any] = {}
+        chunks: List[bytes] = []
+
+        async def receive():
+            return messages.pop() if messages else {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self._app(scope, receive, send)
+        return _DirectResponse(start["status"], start.get("headers", []), b"".join(chunks))
+
+
+@pytest.fixture
+def direct_client(app) -> _DirectClient:
+    """Call the app's ASGI callable directly; for tests that only post JSON."""
+    return _DirectClient(app)
+
+
 class TestListFlowsEndpoint:
     """Tests for GET /flows endpoint."""
 
@@ -91,9 +156,9 @@ class TestQueryEndpoint:
     """Tests for POST /flows/{flow}/query endpoint."""
 
     @pytest.mark.asyncio
-    async def test_basic_query_returns_rows(self, client: AsyncClient):
+    async def test_basic_query_returns_rows(self, direct_client: _DirectClient):
         """POST /flows/{flow}/query returns query results."""
-        response = await client.post(
+        response = await direct_client.post(
             "/flows/simple_orders/query",
             json={
                 "dimensions": ["o.status"],
@@ -106,9 +171,30 @@ class TestQueryEndpoint:
         assert len(data["rows"]) > 0
 
     @pytest.mark.asyncio
-    async def test_query_with_filters(self, client: AsyncClient):
-        """Query endpoint respects filters."""
+    async def test_arrow_stream_response_matches_json(self, client: AsyncClient):
+        """Arrow IPC responses carry the same rows as the JSON response."""
+        import pyarrow as pa
+
+        body = {"dimensions": ["o.status"], "measures": ["o.order_total"]}
+        json_rows = (await client.post("/flows/simple_orders/query", json=body)).json()["rows"]
         response = await client.post(
+            "/flows/simple_orders/query",
+            json=body,
+            headers={"Accept": "application/vnd.apache.arrow.stream"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+        table = pa.ipc.open_stream(response.content).read_all()
+        assert sorted(table.column_names) == ["o.order_total", "o.status"]
+        assert table.num_rows == len(json_rows)
+
+        by_param = await client.post("/flows/simple_orders/query?format=arrow", json=body)
+        assert by_param.content == response.content
+
+    @pytest.mark.asyncio
+    async def test_query_with_filters(self, direct_client: _DirectClient):
+        """Query endpoint respects filters."""
+        response = await direct_client.post(
             "/flows/simple_orders/query",
             json={
                 "dimensions": ["o.status"],
@@ -122,9 +208,22 @@ class TestQueryEndpoint:
         assert data["rows"][0]["o.status"] == "complete"
 
     @pytest.mark.asyncio
-    async def test_query_with_order(self, client: AsyncClient):
+    async def test_malformed_filter_rejected(self, direct_client: _DirectClient):
+        """Filters with unknown keys or non-JSON-scalar values fail validation."""
+        for bad_filter in (
+            {"field": "o.status", "op": "==", "value": "complete", "extra": 1},
+            {"field": "o.status", "op": "==", "value": {"nested": "complete"}},
+        ):
+            response = await direct_client.post(
+                "/flows/simple_orders/query",
+                json={"measures": ["o.order_total"], "filters": [bad_filter]},
+            )
+            assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_query_with_order(self, direct_client: _DirectClient):
         """Query endpoint respects ordering."""
-        response = await client.post(
+        response = await direct_client.post(
             "/flows/simple_orders/query",
             json={
                 "dimensions": ["o.status"],
@@ -138,9 +237,9 @@ class TestQueryEndpoint:
         assert totals == sorted(totals, reverse=True)
 
     @pytest.mark.asyncio
-    async def test_query_with_limit(self, client: AsyncClient):
+    async def test_query_with_limit(self, direct_client: _DirectClient):
         """Query endpoint respects limit."""
-        response = await client.post(
+        response = await direct_client.post(
             "/flows/simple_orders/query",
             json={
                 "dimensions": ["o.status"],
@@ -153,9 +252,9 @@ class TestQueryEndpoint:
         assert len(data["rows"]) == 1
 
     @pytest.mark.asyncio
-    async def test_unknown_flow_returns_error(self, client: AsyncClient):
+    async def test_unknown_flow_returns_error(self, direct_client: _DirectClient):
         """Query endpoint returns error for unknown flow."""
-        response = await client.post(
+        response = await direct_client.post(
             "/flows/nonexistent/query",
             json={"dimensions": ["status"], "measures": ["total"]},
         )
@@ -167,9 +266,9 @@ class TestQueryPagination:
     """Tests for paginated query execution via API."""
 
     @pytest.mark.asyncio
-    async def test_pagination_returns_metadata(self, client: AsyncClient):
+    async def test_pagination_returns_metadata(self, direct_client: _DirectClient):
         """Query with page_size returns pagination metadata."""
-        response = await client.post(
+        response = await direct_client.post(
             "/flows/simple_orders/query",
             json={
                 "dimensions": ["o.status"],
@@ -184,10 +283,10 @@ class TestQueryPagination:
         assert "has_more" in data
 
     @pytest.mark.asyncio
-    async def test_cursor_fetches_next_page(self, client: AsyncClient):
+    async def test_cursor_fetches_next_page(self, direct_client: _DirectClient):
         """Cursor from first page can fetch next page."""
         # First page
-        response1 = await client.post(
+        response1 = await direct_client.post(
             "/flows/simple_orders/query",
             json={
                 "dimensions": ["o.status"],
@@ -200,7 +299,7 @@ class TestQueryPagination:
         cursor = data1["cursor"]
 
         # Second page
-        response2 = await client.post(
+        response2 = await direct_client.post(
             "/flows/simple_orders/query",
             json={
                 "dimensions": ["o.status"],
@@ -244,3 +343,20 @@ class TestCreateRouter:
         from fastapi import APIRouter
         router = create_router(simple_flow_handle)
         assert isinstance(router, APIRouter)
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_served_from_result_cache(self, simple_flow_handle: FlowHandle):
+        """Identical query payloads are answered from the result cache."""
+        from fastapi import FastAPI
+
+        cache = TTLCache(maxsize=8, ttl=60)
+        app = FastAPI()
+        app.include_router(create_router(simple_flow_handle, result_cache=cache))
+        payload = {"measures": ["o.order_total"], "dimensions": ["o.status"]}
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            first = await ac.post("/flows/simple_orders/query", json=payload)
+            second = await ac.post(
+                "/flows/simple_orders/query", json=dict(reversed(list(payload.items())))
+            )
+        assert first.json() == second.json()
+        assert len(cache) == 1
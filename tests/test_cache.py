@@ -0,0 +1,44 @@
+"""
+Tests for the API result cache.
+"""
+
+import pytest
+
+from semaflow.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache expiry and eviction."""
+
+    def test_returns_stored_value(self):
+        """get() returns the value stored with set()."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self):
+        """Inserting past maxsize evicts the least recently used entry."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert len(cache) == 2
+
+    def test_expires_entries(self, monkeypatch: pytest.MonkeyPatch):
+        """Entries are dropped once their TTL has elapsed."""
+        now = [100.0]
+        monkeypatch.setattr("semaflow.cache.time.monotonic", lambda: now[0])
+        cache = TTLCache(maxsize=2, ttl=5)
+        cache.set("a", 1)
+        now[0] += 5
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_from_env_disabled_with_zero_ttl(self, monkeypatch: pytest.MonkeyPatch):
+        """SEMAFLOW_CACHE_TTL=0 disables the cache."""
+        monkeypatch.setenv("SEMAFLOW_CACHE_TTL", "0")
+        assert TTLCache.from_env() is None
@@ -2,11 +2,17 @@
 Tests for FlowHandle functionality.
 """
 
+import asyncio
+import json
+import threading
 from pathlib import Path
 
 import pytest
 
 from semaflow import DataSource, FlowHandle
+from semaflow import handle as handle_module
+from semaflow.cache import TTLCache
+from semaflow.handle import RequestKey
 
 
 class TestFlowHandleFromParts:
@@ -26,6 +32,26 @@ class TestFlowHandleFromParts:
         flow_names = [f["name"] for f in flows]
         assert "simple_orders" in flow_names
 
+    def test_from_shared_builds_once_per_name(self, simple_flow_handle: FlowHandle):
+        """from_shared() calls the builder once and returns the same handle after."""
+        calls = []
+
+        def builder() -> FlowHandle:
+            calls.append(1)
+            return simple_flow_handle
+
+        assert FlowHandle.from_shared("test_shared", builder) is simple_flow_handle
+        assert FlowHandle.from_shared("test_shared", builder) is simple_flow_handle
+        assert len(calls) == 1
+
+    def test_from_shared_builder_may_share_other_names(self, simple_flow_handle: FlowHandle):
+        """A builder can call from_shared() for another name without deadlocking."""
+
+        def outer() -> FlowHandle:
+            return FlowHandle.from_shared("test_shared_inner", lambda: simple_flow_handle)
+
+        assert FlowHandle.from_shared("test_shared_outer", outer) is simple_flow_handle
+
 
 class TestFlowHandleFromDir:
     """Tests for FlowHandle.from_dir() initialization."""
@@ -56,6 +82,13 @@ class TestFlowHandleGetFlow:
         assert "o.status" in dim_names
         assert "o.order_total" in measure_names
 
+    def test_returns_cached_read_only_schema(self, simple_flow_handle: FlowHandle):
+        """get_flow() returns the same read-only object on repeated calls."""
+        schema = simple_flow_handle.get_flow("simple_orders")
+        assert simple_flow_handle.get_flow("simple_orders") is schema
+        with pytest.raises(TypeError):
+            schema["name"] = "changed"
+
     def test_raises_for_unknown_flow(self, simple_flow_handle: FlowHandle):
         """get_flow() raises error for unknown flow name."""
         with pytest.raises(Exception):
@@ -89,6 +122,58 @@ class TestFlowHandleBuildSql:
         assert "status" in sql.lower()
         assert "amount" in sql.lower() or "order_total" in sql.lower()
 
+    @pytest.mark.asyncio
+    async def test_warmup_populates_sql_cache(self, simple_flow_handle: FlowHandle):
+        """warmup() caches the plan and SQL so execute() and build_sql() skip compiling."""
+        request = {
+            "flow": "simple_orders",
+            "dimensions": ["o.status"],
+            "measures": ["o.order_total"],
+        }
+        await simple_flow_handle.warmup([request])
+        assert len(simple_flow_handle._plan_cache) == 1
+        assert len(simple_flow_handle._sql_cache) == 1
+        assert await simple_flow_handle.build_sql(request) in simple_flow_handle._sql_cache.values()
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_reuses_cached_sql(self, simple_flow_handle: FlowHandle):
+        """build_sql() returns cached SQL for requests with the same shape."""
+        request = {
+            "flow": "simple_orders",
+            "dimensions": ["o.status"],
+            "measures": ["o.order_total"],
+        }
+        first = await simple_flow_handle.build_sql(request)
+        second = await simple_flow_handle.build_sql(dict(reversed(list(request.items()))))
+        assert first == second
+        assert len(simple_flow_handle._sql_cache) == 1
+
+
+class TestRequestKey:
+    """Tests for the RequestKey cache signature."""
+
+    def test_ignores_dict_key_order(self):
+        """Requests differing only in key order share a key."""
+        a = {"flow": "f", "measures": ["m"], "filters": [{"field": "x", "op": "==", "value": 1}]}
+        b = {"filters": [{"value": 1, "op": "==", "field": "x"}], "measures": ["m"], "flow": "f"}
+        assert RequestKey.from_dict(a) == RequestKey.from_dict(b)
+
+    def test_distinguishes_value_types(self):
+        """Equal-hashing values of different types produce different keys."""
+        a = {"flow": "f", "filters": [{"field": "x", "op": "==", "value": 1}]}
+        b = {"flow": "f", "filters": [{"field": "x", "op": "==", "value": True}]}
+        assert RequestKey.from_dict(a) != RequestKey.from_dict(b)
+
+
+class TestInnerHandleRequests:
+    """Tests for request forms accepted by the Rust handle."""
+
+    def test_accepts_json_bytes(self, simple_flow_handle: FlowHandle):
+        """The Rust handle parses a JSON-encoded bytes request like the dict form."""
+        request = {"flow": "simple_orders", "dimensions": ["o.status"], "measures": ["o.order_total"]}
+        inner = simple_flow_handle._inner
+        assert inner.build_sql(json.dumps(request).encode()) == inner.build_sql(request)
+
 
 class TestFlowHandleExecute:
     """Tests for FlowHandle.execute() query execution."""
@@ -167,6 +252,180 @@ class TestFlowHandleExecute:
         })
         assert len(result) == 1
 
+    @pytest.mark.asyncio
+    async def test_execute_arrow_matches_rows(self, simple_flow_handle: FlowHandle):
+        """execute_arrow() returns the same data as execute() as a pyarrow Table."""
+        request = {
+            "flow": "simple_orders",
+            "dimensions": ["o.status"],
+            "measures": ["o.order_total", "o.order_count"],
+            "order": [{"column": "o.status", "direction": "asc"}],
+        }
+        table = await simple_flow_handle.execute_arrow(request)
+        rows = await simple_flow_handle.execute(request)
+        assert table.column_names == ["o.status", "o.order_total", "o.order_count"]
+        assert table.to_pylist() == rows
+
+    @pytest.mark.asyncio
+    async def test_execute_with_sql_returns_sql_and_rows(self, simple_flow_handle: FlowHandle):
+        """execute_with_sql() returns the built SQL and the same rows as execute()."""
+        request = {
+            "flow": "simple_orders",
+            "dimensions": ["o.status"],
+            "measures": ["o.order_total"],
+            "order": [{"column": "o.status", "direction": "asc"}],
+        }
+        sql, rows = await simple_flow_handle.execute_with_sql(request)
+        assert sql == await simple_flow_handle.build_sql(request)
+        assert rows == await simple_flow_handle.execute(request)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_result(self, simple_flow_handle: FlowHandle):
+        """Concurrent identical execute() calls coalesce but return independent rows."""
+        request = {
+            "flow": "simple_orders",
+            "dimensions": ["o.status"],
+            "measures": ["o.order_total"],
+        }
+        first, second = await asyncio.gather(
+            simple_flow_handle.execute(request),
+            simple_flow_handle.execute(request),
+        )
+        assert first == second
+        assert first[0] is not second[0]
+        assert not simple_flow_handle._in_flight
+        assert not simple_flow_handle._compiling
+        assert len(simple_flow_handle._plan_cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_execute_reuses_compiled_plan(self, simple_flow_handle: FlowHandle):
+        """execute() compiles a request shape once and reuses it on later calls."""
+        request = {"flow": "simple_orders", "dimensions": ["o.status"], "measures": ["o.order_total"]}
+        first = await simple_flow_handle.execute(request)
+        plan = simple_flow_handle._plan_cache[RequestKey.from_dict(request)]
+        assert await simple_flow_handle.execute(request) == first
+        assert simple_flow_handle._plan_cache[RequestKey.from_dict(request)] is plan
+        assert await simple_flow_handle.build_sql(request) == plan.sql
+
+    @pytest.mark.asyncio
+    async def test_result_cache_answers_repeats(self, simple_flow_handle: FlowHandle):
+        """With a result cache, repeats skip execution and still get their own row dicts."""
+        request = {"flow": "simple_orders", "dimensions": ["o.status"], "measures": ["o.order_total"]}
+        simple_flow_handle.result_cache = TTLCache(maxsize=4, ttl=60)
+        first = await simple_flow_handle.execute(request)
+        expected = [dict(row) for row in first]
+        first[0]["o.status"] = "mutated"
+
+        simple_flow_handle._plan_cache.clear()
+        simple_flow_handle._inner = None  # any execution now fails
+        assert await simple_flow_handle.execute(dict(request)) == expected
+        assert len(simple_flow_handle.result_cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_batched_matches_execute(self, simple_flow_handle: FlowHandle):
+        """Concurrent execute_batched() calls return what execute() returns, per request."""
+        requests = [
+            {"flow": "simple_orders", "dimensions": ["o.status"], "measures": ["o.order_total"], "limit": n}
+            for n in range(1, 5)
+        ]
+        batched = await asyncio.gather(*(simple_flow_handle.execute_batched(r) for r in requests))
+        assert batched == [await simple_flow_handle.execute(r) for r in requests]
+
+    @pytest.mark.asyncio
+    async def test_execute_batched_isolates_failures(self, simple_flow_handle: FlowHandle):
+        """An invalid request in a batch fails only its own caller."""
+        good = {"flow": "simple_orders", "measures": ["o.order_total"]}
+        bad = {"flow": "simple_orders", "measures": ["o.nonexistent"]}
+        ok, failed = await asyncio.gather(
+            simple_flow_handle.execute_batched(good),
+            simple_flow_handle.execute_batched(bad),
+            return_exceptions=True,
+        )
+        assert ok == await simple_flow_handle.execute(good)
+        assert isinstance(failed, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_execute_many_shares_identical_requests(self, simple_flow_handle: FlowHandle):
+        """execute_many() returns one result per request; duplicates get their own rows."""
+        first = {"flow": "simple_orders", "dimensions": ["o.status"], "measures": ["o.order_total"]}
+        second = {"flow": "simple_orders", "measures": ["o.order_count"]}
+        results = await simple_flow_handle.execute_many([first, second, dict(first)])
+        assert results == [
+            await simple_flow_handle.execute(first),
+            await simple_flow_handle.execute(second),
+            await simple_flow_handle.execute(first),
+        ]
+        assert results[0] is not results[2]
+        with pytest.raises(ValueError):
+            await simple_flow_handle.execute_many([first, {"flow": "simple_orders", "measures": ["o.nonexistent"]}])
+
+    def test_parallel_threads_return_independent_results(self, simple_flow_handle: FlowHandle):
+        """Rust calls release the GIL; overlapping calls from threads stay correct."""
+        inner = simple_flow_handle._inner
+        requests = [
+            {"flow": "simple_orders", "dimensions": ["o.status"], "measures": ["o.order_total"], "limit": n}
+            for n in range(1, 9)
+        ]
+        expected = [inner.execute(request) for request in requests]
+        barrier = threading.Barrier(len(requests))
+        results = [None] * len(requests)
+
+        def run(i: int) -> None:
+            barrier.wait()
+            results[i] = inner.execute(requests[i])
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(len(requests))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == expected
+
+    @pytest.mark.asyncio
+    async def test_configured_executor_runs_rust_calls(
+        self, simple_flow_handle: FlowHandle, monkeypatch: pytest.MonkeyPatch
+    ):
+        """configure_executor() routes worker-thread calls through the sized pool."""
+        monkeypatch.setattr(handle_module, "_executor", None)
+        FlowHandle.configure_executor(2)
+        try:
+            assert handle_module._executor._max_workers == 2
+            thread_name = await handle_module._to_thread(lambda: threading.current_thread().name)
+            assert thread_name.startswith("semaflow")
+            rows = await simple_flow_handle.execute(
+                {"flow": "simple_orders", "dimensions": ["o.status"], "measures": ["o.order_total"]}
+            )
+            assert rows
+        finally:
+            handle_module._executor.shutdown()
+
+
+class TestFlowHandlePrepare:
+    """Tests for FlowHandle.prepare() and PreparedFlow.execute()."""
+
+    @pytest.mark.asyncio
+    async def test_rebinds_filter_values(self, simple_flow_handle: FlowHandle):
+        """PreparedFlow.execute() binds filter values by field name."""
+        prepared = simple_flow_handle.prepare({
+            "flow": "simple_orders",
+            "dimensions": ["o.status"],
+            "measures": ["o.order_total"],
+            "filters": [{"field": "o.status", "op": "==", "value": "complete"}],
+        })
+        complete = await prepared.execute()
+        pending = await prepared.execute({"o.status": "pending"})
+        assert [r["o.status"] for r in complete] == ["complete"]
+        assert [r["o.status"] for r in pending] == ["pending"]
+
+    def test_rejects_pagination(self, simple_flow_handle: FlowHandle):
+        """prepare() rejects paginated request templates."""
+        with pytest.raises(ValueError):
+            simple_flow_handle.prepare({
+                "flow": "simple_orders",
+                "measures": ["o.order_total"],
+                "page_size": 2,
+            })
+
 
 class TestFlowHandlePagination:
     """Tests for paginated query execution."""
@@ -210,6 +469,24 @@ class TestFlowHandlePagination:
         # Second page should have different data
         assert page1["rows"][0] != page2["rows"][0]
 
+    @pytest.mark.asyncio
+    async def test_walking_all_pages_matches_unpaginated(self, simple_flow_handle: FlowHandle):
+        """Following cursors to the end yields every row once, in order."""
+        request = {
+            "flow": "simple_orders",
+            "dimensions": ["o.status"],
+            "measures": ["o.order_total"],
+            "order": [{"column": "o.status", "direction": "asc"}],
+        }
+        rows, cursor = [], None
+        while True:
+            page = await simple_flow_handle.execute({**request, "page_size": 1, "cursor": cursor})
+            rows.extend(page["rows"])
+            if not page["has_more"]:
+                break
+            cursor = page["cursor"]
+        assert rows == await simple_flow_handle.execute(request)
+
 
 class TestFlowHandleJoins:
     """Tests for queries with joins."""